@@ -0,0 +1,4 @@
+from Interface.actions import render
+
+# Board reads the indexed action_items table filled when meetings are saved
+render()
@@ -1,4 +1,4 @@
-import streamlit as st
+from Interface.analytics import render
 
-st.markdown("## 📊 Analytics")
-st.info("Coming soon: Speaker stats, topic trends, and meeting frequency analysis.")
+# Totals come from the incrementally maintained analytics_buckets table
+render()
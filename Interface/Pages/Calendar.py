@@ -1,4 +1,4 @@
-import streamlit as st
+from Interface.calendar_data import render
 
-st.markdown("## 📅 Calendar Integration")
-st.info("Google Calendar, Outlook, and Zoom integrations coming soon.")
+# Month grid from per-day counts; cached until the next meeting write (any write clears every month)
+render()
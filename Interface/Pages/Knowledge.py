@@ -1,14 +1,33 @@
 import streamlit as st
-from Interface.storage import list_meetings
-import pandas as pd
+from Interface.query_cache import list_meeting_rows, meetings_frame
+from Interface.storage import page_cursor
+
+PAGE_SIZE = 50      # cards / table rows per page
+BOARD_LIMIT = 20    # newest meetings shown per board column
 
 st.markdown("## 🧠 Extracted Meeting Knowledge")
 
 view = st.radio("View format:", ["Cards", "Table", "Board"])
 
-meetings = list_meetings()
+# Keyset pagination, newest first: a stack of cursors shared by Cards and Table
+cursors = st.session_state.setdefault("knowledge_cursors", [None])
+
+
+def pager(has_next: bool, last_cursor) -> None:
+    p1, p2, p3 = st.columns([1, 1, 4])
+    if p1.button("⬅️ Previous", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    if p2.button("Next ➡️", disabled=not has_next):
+        cursors.append(last_cursor)
+        st.rerun()
+    p3.caption(f"Page {len(cursors)} · {PAGE_SIZE} per page, newest first")
+
 
 if view == "Cards":
+    # one extra row tells us whether a next page exists
+    rows = list_meeting_rows(limit=PAGE_SIZE + 1, after=cursors[-1])
+    meetings = rows[:PAGE_SIZE]
     for m in meetings:
         st.markdown(f"""
         ### 📝 {m.name}
@@ -18,20 +37,26 @@ if view == "Cards":
         - 🔖 Tags: {m.tags or '-'}
         - 🧩 Status: {m.status or 'UNUSED'}
         """)
+    if meetings:
+        pager(len(rows) > PAGE_SIZE, page_cursor(meetings[-1]))
 elif view == "Table":
-    df = pd.DataFrame([{
-        "ID": m.id,
-        "Name": m.name,
-        "Owner": m.owner,
-        "Department": m.department,
-        "Tags": m.tags,
-        "Status": m.status,
-        "Date": m.occurred_at.date().isoformat()
-    } for m in meetings])
+    rows = meetings_frame(("id", "name", "owner", "department", "tags", "status", "occurred_at"),
+                          limit=PAGE_SIZE + 1, after=cursors[-1])
+    page = rows.iloc[:PAGE_SIZE]
+    df = page.assign(occurred_at=page["occurred_at"].dt.date.astype(str)).rename(columns={
+        "id": "ID", "name": "Name", "owner": "Owner", "department": "Department",
+        "tags": "Tags", "status": "Status", "occurred_at": "Date",
+    })
     st.dataframe(df)
+    if len(page):
+        last = page.iloc[-1]
+        pager(len(rows) > PAGE_SIZE, (last["occurred_at"].to_pydatetime(), int(last["id"])))
 else:
     statuses = ["UNUSED", "SPENT", "DELAYED", "SURPLUS"]
     for s in statuses:
         st.markdown(f"### 📌 {s}")
-        for m in [x for x in meetings if (x.status or "").upper() == s]:
+        rows = list_meeting_rows(status=s, limit=BOARD_LIMIT + 1)
+        for m in rows[:BOARD_LIMIT]:
             st.markdown(f"- {m.name} | {m.owner or '-'}")
+        if len(rows) > BOARD_LIMIT:
+            st.caption(f"Newest {BOARD_LIMIT} shown.")
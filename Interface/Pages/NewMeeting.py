@@ -1,9 +1,8 @@
 import streamlit as st
 from datetime import datetime
-from Interface.asr import transcribe_stream
-from Interface.knowledge import summarize_transcript, extract_key_points, extract_action_items
-from Interface.storage import upsert_meeting, update_meeting
-import os
+from Interface.asr_cache import store_upload
+from Interface.jobs import submit_transcription, render_job_status
+from Interface.storage import upsert_meeting
 
 st.markdown("## 🎙️ Upload or Record New Meeting")
 
@@ -19,10 +18,8 @@ if st.button("Start Transcription"):
     if not audio:
         st.warning("Please upload an audio file.")
     else:
-        audio_path = os.path.join("data/audio", audio.name)
-        os.makedirs(os.path.dirname(audio_path), exist_ok=True)
-        with open(audio_path, "wb") as f:
-            f.write(audio.read())
+        # Content-addressed: re-uploading the same recording reuses its cached transcript
+        audio_path = store_upload(audio.getvalue(), audio.name)
 
         mtg = upsert_meeting(
             name=name or "Untitled",
@@ -35,16 +32,15 @@ if st.button("Start Transcription"):
             transcript_text=""
         )
 
-        transcript = ""
-        with st.spinner("Transcribing..."):
-            for chunk in transcribe_stream(audio_path, lang if lang else None):
-                transcript += chunk
-                st.text_area("Live Transcript", value=transcript, height=200)
-
-        summary = summarize_transcript(transcript)
-        actions = "\n".join(extract_action_items(transcript))
-        keys = "\n".join(extract_key_points(transcript))
-
-        update_meeting(mtg.id, transcript_text=transcript, summary=summary, key_points=keys, action_items=actions)
+        user = st.session_state.get("user") or {}
+        job = submit_transcription(
+            mtg.id,
+            audio_path,
+            language=lang or None,
+            submitted_by=user.get("username"),
+        )
+        st.session_state["new_meeting_job_id"] = job.id
+        st.success(f"✅ Queued as job #{job.id}. The transcript will be saved to meeting #{mtg.id}.")
 
-        st.success("✅ Transcription saved.")
+if "new_meeting_job_id" in st.session_state:
+    render_job_status(st.session_state["new_meeting_job_id"])
@@ -0,0 +1,324 @@
+# Interface/actions.py
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import streamlit as st
+from sqlalchemy import bindparam, Date, DateTime, Float, ForeignKey, Index, String, Text, delete, func, select, update
+from sqlalchemy.orm import Mapped, mapped_column, Session
+
+from Interface.db import register_schema
+from Interface.segments import MeetingSegment
+from Interface.storage import Base, Meeting, engine, write_engine
+
+
+OPEN, IN_PROGRESS, DONE = "OPEN", "IN_PROGRESS", "DONE"
+STATUSES = (OPEN, IN_PROGRESS, DONE)
+
+
+# ---------- Model ----------
+class ActionItem(Base):
+    """One line of a meeting's action_items, with what could be parsed out of it."""
+    __tablename__ = "action_items"
+    __table_args__ = (
+        Index("ix_action_items_owner_status", "owner", "status"),
+        Index("ix_action_items_status_due", "status", "due"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id", ondelete="CASCADE"), index=True)
+    seq: Mapped[int] = mapped_column()
+    text: Mapped[str] = mapped_column(Text)
+    owner: Mapped[Optional[str]] = mapped_column(String(120))
+    due: Mapped[Optional[date]] = mapped_column(Date)
+    status: Mapped[str] = mapped_column(String(20), default=OPEN)
+    source_start: Mapped[Optional[float]] = mapped_column(Float)  # audio offset (s) where it was said
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+
+# ---------- Parsing ----------
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+# Capitalized sentence starters that are not people ("We will send...")
+_NOT_OWNERS = (
+    "i", "we", "you", "he", "she", "they", "it", "someone", "somebody", "everyone", "everybody",
+    "anyone", "nobody", "all", "each", "the", "this", "that", "these", "those", "a", "an", "our",
+    "your", "their", "team", "let", "lets", "let's",
+)
+_OWNER_RE = re.compile(
+    r"@(?P<handle>[\w.-]+)"
+    r"|^\s*(?:(?i:owner)\s*[:=-]\s*)(?P<tagged>[\w.-]+)"
+    r"|^\s*(?!(?i:" + "|".join(map(re.escape, _NOT_OWNERS)) + r")\b)"
+    r"(?P<name>[A-Z][\w.-]+)\s+(?:will|to|should|must|needs? to)\b"
+)
+_DUE_RE = re.compile(
+    r"\b(?:by|due|before|until|deadline(?:\s+is)?[:\s])\s*(?:on\s+|next\s+)?"
+    r"(?P<when>\d{4}-\d{2}-\d{2}|today|tomorrow|end of (?:the )?week|next week|" + "|".join(_WEEKDAYS) + r")\b",
+    re.IGNORECASE,
+)
+
+
+def parse_owner(item: str) -> Optional[str]:
+    m = _OWNER_RE.search(item)
+    if not m:
+        return None
+    return m.group("handle") or m.group("tagged") or m.group("name")
+
+
+def parse_due(item: str, said_on: Optional[datetime]) -> Optional[date]:
+    """Due date from "by Friday", "due 2024-05-01", "by tomorrow"... relative to the meeting day."""
+    m = _DUE_RE.search(item)
+    if not m:
+        return None
+    when = m.group("when").lower()
+    if when[:4].isdigit():
+        try:
+            return date.fromisoformat(when)
+        except ValueError:
+            return None
+    base = (said_on or datetime.now()).date()
+    if when == "today":
+        return base
+    if when == "tomorrow":
+        return base + timedelta(days=1)
+    if when == "next week":
+        return base + timedelta(days=7 - base.weekday())
+    if when.startswith("end of"):
+        return base + timedelta(days=4 - base.weekday() if base.weekday() <= 4 else 6 - base.weekday())
+    ahead = (_WEEKDAYS.index(when) - base.weekday()) % 7
+    return base + timedelta(days=ahead or 7)
+
+
+def split_items(action_items: Optional[str]) -> List[str]:
+    """Stored action_items text is one item per line (see analytics.count_actions)."""
+    return [line.strip() for line in (action_items or "").splitlines() if line.strip()]
+
+
+def _source_start(s: Session, meeting_id: int, item: str) -> Optional[float]:
+    # first segment containing the item's opening words
+    probe = " ".join(item.split()[:3])
+    if not probe:
+        return None
+    return s.execute(
+        select(MeetingSegment.start)
+        .where(MeetingSegment.meeting_id == meeting_id,
+               MeetingSegment.text.contains(probe, autoescape=True))
+        .order_by(MeetingSegment.start)
+        .limit(1)
+    ).scalar()
+
+
+# ---------- Write (inside storage's transactions) ----------
+def save_action_items(s: Session, m: Meeting) -> None:
+    """
+    Replace the meeting's items with the lines of m.action_items. Items whose
+    text is unchanged keep their status. Owner falls back to the meeting owner.
+    """
+    kept = {
+        text: (status, updated)
+        for text, status, updated in s.execute(
+            select(ActionItem.text, ActionItem.status, ActionItem.updated_at)
+            .where(ActionItem.meeting_id == m.id)
+        )
+    }
+    s.execute(delete(ActionItem).where(ActionItem.meeting_id == m.id))
+    now = datetime.now()
+    for seq, item in enumerate(split_items(m.action_items)):
+        status, updated = kept.get(item, (OPEN, now))
+        s.add(ActionItem(
+            meeting_id=m.id,
+            seq=seq,
+            text=item,
+            owner=parse_owner(item) or m.owner,
+            due=parse_due(item, m.occurred_at),
+            status=status,
+            source_start=_source_start(s, m.id, item),
+            created_at=now,
+            updated_at=updated,
+        ))
+    s.flush()
+
+
+def save_new_action_items(s: Session, rows: Sequence[dict]) -> None:
+    """Bulk variant for freshly inserted meetings (field dicts with "id")."""
+    now = datetime.now()
+    items = [
+        dict(meeting_id=r["id"], seq=seq, text=item, owner=parse_owner(item) or r.get("owner"),
+             due=parse_due(item, r.get("occurred_at")), status=OPEN, source_start=None,
+             created_at=now, updated_at=now)
+        for r in rows
+        for seq, item in enumerate(split_items(r.get("action_items")))
+    ]
+    if items:
+        s.execute(ActionItem.__table__.insert(), items)
+
+
+def count_open(s: Session, meeting_ids: Optional[Iterable[int]] = None) -> Dict[int, int]:
+    """Items not DONE, per meeting."""
+    stmt = (
+        select(ActionItem.meeting_id, func.count())
+        .where(ActionItem.status != DONE)
+        .group_by(ActionItem.meeting_id)
+    )
+    if meeting_ids is not None:
+        stmt = stmt.where(ActionItem.meeting_id.in_(list(meeting_ids)))
+    return dict(s.execute(stmt).all())
+
+
+def _reparse_items(s: Session) -> None:
+    """Re-derive owner and due of stored items after a parser change."""
+    last = 0
+    while True:
+        rows = s.execute(
+            select(ActionItem.id, ActionItem.text, ActionItem.owner, ActionItem.due,
+                   Meeting.owner, Meeting.occurred_at)
+            .join(Meeting, Meeting.id == ActionItem.meeting_id)
+            .where(ActionItem.id > last).order_by(ActionItem.id).limit(1000)
+        ).all()
+        if not rows:
+            return
+        changed = []
+        for item_id, text, owner, due, meeting_owner, said_on in rows:
+            new_owner, new_due = parse_owner(text) or meeting_owner, parse_due(text, said_on)
+            if (new_owner, new_due) != (owner, due):
+                changed.append({"item_id": item_id, "owner": new_owner, "due": new_due})
+        if changed:
+            t = ActionItem.__table__
+            s.execute(
+                update(t).where(t.c.id == bindparam("item_id")).values(owner=bindparam("owner"), due=bindparam("due")),
+                changed,
+            )
+        last = rows[-1][0]
+
+
+def _init_schema(con) -> None:
+    Base.metadata.create_all(con, tables=[ActionItem.__table__])
+    # fill from meetings saved before the table existed
+    with Session(con) as s:
+        if s.execute(select(func.count()).select_from(ActionItem)).scalar_one():
+            _reparse_items(s)  # version 2: case-insensitive "owner:", pronoun stoplist
+            s.flush()
+            return
+        last = 0
+        while True:
+            batch = s.execute(
+                select(Meeting).where(Meeting.id > last).order_by(Meeting.id).limit(500)
+            ).scalars().all()
+            if not batch:
+                break
+            save_new_action_items(s, [
+                {"id": m.id, "owner": m.owner, "occurred_at": m.occurred_at, "action_items": m.action_items}
+                for m in batch
+            ])
+            last = batch[-1].id
+            s.expunge_all()
+
+
+register_schema(engine, "actions", 2, _init_schema)
+
+
+# ---------- Read API ----------
+def list_actions(
+    owner: Optional[str] = None,
+    status: Optional[str] = None,
+    due_before: Optional[date] = None,
+    meeting_id: Optional[int] = None,
+    limit: Optional[int] = 200,
+) -> List[dict]:
+    """Action items joined with their meeting name, soonest due first (undated last)."""
+    stmt = select(
+        ActionItem.id, ActionItem.meeting_id, Meeting.name, ActionItem.text, ActionItem.owner,
+        ActionItem.due, ActionItem.status, ActionItem.source_start,
+    ).join(Meeting, Meeting.id == ActionItem.meeting_id)
+    if owner:
+        stmt = stmt.where(ActionItem.owner == owner)
+    if status:
+        stmt = stmt.where(ActionItem.status == status.upper())
+    if due_before:
+        stmt = stmt.where(ActionItem.due < due_before)
+    if meeting_id is not None:
+        stmt = stmt.where(ActionItem.meeting_id == meeting_id)
+    stmt = stmt.order_by(ActionItem.due.is_(None), ActionItem.due, ActionItem.id)
+    if limit:
+        stmt = stmt.limit(limit)
+    keys = ("id", "meeting_id", "meeting", "text", "owner", "due", "status", "source_start")
+    with Session(engine) as s:
+        return [dict(zip(keys, r)) for r in s.execute(stmt).all()]
+
+
+def open_actions(owner: Optional[str] = None, limit: Optional[int] = 200) -> List[dict]:
+    """Items not done yet (OPEN or IN_PROGRESS), optionally for one owner."""
+    return [a for status in (OPEN, IN_PROGRESS) for a in list_actions(owner=owner, status=status, limit=limit)]
+
+
+def overdue(today: Optional[date] = None, owner: Optional[str] = None, limit: Optional[int] = 200) -> List[dict]:
+    """Not-done items whose due date has passed."""
+    today = today or date.today()
+    return [
+        a
+        for status in (OPEN, IN_PROGRESS)
+        for a in list_actions(owner=owner, status=status, due_before=today, limit=limit)
+    ]
+
+
+def owners() -> List[str]:
+    with Session(engine) as s:
+        return list(s.execute(
+            select(ActionItem.owner).where(ActionItem.owner.is_not(None)).distinct().order_by(ActionItem.owner)
+        ).scalars())
+
+
+def set_status(action_id: int, status: str) -> None:
+    from Interface.analytics import refresh_open_actions
+
+    status = status.upper()
+    if status not in STATUSES:
+        raise ValueError(f"status must be one of {STATUSES}")
+    with Session(write_engine) as s:
+        meeting_id = s.execute(
+            update(ActionItem)
+            .where(ActionItem.id == action_id)
+            .values(status=status, updated_at=datetime.now())
+            .returning(ActionItem.meeting_id)
+        ).scalar()
+        if meeting_id is None:
+            raise ValueError(f"Action item {action_id} not found")
+        refresh_open_actions(s, meeting_id)
+        s.commit()
+
+
+# ---------- Streamlit Page ----------
+def render():
+    from Interface.segments import format_offset
+
+    st.header("✅ Action Items")
+
+    c1, c2 = st.columns(2)
+    owner = c1.selectbox("Owner", [""] + owners(), format_func=lambda o: o or "Everyone")
+    only_overdue = c2.toggle("Overdue only")
+
+    today = date.today()
+    columns = st.columns(len(STATUSES))
+    for col, status in zip(columns, STATUSES):
+        items = list_actions(owner=owner or None, status=status,
+                             due_before=today if only_overdue else None, limit=100)
+        col.subheader(f"{status.replace('_', ' ').title()} ({len(items)})")
+        for a in items:
+            with col.container(border=True):
+                due = a["due"]
+                late = due is not None and due < today and status != DONE
+                st.markdown(f"{a['text']}")
+                at = f" · ⏱ {format_offset(a['source_start'])}" if a["source_start"] is not None else ""
+                st.caption(
+                    f"#{a['meeting_id']} {a['meeting']} · 👤 {a['owner'] or '-'}"
+                    + (f" · {'🔴' if late else '📅'} {due:%Y-%m-%d}" if due else "")
+                    + at
+                )
+                for target in STATUSES:
+                    if target != status and st.button(
+                        f"→ {target.replace('_', ' ').title()}", key=f"act_{a['id']}_{target}"
+                    ):
+                        set_status(a["id"], target)
+                        st.rerun()
@@ -0,0 +1,300 @@
+# Interface/analytics.py
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import streamlit as st
+from sqlalchemy import Float, Integer, String, delete, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, mapped_column, selectinload, Session
+
+from Interface.actions import count_open
+from Interface.db import register_schema
+from Interface.segments import MeetingSegment
+from Interface.storage import Base, Meeting, engine, write_engine
+
+
+# Dimensions the summary can be grouped by (columns of AnalyticsBucket)
+DIMENSIONS = ("department", "status", "owner", "week")
+MEASURES = ("meetings", "audio_minutes", "words", "open_actions")
+NONE_KEY = ""  # stored for missing department/owner/status so the key stays usable
+
+
+# ---------- Models ----------
+class MeetingFact(Base):
+    """One meeting's contribution to the buckets (so an update can subtract it)."""
+    __tablename__ = "analytics_meeting_facts"
+
+    meeting_id: Mapped[int] = mapped_column(primary_key=True)
+    department: Mapped[str] = mapped_column(String(120))
+    status: Mapped[str] = mapped_column(String(50))
+    owner: Mapped[str] = mapped_column(String(120))
+    week: Mapped[str] = mapped_column(String(10))  # Monday of the week, ISO date
+    audio_minutes: Mapped[float] = mapped_column(Float, default=0.0)
+    words: Mapped[int] = mapped_column(Integer, default=0)
+    open_actions: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class AnalyticsBucket(Base):
+    """Totals per (department, status, owner, week); a few rows per week, not per meeting."""
+    __tablename__ = "analytics_buckets"
+
+    department: Mapped[str] = mapped_column(String(120), primary_key=True)
+    status: Mapped[str] = mapped_column(String(50), primary_key=True)
+    owner: Mapped[str] = mapped_column(String(120), primary_key=True)
+    week: Mapped[str] = mapped_column(String(10), primary_key=True, index=True)
+    meetings: Mapped[int] = mapped_column(Integer, default=0)
+    audio_minutes: Mapped[float] = mapped_column(Float, default=0.0)
+    words: Mapped[int] = mapped_column(Integer, default=0)
+    open_actions: Mapped[int] = mapped_column(Integer, default=0)
+
+
+# ---------- Facts ----------
+def week_of(occurred_at: Optional[datetime]) -> str:
+    if occurred_at is None:
+        return NONE_KEY
+    d = occurred_at.date()
+    return (d - timedelta(days=d.weekday())).isoformat()
+
+
+def count_actions(action_items: Optional[str]) -> int:
+    """Action items are stored one per line; a new meeting's items all start open."""
+    return sum(1 for line in (action_items or "").splitlines() if line.strip())
+
+
+def _fact(
+    meeting_id: int,
+    fields: dict,
+    audio_minutes: Optional[float] = None,
+    previous: Optional[dict] = None,
+    open_actions: Optional[int] = None,
+) -> dict:
+    """
+    Fact row from meeting fields. Text-derived measures (and audio minutes)
+    are recomputed only when given, otherwise taken from `previous`.
+    `open_actions` is the action_items table's count (statuses included).
+    """
+    prev = previous or {}
+    text = fields.get("transcript_text")
+    actions = fields.get("action_items")
+    return {
+        "meeting_id": meeting_id,
+        "department": fields.get("department") or NONE_KEY,
+        "status": (fields.get("status") or NONE_KEY).upper(),
+        "owner": fields.get("owner") or NONE_KEY,
+        "week": week_of(fields.get("occurred_at")),
+        "audio_minutes": audio_minutes if audio_minutes is not None else prev.get("audio_minutes", 0.0),
+        "words": len(text.split()) if text is not None else prev.get("words", 0),
+        "open_actions": (
+            open_actions if open_actions is not None
+            else count_actions(actions) if actions is not None
+            else prev.get("open_actions", 0)
+        ),
+    }
+
+
+def _apply(s: Session, new: List[dict], old: Iterable[dict] = ()) -> None:
+    """Move facts from `old` to `new`: one upsert per touched bucket."""
+    deltas: Dict[tuple, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(MEASURES, 0))
+    for sign, facts in ((-1, old), (1, new)):
+        for f in facts:
+            d = deltas[tuple(f[k] for k in ("department", "status", "owner", "week"))]
+            d["meetings"] += sign
+            for k in MEASURES[1:]:
+                d[k] += sign * f[k]
+
+    rows = [
+        dict(zip(("department", "status", "owner", "week"), key), **d)
+        for key, d in deltas.items()
+        if any(d.values())
+    ]
+    if rows:
+        stmt = sqlite_insert(AnalyticsBucket)
+        s.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["department", "status", "owner", "week"],
+                set_={k: getattr(AnalyticsBucket, k) + getattr(stmt.excluded, k) for k in MEASURES},
+            ),
+            rows,
+        )
+        s.execute(delete(AnalyticsBucket).where(AnalyticsBucket.meetings <= 0))
+
+    if new:
+        stmt = sqlite_insert(MeetingFact)
+        s.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["meeting_id"],
+                set_={c.name: getattr(stmt.excluded, c.name)
+                      for c in MeetingFact.__table__.columns if c.name != "meeting_id"},
+            ),
+            new,
+        )
+
+
+def _audio_minutes(s: Session, meeting_id: int) -> float:
+    end = s.execute(
+        select(func.max(MeetingSegment.end)).where(MeetingSegment.meeting_id == meeting_id)
+    ).scalar()
+    return (end or 0.0) / 60.0
+
+
+def record_meeting(s: Session, m: Meeting, changed: Optional[Iterable[str]] = None) -> None:
+    """
+    Update the aggregates for one meeting inside the caller's transaction
+    (called by storage.upsert_meeting / update_meeting). `changed` names the
+    fields that were written; the transcript is only re-read if it changed.
+    """
+    row = s.get(MeetingFact, m.id)
+    prev = {c.name: getattr(row, c.name) for c in MeetingFact.__table__.columns} if row else None
+    changed = set(changed) if changed is not None else None
+
+    fields = {k: getattr(m, k) for k in ("department", "status", "owner", "occurred_at")}
+    for k in ("transcript_text", "action_items"):
+        if prev is None or changed is None or k in changed:
+            fields[k] = getattr(m, k) or ""
+    audio = _audio_minutes(s, m.id) if prev is None or changed is None or "transcript_text" in changed else None
+    # storage has already written this meeting's action_items rows
+    n_open = count_open(s, [m.id]).get(m.id, 0) if "action_items" in fields else None
+
+    if row is not None:
+        s.expunge(row)  # the upsert below replaces it
+    _apply(s, [_fact(m.id, fields, audio, prev, n_open)], [prev] if prev else [])
+
+
+def refresh_open_actions(s: Session, meeting_id: int) -> None:
+    """Re-count a meeting's open items after a status change (actions.set_status)."""
+    row = s.get(MeetingFact, meeting_id)
+    if row is None:
+        return
+    prev = {c.name: getattr(row, c.name) for c in MeetingFact.__table__.columns}
+    s.expunge(row)
+    new = dict(prev, open_actions=count_open(s, [meeting_id]).get(meeting_id, 0))
+    if new != prev:
+        _apply(s, [new], [prev])
+
+
+def record_new_meetings(s: Session, rows: List[dict]) -> None:
+    """
+    Bulk variant for freshly inserted meetings: `rows` are field dicts with an
+    "id", holding the values as stored (column defaults already applied).
+    """
+    _apply(s, [_fact(r["id"], r) for r in rows])
+
+
+def rebuild(batch_size: int = 500, con=None) -> int:
+    """
+    Recompute every fact and bucket from the meetings table. Returns meetings
+    counted. Runs in its own transaction unless a connection `con` is given.
+    """
+    with Session(con if con is not None else write_engine) as s:
+        s.execute(delete(AnalyticsBucket))
+        s.execute(delete(MeetingFact))
+        minutes = dict(s.execute(
+            select(MeetingSegment.meeting_id, func.max(MeetingSegment.end))
+            .group_by(MeetingSegment.meeting_id)
+        ).all())
+        n_open = count_open(s)
+        n, last = 0, 0
+        while True:
+            batch = s.execute(
+                select(Meeting).options(selectinload(Meeting.body))
+                .where(Meeting.id > last).order_by(Meeting.id).limit(batch_size)
+            ).scalars().all()
+            if not batch:
+                break
+            facts = [
+                _fact(m.id, {
+                    k: getattr(m, k)
+                    for k in ("department", "status", "owner", "occurred_at", "transcript_text", "action_items")
+                }, (minutes.get(m.id) or 0.0) / 60.0, open_actions=n_open.get(m.id, 0))
+                for m in batch
+            ]
+            _apply(s, facts)
+            n += len(batch)
+            last = batch[-1].id
+            s.expunge_all()
+        if con is None:
+            s.commit()
+    return n
+
+
+def _init_schema(con) -> None:
+    Base.metadata.create_all(con, tables=[MeetingFact.__table__, AnalyticsBucket.__table__])
+    # databases created before analytics existed already have meetings
+    rebuild(con=con)
+
+
+register_schema(engine, "analytics", 1, _init_schema)
+
+
+# ---------- Read API ----------
+def totals() -> Dict[str, float]:
+    """Overall meetings, audio minutes, words and open action items."""
+    with Session(engine) as s:
+        row = s.execute(
+            select(*(func.coalesce(func.sum(getattr(AnalyticsBucket, k)), 0) for k in MEASURES))
+        ).one()
+    return dict(zip(MEASURES, row))
+
+
+def summary(
+    by: str = "department",
+    weeks: Optional[int] = None,
+    **where: str,
+) -> List[dict]:
+    """
+    Measures grouped by one of DIMENSIONS, optionally restricted to the last
+    `weeks` weeks and to exact dimension values (e.g. status="READY").
+    Reads only the bucket table, so the cost does not grow with the archive.
+    """
+    if by not in DIMENSIONS:
+        raise ValueError(f"by must be one of {DIMENSIONS}")
+    key = getattr(AnalyticsBucket, by)
+    stmt = select(key, *(func.sum(getattr(AnalyticsBucket, k)) for k in MEASURES)).group_by(key)
+    for dim, value in where.items():
+        if dim not in DIMENSIONS:
+            raise ValueError(f"unknown dimension {dim!r}")
+        stmt = stmt.where(getattr(AnalyticsBucket, dim) == value)
+    if weeks:
+        stmt = stmt.where(AnalyticsBucket.week >= week_of(datetime.now() - timedelta(weeks=weeks)))
+    stmt = stmt.order_by(key)
+    with Session(engine) as s:
+        return [dict(zip((by, *MEASURES), r)) for r in s.execute(stmt).all()]
+
+
+# ---------- Streamlit Page ----------
+def render():
+    import pandas as pd
+
+    st.header("📊 Analytics")
+
+    t = totals()
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Meetings", f"{int(t['meetings']):,}")
+    c2.metric("Audio hours", f"{t['audio_minutes'] / 60:,.1f}")
+    c3.metric("Words transcribed", f"{int(t['words']):,}")
+    c4.metric("Open action items", f"{int(t['open_actions']):,}")
+
+    col_by, col_range = st.columns(2)
+    by = col_by.selectbox("Group by", ["department", "status", "owner"])
+    weeks = col_range.selectbox("Period", [4, 12, 52, 0], index=1,
+                                format_func=lambda w: f"Last {w} weeks" if w else "All time")
+    measure = st.radio("Measure", list(MEASURES), horizontal=True,
+                       format_func=lambda k: k.replace("_", " ").capitalize())
+
+    rows = summary(by=by, weeks=weeks or None)
+    if not rows:
+        st.info("No meetings in this period.")
+        return
+    df = pd.DataFrame(rows).replace({by: {NONE_KEY: "(none)"}}).set_index(by)
+    st.bar_chart(df[measure])
+
+    st.subheader("Per week")
+    trend = pd.DataFrame(summary(by="week", weeks=weeks or None))
+    trend = trend[trend["week"] != NONE_KEY].set_index("week")
+    st.line_chart(trend[measure])
+
+    with st.expander("Table"):
+        st.dataframe(df)
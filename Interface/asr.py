@@ -1,20 +1,30 @@
 # Interface/asr.py
 from __future__ import annotations
 
+import importlib.util
 import os
 import sys
 import time
-from typing import Generator, Optional
+from datetime import datetime
+from typing import Callable, Generator, List, Optional, Tuple
 
 import streamlit as st
 
+from Interface import asr_cache
+from Interface.knowledge import KnowledgeStream
+from Interface.live import LiveTranscriptView
+
 # --- Paths (keep your layout: Transcription/ lives at project root) ---
 HERE = os.path.dirname(__file__)
 PROJECT_ROOT = os.path.dirname(HERE)
 sys.path.append(PROJECT_ROOT)  # allow importing Transcription/*
 
-UPLOAD_DIR = os.path.join(PROJECT_ROOT, "data", "uploads")
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+UPLOAD_DIR = asr_cache.UPLOAD_DIR
+
+SAMPLE_RATE = 16000  # both whisper backends decode to 16 kHz mono
+
+# (start_sec, end_sec, word); times are None when the backend gives none
+Word = Tuple[Optional[float], Optional[float], str]
 
 
 # ---------------- Core ASR helpers ----------------
@@ -49,19 +59,43 @@ def _try_local_stream(filepath: str, language: Optional[str]) -> Optional[Genera
         return None
 
 
-def transcribe_stream(filepath: str, language: Optional[str] = None) -> Generator[str, None, None]:
-    """
-    Transcribe audio via:
-    1) Local stream_transcribe (if available)
-    2) faster-whisper (if available)
-    3) openai/whisper (if available)
-    4) last-resort simulated stream (error message)
-    """
-    # 1) Project-local streaming
-    local = _try_local_stream(filepath, language)
+def audio_duration(filepath: str) -> Optional[float]:
+    """Duration in seconds, or None if no decoder is available for this file."""
+    try:
+        import soundfile as sf  # type: ignore
+        return float(sf.info(filepath).duration)
+    except Exception:
+        pass
+    try:
+        import librosa  # type: ignore
+        return float(librosa.get_duration(path=filepath))
+    except Exception:
+        return None
+
+
+def asr_backend() -> Optional[str]:
+    """Name of the ASR library transcribe_words will use, or None if none is installed."""
+    for module, name in (("faster_whisper", "faster-whisper"), ("whisper", "whisper")):
+        if importlib.util.find_spec(module) is not None:
+            return name
+    return None
+
+
+def _transcribe_words(
+    filepath: str,
+    language: Optional[str],
+    report: Callable[[Optional[float]], None],
+    start_offset: float = 0.0,
+) -> Generator[Word, None, Optional[str]]:
+    """Run the backend chain; returns the name of the backend that produced the words."""
+    # 1) Project-local streaming (no timestamps, so it cannot resume)
+    local = _try_local_stream(filepath, language) if not start_offset else None
     if local:
-        yield from local
-        return
+        for token in local:
+            report(None)
+            for w in token.split():
+                yield (None, None, w)
+        return "local"
 
     # 2) faster-whisper
     try:
@@ -70,40 +104,133 @@ def transcribe_stream(filepath: str, language: Optional[str] = None) -> Generato
         model_size = os.getenv("WHISPER_MODEL", "base")
         # compute_type is flexible (int8/int8_float16/float16), int8 is CPU friendly
         model = WhisperModel(model_size, compute_type=os.getenv("WHISPER_COMPUTE", "int8"))
+        audio = filepath
+        if start_offset:
+            from faster_whisper import decode_audio  # type: ignore
+            audio = decode_audio(filepath)[int(start_offset * SAMPLE_RATE):]
         segments, _ = model.transcribe(
-            filepath,
+            audio,
             language=language,
             word_timestamps=True,
             vad_filter=True,
         )
+        t0 = start_offset
         for seg in segments:
+            report(t0 + seg.end)
             if getattr(seg, "words", None):
                 for w in seg.words:
-                    # faster-whisper Word has .word
-                    yield getattr(w, "word", "") + " "
+                    # faster-whisper Word has .word (with a leading space)
+                    yield (t0 + w.start, t0 + w.end, getattr(w, "word", "").strip())
             else:
                 # fallback if words missing
                 for w in (seg.text or "").split():
-                    yield w + " "
-        return
+                    yield (t0 + seg.start, t0 + seg.end, w)
+        return "faster-whisper"
     except Exception as e:
         print("⚠️ faster-whisper failed:", e)
 
-    # 3) openai/whisper (pip install -U openai-whisper)
+    # 3) openai/whisper (pip install -U openai-whisper), segment-level timestamps
     try:
         import whisper  # type: ignore
 
         model_size = os.getenv("WHISPER_MODEL", "base")
         model = whisper.load_model(model_size)
-        result = model.transcribe(filepath, language=language)
-        text = result.get("text", "")
-        yield from simulate_stream(text)
-        return
+        audio = filepath
+        if start_offset:
+            audio = whisper.load_audio(filepath)[int(start_offset * SAMPLE_RATE):]
+        result = model.transcribe(audio, language=language)
+        t0 = start_offset
+        for seg in result.get("segments", []):
+            report(t0 + seg["end"])
+            for w in seg.get("text", "").split():
+                yield (t0 + seg["start"], t0 + seg["end"], w)
+        return "whisper"
     except Exception as e:
         print("⚠️ whisper failed:", e)
 
-    # 4) Last resort
-    yield from simulate_stream("⚠️ ASR failed. Please install faster-whisper or openai-whisper, or add Transcription/ modules.")
+    # 4) Last resort (not cached)
+    for token in simulate_stream("⚠️ ASR failed. Please install faster-whisper or openai-whisper, or add Transcription/ modules."):
+        yield (None, None, token.strip())
+    return None
+
+
+def transcript_cache_key(filepath: str, language: Optional[str] = None) -> Optional[str]:
+    """Cache key for this file under the current backend/model settings (None if uncacheable)."""
+    backend = asr_backend()
+    if not backend or not os.path.exists(filepath):
+        return None
+    return asr_cache.cache_key(
+        filepath,
+        backend=backend,
+        model=os.getenv("WHISPER_MODEL", "base"),
+        compute_type=os.getenv("WHISPER_COMPUTE", "int8"),
+        language=language,
+    )
+
+
+def transcribe_words(
+    filepath: str,
+    language: Optional[str] = None,
+    on_progress: Optional[Callable[[Optional[float]], None]] = None,
+    use_cache: bool = True,
+    start_offset: float = 0.0,
+) -> Generator[Word, None, None]:
+    """
+    Yield (start, end, word) tuples; start/end are None where the backend has no timestamps.
+
+    Backends, in order:
+    1) Local stream_transcribe (if available)
+    2) faster-whisper (if available)
+    3) openai/whisper (if available)
+    4) last-resort simulated stream (error message)
+
+    Results are cached by audio content hash + backend/model/compute/language
+    (see Interface/asr_cache.py): a hit replays the stored words instantly.
+
+    `on_progress(seconds)` is called with the audio offset reached so far
+    (per segment), or with None where the backend gives no timestamps.
+
+    `start_offset` (seconds) resumes an interrupted run: only audio after it is
+    transcribed, timestamps stay absolute, and the partial result is not cached.
+    """
+    def report(seconds: Optional[float] = None) -> None:
+        if on_progress is not None:
+            on_progress(seconds)
+
+    backend = asr_backend()
+    key = None
+    if use_cache and not start_offset:
+        key = transcript_cache_key(filepath, language)
+    if key is not None:
+        cached = asr_cache.get(key)
+        if cached is not None:
+            report(cached["words"][-1][1] if cached["words"] else None)
+            for w in cached["words"]:
+                yield tuple(w)
+            return
+
+    words: List[Word] = []
+    gen = _transcribe_words(filepath, language, report, start_offset)
+    while True:
+        try:
+            word = next(gen)
+        except StopIteration as stop:
+            used = stop.value  # backend that actually ran
+            break
+        words.append(word)
+        yield word
+    if key is not None and used == backend:
+        asr_cache.put(key, words)
+
+
+def transcribe_stream(
+    filepath: str,
+    language: Optional[str] = None,
+    on_progress: Optional[Callable[[Optional[float]], None]] = None,
+) -> Generator[str, None, None]:
+    """Text-only view of transcribe_words: yields "word " tokens."""
+    for _, _, word in transcribe_words(filepath, language, on_progress=on_progress):
+        yield word + " "
 
 
 # ---------------- Streamlit Page ----------------
@@ -134,11 +261,8 @@ def render():
     # --- Resolve file path ---
     audio_path: Optional[str] = None
     if up is not None:
-        # Save uploaded file to data/uploads
-        safe_name = os.path.basename(up.name)
-        dest = os.path.join(UPLOAD_DIR, safe_name)
-        with open(dest, "wb") as f:
-            f.write(up.getbuffer())
+        # Save uploaded file to data/uploads, addressed by content hash
+        dest = asr_cache.store_upload(up.getvalue(), up.name)
         audio_path = dest
         st.success(f"Uploaded to: `{dest}`")
     elif local_path.strip():
@@ -150,31 +274,66 @@ def render():
             audio_path = None
 
     # --- Controls ---
+    background = st.checkbox(
+        "Run in background (recommended for long recordings)", value=True,
+        help="Queues the file for a worker process; you can navigate away and come back.",
+    )
     col1, col2 = st.columns([1, 1])
     start = col1.button("▶️ Start Transcription", use_container_width=True, disabled=audio_path is None)
     clear = col2.button("🧹 Clear", use_container_width=True)
 
     if clear:
+        st.session_state.pop("asr_job_id", None)
         st.rerun()
 
     # --- Live output ---
     out = st.empty()
     final_box = st.empty()
 
-    if start:
+    if start and background:
+        if not audio_path:
+            st.warning("Please provide an audio file (upload or local path).")
+            return
+
+        from Interface.jobs import submit_transcription
+        from Interface.storage import upsert_meeting
+
+        user = st.session_state.get("user") or {}
+        mtg = upsert_meeting(
+            name=up.name if up is not None else os.path.basename(audio_path),
+            occurred_at=datetime.now(),
+            audio_path=audio_path,
+            owner=user.get("username"),
+            status="DRAFT",
+        )
+        job = submit_transcription(mtg.id, audio_path, language=lang, submitted_by=user.get("username"))
+        st.session_state["asr_job_id"] = job.id
+
+    elif start:
         if not audio_path:
             st.warning("Please provide an audio file (upload or local path).")
             return
 
-        running_text = ""
         with st.spinner("Transcribing…"):
             try:
+                # Batched, paged updates instead of re-sending the whole text per token
+                live = LiveTranscriptView(out.container())
+                # Action items are picked up sentence by sentence while transcribing
+                knowledge = KnowledgeStream()
+                actions_box = st.empty()
                 for token in transcribe_stream(audio_path, language=lang):
-                    running_text += token
-                    # Update UI progressively
-                    out.markdown(f"**Live Transcript**\n\n{running_text}")
+                    live.push(token)
+                    if knowledge.push(token):
+                        actions_box.markdown("**Action items so far**\n\n" + "\n".join(
+                            f"- [ ] {a}" for a in knowledge.action_items))
+                running_text = live.close()
+                result = knowledge.finish()
                 # Finalize
                 final_box.text_area("Final Transcript", running_text.strip(), height=240)
+                with st.expander("Key points, action items and summary", expanded=True):
+                    st.markdown("\n".join(f"- {p}" for p in result.key_points) or "_No key points._")
+                    st.markdown("\n".join(f"- [ ] {a}" for a in result.action_items) or "_No action items._")
+                    st.write(result.summary)
                 # Download button
                 st.download_button(
                     "💾 Download transcript.txt",
@@ -185,3 +344,9 @@ def render():
                 st.success("Transcription complete.")
             except Exception as e:
                 st.error(f"Transcription error: {e}")
+
+    # --- Background job (survives reruns and navigation) ---
+    job_id = st.session_state.get("asr_job_id")
+    if job_id is not None:
+        from Interface.jobs import render_job_status
+        render_job_status(job_id)
@@ -0,0 +1,120 @@
+# Interface/asr_cache.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+
+# ---------- Setup ----------
+HERE = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.dirname(HERE)
+UPLOAD_DIR = os.path.join(PROJECT_ROOT, "data", "uploads")
+CACHE_DIR = os.getenv("MEETSENSE_ASR_CACHE", os.path.join(PROJECT_ROOT, "data", "cache", "asr"))
+CACHE_BUDGET_BYTES = int(float(os.getenv("MEETSENSE_ASR_CACHE_MB", "512")) * 1024 * 1024)
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+
+# ---------- Content addressing ----------
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _file_sha256(path: str, size: int, mtime_ns: int) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    """Hash of the file contents (memoized while size/mtime are unchanged)."""
+    st = os.stat(path)
+    return _file_sha256(os.path.abspath(path), st.st_size, st.st_mtime_ns)
+
+
+def store_upload(data: bytes, filename: str) -> str:
+    """
+    Save uploaded bytes as data/uploads/<sha256><ext>. Identical files map to the
+    same path whatever their name; different files never overwrite each other.
+    """
+    ext = os.path.splitext(os.path.basename(filename))[1].lower()
+    dest = os.path.join(UPLOAD_DIR, sha256_bytes(data) + ext)
+    if not os.path.exists(dest):
+        _atomic_write(dest, data)
+    return dest
+
+
+# ---------- Transcript cache ----------
+def cache_key(
+    audio_path: str,
+    backend: str,
+    model: str,
+    compute_type: str,
+    language: Optional[str],
+) -> str:
+    parts = [file_sha256(audio_path), backend, model, compute_type, language or "auto"]
+    return sha256_bytes("|".join(parts).encode("utf-8"))
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, key + ".json")
+
+
+def get(key: str) -> Optional[dict]:
+    """Cached {"text", "words"} for `key`, or None. A hit refreshes its LRU position."""
+    path = _entry_path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        os.utime(path)  # mtime is the LRU clock
+        return entry
+    except (OSError, ValueError):
+        return None
+
+
+def put(key: str, words: Sequence[Sequence]) -> None:
+    """Store the words (start, end, text) of a finished transcription, then enforce the budget."""
+    words = [list(w) for w in words]
+    entry = {"text": " ".join(w[2] for w in words), "words": words}
+    _atomic_write(_entry_path(key), json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+    evict()
+
+
+def evict(budget_bytes: int = CACHE_BUDGET_BYTES) -> List[str]:
+    """Drop least recently used entries until the cache fits in `budget_bytes`."""
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith(".json"):
+            try:
+                st = os.stat(os.path.join(CACHE_DIR, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+
+    total = sum(size for _, size, _ in entries)
+    removed = []
+    for _, size, name in sorted(entries):
+        if total <= budget_bytes:
+            break
+        try:
+            os.remove(os.path.join(CACHE_DIR, name))
+        except OSError:
+            continue
+        total -= size
+        removed.append(name[:-5])
+    return removed
+
+
+def _atomic_write(dest: str, data: bytes) -> None:
+    # Write-then-rename so concurrent workers never read a half-written file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, dest)
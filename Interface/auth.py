@@ -1,41 +1,43 @@
-import streamlit as st
-import sqlite3
+import os
 import hashlib
 
-DB_PATH = "users.db"
+import streamlit as st
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from Interface.db import get_engine, register_schema, writer
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+DB_PATH = os.getenv("MEETSENSE_USERS_DB", os.path.join(PROJECT_ROOT, "users.db"))
+
+# Shared pooled engine (Interface/db.py) instead of a new connection per call
+engine = get_engine(DB_PATH)
 
-def _get_conn():
-    con = sqlite3.connect(DB_PATH)
-    con.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE,
-            password TEXT,
-            is_admin BOOLEAN DEFAULT 0
-        )
-    """)
-    con.commit()
-    return con
+register_schema(engine, "users", 1, lambda con: con.exec_driver_sql("""
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE,
+        password TEXT,
+        is_admin BOOLEAN DEFAULT 0
+    )
+"""))
 
 def hash_pw(pw: str) -> str:
     return hashlib.sha256(pw.encode()).hexdigest()
 
 def register_user(username: str, password: str, is_admin=False) -> bool:
-    con = _get_conn()
     try:
-        con.execute("INSERT INTO users (username, password, is_admin) VALUES (?, ?, ?)",
-                    (username, hash_pw(password), is_admin))
-        con.commit()
+        with writer(engine).begin() as con:
+            con.execute(text("INSERT INTO users (username, password, is_admin) VALUES (:u, :p, :a)"),
+                        {"u": username, "p": hash_pw(password), "a": is_admin})
         return True
-    except sqlite3.IntegrityError:
+    except IntegrityError:
         return False
 
 def authenticate(username: str, password: str):
-    con = _get_conn()
-    cur = con.cursor()
-    cur.execute("SELECT id, is_admin FROM users WHERE username=? AND password=?",
-                (username, hash_pw(password)))
-    row = cur.fetchone()
+    with engine.connect() as con:
+        row = con.execute(text("SELECT id, is_admin FROM users WHERE username=:u AND password=:p"),
+                          {"u": username, "p": hash_pw(password)}).first()
     if row:
         return {"user_id": row[0], "username": username, "is_admin": bool(row[1])}
     return None
@@ -0,0 +1,142 @@
+# Interface/calendar_data.py
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, List, Tuple
+
+import streamlit as st
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from Interface.query_cache import cached
+from Interface.storage import Meeting, engine
+
+
+# ---------- Settings ----------
+PER_DAY = 5            # meeting summaries kept per day (the count covers all of them)
+
+Month = Tuple[int, int]
+
+
+@dataclass
+class Day:
+    """One calendar day: total meetings and the first PER_DAY of them, by time."""
+    count: int = 0
+    meetings: List[dict] = field(default_factory=list)
+
+
+# ---------- Queries ----------
+def _month_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    start = datetime(year, month, 1)
+    end = datetime(year + month // 12, month % 12 + 1, 1)
+    return start, end
+
+
+def _load_month(year: int, month: int) -> Dict[date, Day]:
+    start, end = _month_bounds(year, month)
+    in_month = (Meeting.occurred_at >= start) & (Meeting.occurred_at < end)
+    day = func.date(Meeting.occurred_at)
+
+    # both queries are range scans of ix_meetings_occurred_at; the first one
+    # never leaves the index, the second reads only PER_DAY rows per day
+    counts = select(day, func.count()).where(in_month).group_by(day)
+    ranked = (
+        select(
+            Meeting.id, Meeting.name, Meeting.occurred_at, Meeting.status, Meeting.department,
+            func.row_number().over(partition_by=day, order_by=(Meeting.occurred_at, Meeting.id)).label("n"),
+        )
+        .where(in_month)
+        .subquery()
+    )
+    firsts = (
+        select(ranked.c.id, ranked.c.name, ranked.c.occurred_at, ranked.c.status, ranked.c.department)
+        .where(ranked.c.n <= PER_DAY)
+        .order_by(ranked.c.occurred_at, ranked.c.id)
+    )
+
+    days: Dict[date, Day] = {}
+    with Session(engine) as s:
+        for d, n in s.execute(counts):
+            days[date.fromisoformat(d)] = Day(count=n)
+        for mid, name, occurred_at, status, department in s.execute(firsts):
+            days[occurred_at.date()].meetings.append({
+                "id": mid,
+                "name": name,
+                "time": occurred_at.strftime("%H:%M"),
+                "status": status,
+                "department": department,
+            })
+    return days
+
+
+@cached
+def month_days(year: int, month: int) -> Dict[date, Day]:
+    """Days of the month that have meetings (cached until the next meetings write)."""
+    return _load_month(year, month)
+
+
+def window(date_from: date, date_to: date) -> Dict[date, Day]:
+    """Per-day counts and summaries for [date_from, date_to], e.g. a visible 6-week grid."""
+    out: Dict[date, Day] = {}
+    y, m = date_from.year, date_from.month
+    while (y, m) <= (date_to.year, date_to.month):
+        for d, info in month_days(y, m).items():
+            if date_from <= d <= date_to:
+                out[d] = info
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    return out
+
+
+# ---------- Streamlit Page ----------
+def _shift(year: int, month: int, delta: int) -> Month:
+    i = year * 12 + month - 1 + delta
+    return i // 12, i % 12 + 1
+
+
+def render():
+    st.header("📅 Calendar")
+
+    today = date.today()
+    year, month = st.session_state.setdefault("calendar_month", (today.year, today.month))
+
+    c_prev, c_title, c_today, c_next = st.columns([1, 4, 1, 1])
+    if c_prev.button("◀", key="cal_prev"):
+        year, month = st.session_state["calendar_month"] = _shift(year, month, -1)
+    if c_next.button("▶", key="cal_next"):
+        year, month = st.session_state["calendar_month"] = _shift(year, month, 1)
+    if c_today.button("Today", key="cal_today"):
+        year, month = st.session_state["calendar_month"] = (today.year, today.month)
+    c_title.subheader(f"{calendar.month_name[month]} {year}")
+
+    weeks = calendar.Calendar().monthdatescalendar(year, month)
+    days = window(weeks[0][0], weeks[-1][-1])
+
+    for col, label in zip(st.columns(7), calendar.day_abbr):
+        col.markdown(f"**{label}**")
+    for week in weeks:
+        for col, d in zip(st.columns(7), week):
+            info = days.get(d)
+            with col:
+                label = f"**{d.day}**" if d.month == month else f"<span style='opacity:.4'>{d.day}</span>"
+                if d == today:
+                    label += " 🔵"
+                st.markdown(label, unsafe_allow_html=True)
+                if info:
+                    for mtg in info.meetings[:2]:
+                        st.caption(f"{mtg['time']} {mtg['name']}")
+                    if info.count > 2:
+                        st.caption(f"+{info.count - 2} more")
+
+    busy = sorted(d for d in days if d.month == month)
+    if busy:
+        picked = st.selectbox("Day", busy, format_func=lambda d: f"{d:%a %d %b} — {days[d].count} meeting(s)")
+        info = days[picked]
+        for mtg in info.meetings:
+            st.markdown(f"- `{mtg['time']}` #{mtg['id']} **{mtg['name']}** · "
+                        f"{mtg['department'] or '-'} · {mtg['status'] or 'UNUSED'}")
+        if info.count > len(info.meetings):
+            st.caption(f"{info.count - len(info.meetings)} more — see Storage filtered to this date.")
+    else:
+        st.info("No meetings this month.")
@@ -0,0 +1,158 @@
+# Interface/db.py
+from __future__ import annotations
+
+import os
+import threading
+from typing import Callable, Dict, List, Set, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+
+# ---------- Tuning ----------
+# Applied to every pooled connection (most SQLite pragmas are per connection)
+PRAGMAS = {
+    "journal_mode": "WAL",          # readers no longer block on the writer (persistent)
+    "synchronous": "NORMAL",        # safe with WAL; fsync at checkpoints only
+    "cache_size": -16000,           # 16 MB page cache per connection
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+    "busy_timeout": 10000,          # ms to wait on a lock before SQLITE_BUSY
+}
+POOL_SIZE = int(os.getenv("MEETSENSE_DB_POOL", "8"))
+MAX_OVERFLOW = 8
+POOL_TIMEOUT = 30
+
+_engines: Dict[str, Engine] = {}
+_lock = threading.Lock()
+
+# ---------- Schema registry ----------
+# Per database file: (component, version, fn) in registration order
+_schemas: Dict[str, List[Tuple[str, int, Callable[[Connection], None]]]] = {}
+# Component versions stored in the database, once this process has checked them
+_versions: Dict[str, Dict[str, int]] = {}
+_initializing: Set[str] = set()
+_schema_lock = threading.RLock()
+
+
+def make_engine(path: str, tuned: bool = True) -> Engine:
+    """
+    SQLAlchemy engine for a SQLite file. With `tuned`, connections use WAL and
+    the PRAGMAS above, share a bounded pool, and transactions are started by us
+    rather than by pysqlite so writers can ask for BEGIN IMMEDIATE (see writer()).
+    """
+    path = os.path.abspath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if not tuned:
+        return create_engine(f"sqlite:///{path}", future=True)
+
+    engine = create_engine(
+        f"sqlite:///{path}",
+        future=True,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        connect_args={"timeout": PRAGMAS["busy_timeout"] / 1000, "check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_con, _record):
+        # let SQLAlchemy's "begin" event below issue BEGIN
+        dbapi_con.isolation_level = None
+        cur = dbapi_con.cursor()
+        for name, value in PRAGMAS.items():
+            cur.execute(f"PRAGMA {name}={value}")
+        cur.close()
+
+    @event.listens_for(engine, "engine_connect")
+    def _on_engine_connect(conn):
+        if path not in _versions:  # first use of this database in this process
+            _ensure_schema(engine, path)
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        # IMMEDIATE takes the write lock up front: a read-then-write transaction
+        # can otherwise fail with SQLITE_BUSY without ever waiting busy_timeout
+        mode = conn.get_execution_options().get("sqlite_begin", "DEFERRED")
+        conn.exec_driver_sql(f"BEGIN {mode}")
+
+    return engine
+
+
+def get_engine(path: str) -> Engine:
+    """One shared engine (and pool) per database file in this process."""
+    key = os.path.abspath(path)
+    with _lock:
+        if key not in _engines:
+            _engines[key] = make_engine(key)
+        return _engines[key]
+
+
+def writer(engine: Engine) -> Engine:
+    """Engine view whose transactions start with BEGIN IMMEDIATE; use it for sessions that write."""
+    return engine.execution_options(sqlite_begin="IMMEDIATE")
+
+
+# ---------- Schema ----------
+def register_schema(engine: Engine, component: str, version: int, fn: Callable[[Connection], None]) -> None:
+    """
+    Declare how `component` creates or migrates its tables in `engine`'s
+    database. `fn(con)` must be idempotent; it runs inside a BEGIN IMMEDIATE
+    transaction only when the version stored in the schema_version table is
+    older than `version`. Nothing touches the database here: registered steps
+    are checked the first time the process uses the engine (or right away
+    if that has already happened).
+    """
+    path = engine.url.database
+    with _schema_lock:
+        _schemas.setdefault(path, []).append((component, version, fn))
+        if path in _versions and _versions[path].get(component, 0) < version:
+            _apply(engine, path, [(component, version, fn)])
+
+
+def _read_versions(con: Connection) -> Dict[str, int]:
+    try:
+        return dict(con.exec_driver_sql("SELECT component, version FROM schema_version").all())
+    except OperationalError:  # new database
+        return {}
+
+
+def _apply(engine: Engine, path: str, steps) -> None:
+    _initializing.add(path)
+    try:
+        with writer(engine).begin() as con:
+            con.exec_driver_sql(
+                "CREATE TABLE IF NOT EXISTS schema_version "
+                "(component TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+            )
+            stored = _read_versions(con)  # re-read under the write lock: another process may have done it
+            for component, version, fn in steps:
+                if stored.get(component, 0) < version:
+                    fn(con)
+                    con.exec_driver_sql(
+                        "INSERT OR REPLACE INTO schema_version (component, version) VALUES (?, ?)",
+                        (component, version),
+                    )
+                    stored[component] = version
+        _versions[path] = stored
+    finally:
+        _initializing.discard(path)
+
+
+def _ensure_schema(engine: Engine, path: str) -> None:
+    with _schema_lock:
+        # connections opened by the steps themselves (same thread) pass through
+        if path in _versions or path in _initializing:
+            return
+        _initializing.add(path)
+        try:
+            with engine.connect() as con:
+                stored = _read_versions(con)
+        finally:
+            _initializing.discard(path)
+        steps = _schemas.get(path, [])
+        if all(stored.get(c, 0) >= v for c, v, _ in steps):
+            _versions[path] = stored  # the usual case: one SELECT per process
+            return
+        _apply(engine, path, steps)
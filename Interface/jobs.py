@@ -0,0 +1,533 @@
+# Interface/jobs.py
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import streamlit as st
+from sqlalchemy import String, DateTime, Text, Float, Index, delete, func, select, update
+from sqlalchemy.orm import Mapped, mapped_column, Session
+
+from Interface.db import register_schema
+from Interface.storage import Base, engine, write_engine, get_meeting, update_meeting
+
+
+# ---------- Settings ----------
+MAX_WORKERS = int(os.getenv("MEETSENSE_JOB_WORKERS", "2"))
+PROGRESS_INTERVAL = 1.0      # seconds between progress writes
+CHECKPOINT_INTERVAL = 5.0    # seconds between segment checkpoints
+POLL_INTERVAL = 2.0          # seconds between page refreshes while a job runs
+STALE_AFTER = timedelta(minutes=10)  # RUNNING jobs without heartbeat are requeued
+HEARTBEAT_INTERVAL = 30.0    # seconds between heartbeats of a running worker
+DISPATCH_INTERVAL = 15.0     # seconds between checks for stale and undispatched jobs
+
+QUEUED, RUNNING, DONE, FAILED = "QUEUED", "RUNNING", "DONE", "FAILED"
+
+
+# ---------- Model ----------
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(50), default="transcribe")
+    meeting_id: Mapped[Optional[int]] = mapped_column(index=True)
+    audio_path: Mapped[str] = mapped_column(String(1024))
+    language: Mapped[Optional[str]] = mapped_column(String(16))
+    submitted_by: Mapped[Optional[str]] = mapped_column(String(120), index=True)
+    status: Mapped[str] = mapped_column(String(20), default=QUEUED, index=True)
+    attempt: Mapped[int] = mapped_column(default=0)  # bumped by every claim; the owner's token
+    progress: Mapped[float] = mapped_column(Float, default=0.0)
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+
+class JobSegment(Base):
+    """A checkpointed run of finished words; rows live until their job is DONE."""
+    __tablename__ = "job_segments"
+    __table_args__ = (Index("ix_job_segments_job_seq", "job_id", "seq"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    job_id: Mapped[int] = mapped_column()
+    seq: Mapped[int] = mapped_column()
+    start: Mapped[Optional[float]] = mapped_column(Float)
+    end: Mapped[Optional[float]] = mapped_column(Float)
+    text: Mapped[str] = mapped_column(Text)
+    words: Mapped[str] = mapped_column(Text)  # JSON [[start, end, word], ...]
+
+
+def _init_schema(con) -> None:
+    Base.metadata.create_all(con, tables=[Job.__table__, JobSegment.__table__])
+    existing = {row[1] for row in con.exec_driver_sql("PRAGMA table_info(jobs)")}
+    if "attempt" not in existing:
+        con.exec_driver_sql("ALTER TABLE jobs ADD COLUMN attempt INTEGER NOT NULL DEFAULT 0")
+
+
+register_schema(engine, "jobs", 2, _init_schema)
+
+
+class ClaimLost(Exception):
+    """The job was requeued and claimed again; this worker must stop writing."""
+
+
+# ---------- Queue API ----------
+def submit_transcription(
+    meeting_id: int,
+    audio_path: str,
+    language: Optional[str] = None,
+    submitted_by: Optional[str] = None,
+) -> Job:
+    """Persist a QUEUED job and hand it to the worker pool. Returns immediately."""
+    with Session(write_engine) as s:
+        job = Job(
+            meeting_id=meeting_id,
+            audio_path=audio_path,
+            language=language,
+            submitted_by=submitted_by,
+            status=QUEUED,
+        )
+        s.add(job)
+        s.commit()
+        s.refresh(job)
+
+    _submit(job.id)
+    return job
+
+
+def get_job(job_id: int) -> Optional[Job]:
+    with Session(engine) as s:
+        return s.get(Job, job_id)
+
+
+def list_jobs(
+    status: Optional[str] = None,
+    submitted_by: Optional[str] = None,
+    limit: int = 50,
+) -> List[Job]:
+    stmt = select(Job).order_by(Job.id.desc()).limit(limit)
+    if status:
+        stmt = stmt.where(Job.status == status)
+    if submitted_by:
+        stmt = stmt.where(Job.submitted_by == submitted_by)
+    with Session(engine) as s:
+        return list(s.execute(stmt).scalars().all())
+
+
+def get_segments(job_id: int) -> List[JobSegment]:
+    with Session(engine) as s:
+        return list(s.execute(
+            select(JobSegment).where(JobSegment.job_id == job_id).order_by(JobSegment.seq)
+        ).scalars().all())
+
+
+def partial_transcript(job_id: int) -> str:
+    """Text checkpointed so far for a QUEUED/RUNNING/FAILED job."""
+    return " ".join(seg.text for seg in get_segments(job_id))
+
+
+def _next_queued() -> Optional[Job]:
+    with Session(engine) as s:
+        return s.execute(
+            select(Job).where(Job.status == QUEUED).order_by(Job.id).limit(1)
+        ).scalars().first()
+
+
+def requeue_stale_jobs() -> int:
+    """Put RUNNING jobs whose worker stopped sending heartbeats back in the queue."""
+    cutoff = datetime.now() - STALE_AFTER
+    with Session(write_engine) as s:
+        res = s.execute(
+            update(Job)
+            .where(Job.status == RUNNING, Job.updated_at < cutoff)
+            .values(status=QUEUED, progress=0.0)
+        )
+        s.commit()
+        return res.rowcount or 0
+
+
+# ---------- Worker pool ----------
+# Module globals survive Streamlit reruns: one pool per server process
+_pool: Optional[ProcessPoolExecutor] = None
+_dispatched: Dict[int, Future] = {}  # job id -> future in the current pool
+_pool_lock = threading.RLock()
+_last_dispatch = 0.0
+_dispatcher: Optional[threading.Thread] = None
+
+
+def _executor() -> ProcessPoolExecutor:
+    """
+    The server's pool, created on first use ('spawn' keeps Streamlit's
+    threads out of the workers) together with a daemon thread that calls
+    dispatch_jobs() every DISPATCH_INTERVAL seconds.
+    """
+    global _pool, _dispatcher
+    with _pool_lock:
+        if _pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=ctx)
+        if _dispatcher is None:
+            _dispatcher = threading.Thread(target=_dispatch_loop, daemon=True, name="job-dispatcher")
+            _dispatcher.start()
+        return _pool
+
+
+def _reset_pool(broken: ProcessPoolExecutor) -> None:
+    """Drop a broken pool (a worker died); the next submit creates a new one."""
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+            _dispatched.clear()
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit(job_id: int) -> bool:
+    """Hand a job to the pool unless it is already there; False if it was."""
+    with _pool_lock:
+        fut = _dispatched.get(job_id)
+        if fut is not None and not fut.done():
+            return False
+        pool = _executor()
+        try:
+            fut = pool.submit(run_job, job_id)
+        except (BrokenProcessPool, RuntimeError):  # broken or shut down
+            _reset_pool(pool)
+            pool = _executor()
+            fut = pool.submit(run_job, job_id)
+        _dispatched[job_id] = fut
+    fut.add_done_callback(lambda f: _job_finished(job_id, pool, f))
+    return True
+
+
+def _job_finished(job_id: int, pool: ProcessPoolExecutor, fut: Future) -> None:
+    with _pool_lock:
+        if _dispatched.get(job_id) is fut:
+            del _dispatched[job_id]
+    if fut.cancelled() or not isinstance(fut.exception(), BrokenProcessPool):
+        return
+    # The worker process died (e.g. out of memory): a job it had claimed
+    # fails (Retry resumes it); jobs still QUEUED go to the next pool
+    _reset_pool(pool)
+    with Session(write_engine) as s:
+        s.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == RUNNING)
+            .values(status=FAILED, error="Worker process crashed", finished_at=datetime.now())
+        )
+        s.commit()
+
+
+def dispatch_jobs(force: bool = False) -> int:
+    """
+    Requeue stale RUNNING jobs and hand every QUEUED job that is not in the
+    pool yet to it: jobs left by a previous server run, or by a crashed pool.
+    Runs at most once per DISPATCH_INTERVAL unless `force`. Returns the
+    number of jobs submitted.
+    """
+    global _last_dispatch
+    with _pool_lock:
+        if not force and time.monotonic() - _last_dispatch < DISPATCH_INTERVAL:
+            return 0
+        _last_dispatch = time.monotonic()
+    requeue_stale_jobs()
+    return sum(_submit(job.id) for job in reversed(list_jobs(status=QUEUED, limit=1000)))
+
+
+def _dispatch_loop() -> None:
+    while True:
+        try:
+            dispatch_jobs(force=True)
+        except Exception as e:  # keep the thread alive through a locked or missing database
+            print(f"⚠️ job dispatch failed: {e}")
+        time.sleep(DISPATCH_INTERVAL)
+
+
+def _claim(job_id: int) -> Optional[int]:
+    """
+    Atomically move a job QUEUED -> RUNNING. Returns the claim's attempt
+    token, or None if another worker owns the job.
+    """
+    now = datetime.now()
+    with Session(write_engine) as s:
+        attempt = s.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == QUEUED)
+            .values(status=RUNNING, started_at=now, updated_at=now, error=None, attempt=Job.attempt + 1)
+            .returning(Job.attempt)
+        ).scalar()
+        s.commit()
+        return attempt
+
+
+def _owned(job_id: int, attempt: Optional[int]):
+    """WHERE clause for writes by the worker holding claim `attempt` (any writer if None)."""
+    if attempt is None:
+        return Job.id == job_id
+    return (Job.id == job_id) & (Job.status == RUNNING) & (Job.attempt == attempt)
+
+
+def _set_job(job_id: int, attempt: Optional[int] = None, **fields) -> bool:
+    """Update a job; with `attempt`, only while that claim still owns it. False if not."""
+    fields.setdefault("updated_at", datetime.now())
+    with Session(write_engine) as s:
+        res = s.execute(update(Job).where(_owned(job_id, attempt)).values(**fields))
+        s.commit()
+        return res.rowcount == 1
+
+
+def _save_checkpoint(job_id: int, attempt: int, words: List[tuple], **job_fields) -> None:
+    """
+    Persist one batch of finished words as a segment, together with a
+    heartbeat. Raises ClaimLost (writing nothing) if the claim was lost.
+    """
+    job_fields.setdefault("updated_at", datetime.now())
+    with Session(write_engine) as s:
+        # the heartbeat goes first: it checks the claim and takes the write lock
+        res = s.execute(update(Job).where(_owned(job_id, attempt)).values(**job_fields))
+        if res.rowcount != 1:
+            s.rollback()
+            raise ClaimLost(job_id)
+        seq = s.execute(
+            select(func.count()).select_from(JobSegment).where(JobSegment.job_id == job_id)
+        ).scalar_one()
+        s.add(JobSegment(
+            job_id=job_id,
+            seq=seq,
+            start=words[0][0],
+            end=words[-1][1],
+            text=" ".join(w[2] for w in words),
+            words=json.dumps(words, ensure_ascii=False),
+        ))
+        s.commit()
+
+
+def _load_checkpoints(job_id: int) -> List[tuple]:
+    """Words already checkpointed for this job, in order."""
+    words: List[tuple] = []
+    for seg in get_segments(job_id):
+        words.extend(tuple(w) for w in json.loads(seg.words or "[]"))
+    return words
+
+
+def _clear_checkpoints(job_id: int) -> None:
+    with Session(write_engine) as s:
+        s.execute(delete(JobSegment).where(JobSegment.job_id == job_id))
+        s.commit()
+
+
+class _Heartbeat(threading.Thread):
+    """
+    Keeps a claimed job's updated_at fresh while the worker runs, so a backend
+    that reports no progress for a long time is not requeued as stale. Sets
+    `lost` once the claim no longer belongs to this worker.
+    """
+
+    def __init__(self, job_id: int, attempt: int):
+        super().__init__(daemon=True, name=f"job-{job_id}-heartbeat")
+        self.job_id, self.attempt = job_id, attempt
+        self.lost = threading.Event()
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.wait(HEARTBEAT_INTERVAL):
+            try:
+                if not _set_job(self.job_id, self.attempt):
+                    self.lost.set()
+                    return
+            except Exception as e:  # a locked database: try again next beat
+                print(f"⚠️ heartbeat for job #{self.job_id} failed: {e}")
+
+    def stop(self) -> None:
+        self._done.set()
+
+
+def run_job(job_id: int) -> None:
+    """
+    Worker entry point: transcribe, analyze and store the result on the meeting.
+
+    Finished words are checkpointed every CHECKPOINT_INTERVAL seconds. A job that
+    was interrupted (requeued or retried) resumes from the end of its last
+    checkpoint instead of from zero. Every write is conditional on this
+    worker's claim (`attempt`); a worker whose job was requeued and claimed
+    by another stops without writing anything more.
+    """
+    attempt = _claim(job_id)
+    if attempt is None:
+        return
+    heartbeat = _Heartbeat(job_id, attempt)
+    heartbeat.start()
+    last_write = 0.0
+    duration = None
+
+    def check_claim() -> None:
+        if heartbeat.lost.is_set():
+            raise ClaimLost(job_id)
+
+    def on_progress(seconds_done: Optional[float]) -> None:
+        nonlocal last_write
+        check_claim()
+        now = time.monotonic()
+        if now - last_write < PROGRESS_INTERVAL:
+            return
+        last_write = now
+        # Always heartbeat; progress is only known when the duration is
+        fields = {}
+        if duration and seconds_done is not None:
+            fields["progress"] = min(seconds_done / duration, 0.99)
+        if not _set_job(job_id, attempt, **fields):
+            raise ClaimLost(job_id)
+
+    try:
+        job = get_job(job_id)
+
+        # Heavy imports happen in the worker, never in the Streamlit process
+        from Interface import asr_cache
+        from Interface.asr import audio_duration, transcribe_words, transcript_cache_key
+        from Interface.knowledge import KnowledgeStream
+        from Interface.segments import save_segments
+
+        duration = audio_duration(job.audio_path)
+        words = _load_checkpoints(job_id)
+        offset = words[-1][1] if words else None
+        if words and offset is None:
+            # Checkpoints without timestamps cannot be resumed from; start over
+            _clear_checkpoints(job_id)
+            words = []
+        resumed = bool(words)
+
+        # Knowledge is extracted as words arrive; new action items are saved
+        # to the meeting at each checkpoint so they show up during the job
+        knowledge = KnowledgeStream()
+        for word in words:
+            knowledge.push_segment(word)
+        saved_actions: List[str] = []
+
+        pending: List[tuple] = []
+        last_checkpoint = time.monotonic()
+        for word in transcribe_words(job.audio_path, job.language, on_progress=on_progress,
+                                     start_offset=offset or 0.0):
+            check_claim()
+            pending.append(word)
+            knowledge.push_segment(word)
+            # Only cut at a timestamped word so the resume offset is exact
+            if word[1] is not None and time.monotonic() - last_checkpoint >= CHECKPOINT_INTERVAL:
+                _save_checkpoint(job_id, attempt, pending)
+                words.extend(pending)
+                pending = []
+                last_checkpoint = time.monotonic()
+                if job.meeting_id is not None and knowledge.action_items != saved_actions:
+                    saved_actions = knowledge.action_items
+                    update_meeting(job.meeting_id, action_items="\n".join(saved_actions))
+        if pending:
+            _save_checkpoint(job_id, attempt, pending)
+            words.extend(pending)
+        elif not _set_job(job_id, attempt):
+            raise ClaimLost(job_id)
+
+        if resumed:
+            # A resumed run skips the cache; store the stitched result now
+            key = transcript_cache_key(job.audio_path, job.language)
+            if key is not None:
+                asr_cache.put(key, words)
+
+        transcript = " ".join(w[2] for w in words)
+        if job.meeting_id is not None:
+            save_segments(job.meeting_id, words)
+            result = knowledge.finish()
+            update_meeting(
+                job.meeting_id,
+                transcript_text=transcript,
+                summary=result.summary,
+                key_points="\n".join(result.key_points),
+                action_items="\n".join(result.action_items),
+            )
+        if _set_job(job_id, attempt, status=DONE, progress=1.0, finished_at=datetime.now()):
+            _clear_checkpoints(job_id)
+    except ClaimLost:
+        print(f"⚠️ Job #{job_id} was claimed by another worker; attempt {attempt} stopped")
+    except Exception as e:
+        _set_job(job_id, attempt, status=FAILED, error=str(e), finished_at=datetime.now())
+    finally:
+        heartbeat.stop()
+
+
+def retry_job(job_id: int) -> bool:
+    """Requeue a FAILED job; it resumes from its last checkpoint."""
+    with Session(write_engine) as s:
+        res = s.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == FAILED)
+            .values(status=QUEUED, error=None, finished_at=None)
+        )
+        s.commit()
+    if res.rowcount != 1:
+        return False
+    _submit(job_id)
+    return True
+
+
+# ---------- Streamlit helper ----------
+def render_job_status(job_id: int) -> None:
+    """Show a job's state; keeps polling (via rerun) until it finishes."""
+    job = get_job(job_id)
+    if job is None:
+        st.warning(f"Job #{job_id} not found.")
+        return
+
+    if job.status in (QUEUED, RUNNING):
+        # picks up jobs nobody dispatched yet (e.g. QUEUED before a restart)
+        dispatch_jobs()
+        label = "Queued…" if job.status == QUEUED else f"Transcribing… {job.progress:.0%}"
+        st.progress(job.progress or 0.0, text=f"Job #{job.id} — {label}")
+        st.caption("You can leave this page; the transcript is saved to the meeting when done.")
+        partial = partial_transcript(job.id)
+        if partial:
+            with st.expander("Transcript so far"):
+                st.write(partial[-5000:])
+        time.sleep(POLL_INTERVAL)
+        st.rerun()
+
+    elif job.status == FAILED:
+        st.error(f"Job #{job.id} failed: {job.error}")
+        if st.button("🔁 Retry (resumes from last checkpoint)", key=f"retry_job_{job.id}"):
+            retry_job(job.id)
+            st.rerun()
+
+    else:
+        m = get_meeting(job.meeting_id) if job.meeting_id is not None else None
+        text = (m.transcript_text if m else "") or ""
+        st.success(f"Job #{job.id} complete — saved to meeting #{job.meeting_id}.")
+        st.text_area("Final Transcript", text, height=240)
+        st.download_button(
+            "💾 Download transcript.txt",
+            data=text.encode("utf-8"),
+            file_name="transcript.txt",
+            mime="text/plain",
+        )
+
+
+# ---------- Standalone worker ----------
+def main(poll_interval: float = 2.0) -> None:
+    """Drain the queue without a Streamlit server: `python -m Interface.jobs`."""
+    print(f"👷 Job worker started (db: {engine.url.database})")
+    while True:
+        requeue_stale_jobs()
+        job = _next_queued()
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+        print(f"▶️ Job #{job.id}: {job.audio_path}")
+        run_job(job.id)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,152 @@
 # Interface/knowledge.py
 from __future__ import annotations
-from typing import List
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 import re
 import streamlit as st
 
 
 # ---------- NLP helpers ----------
+# The transcript is split into sentences once; each sentence is then checked
+# with one compiled pattern per cue kind. Cue checks stop once the lists they
+# feed are full, so a long transcript costs little more than the split.
+ACTION_CUES = (
+    "action", "todo", "follow up", "follow-up", "assign",
+    "deadline", "next step", "will", "task", "owner"
+)
+POINT_SYMBOLS = (":", "-", "•")
+MAX_POINTS, MAX_ACTIONS, FALLBACK_POINTS, SUMMARY_SENTENCES = 10, 10, 5, 3
+# Bump when the output of analyze() changes: scripts/reanalyze_meetings.py
+# re-runs every meeting analyzed with an older version
+EXTRACTOR_VERSION = 1
+
+_SENTENCE_END = re.compile(r"[\n\.!?]+")
+_ACTION_CUE = re.compile("|".join(re.escape(c) for c in sorted(ACTION_CUES, key=len, reverse=True)))
+_POINT_SYMBOL = re.compile("[" + re.escape("".join(POINT_SYMBOLS)) + "]")
+
+
+@dataclass
+class Analysis:
+    key_points: List[str]
+    action_items: List[str]
+    summary: str
+
+
+class _Collector:
+    """Keeps only what the results need: bounded lists and the last few sentences."""
+
+    def __init__(self):
+        self.points: List[str] = []
+        self.actions: List[str] = []
+        self.head: List[str] = []  # first non-empty sentences (key point fallback, summary)
+        self.tail: deque = deque(maxlen=SUMMARY_SENTENCES)
+
+    def add(self, sentence: str) -> None:
+        s = sentence.strip()
+        if not s:
+            return
+        if len(self.points) < MAX_POINTS and len(s) > 8 and _POINT_SYMBOL.search(s):
+            self.points.append(s)
+        if len(self.actions) < MAX_ACTIONS and _ACTION_CUE.search(s.lower()):
+            self.actions.append(s)
+        if len(self.head) < FALLBACK_POINTS:
+            self.head.append(s)
+        self.tail.append(s)
+
+    def result(self) -> Analysis:
+        summary = ""
+        if self.head:
+            first = " ".join(self.head[:SUMMARY_SENTENCES])
+            summary = (first + "\n\n...\n\n" + " ".join(self.tail)).strip()
+        return Analysis(
+            key_points=list(self.points) or list(self.head),
+            action_items=list(self.actions),
+            summary=summary,
+        )
+
+
+def _scan(text: str, out: _Collector, final: bool = True) -> int:
+    """
+    Feed the sentences of `text` to `out`. Unless `final`, the text after the
+    last sentence end is held back; returns the offset where it starts.
+    """
+    sentences = _SENTENCE_END.split(text)
+    held = "" if final else sentences.pop()
+    for sentence in sentences:
+        out.add(sentence)
+    return len(text) - len(held)
+
+
+def analyze(transcript: str) -> Analysis:
+    """Key points, action items and summary from one pass over the transcript."""
+    out = _Collector()
+    _scan(transcript, out)
+    return out.result()
+
+
+class KnowledgeStream:
+    """
+    analyze() for text that arrives in pieces (transcribe_stream tokens or
+    OnlineASRProcessor's committed segments). Each complete sentence is
+    analyzed once, when its end arrives; only the unfinished sentence is
+    buffered. finish() gives the same Analysis as analyze() on the joined text.
+    """
+
+    def __init__(self):
+        self._out = _Collector()
+        self._pending: List[str] = []  # the sentence still being spoken
+        self._needs_space = False
+
+    def push(self, text: str) -> List[str]:
+        """Add raw text; returns the action items it completed (usually none)."""
+        if not text:
+            return []
+        self._needs_space = not text[-1].isspace()
+        if not _SENTENCE_END.search(text):
+            self._pending.append(text)
+            return []
+        seen = len(self._out.actions)
+        buffered = "".join(self._pending) + text
+        rest = _scan(buffered, self._out, final=False)
+        self._pending = [buffered[rest:]]
+        return self._out.actions[seen:]
+
+    def push_segment(self, segment: Tuple[Optional[float], Optional[float], str]) -> List[str]:
+        """Add a committed (start, end, text) segment, word-separated from the previous one."""
+        text = segment[2]
+        if text and self._needs_space and not text[0].isspace():
+            text = " " + text
+        return self.push(text)
+
+    @property
+    def action_items(self) -> List[str]:
+        return list(self._out.actions)
+
+    @property
+    def key_points(self) -> List[str]:
+        return list(self._out.points)
+
+    def finish(self) -> Analysis:
+        """Analyze the last, unterminated sentence and return the result."""
+        _scan("".join(self._pending), self._out)
+        self._pending = []
+        return self._out.result()
+
+
 def extract_key_points(transcript: str) -> List[str]:
     """Return structured key points based on bullet/colon/symbol cues."""
-    sents = re.split(r"[\n\.!?]+", transcript)
-    points = [
-        s.strip()
-        for s in sents
-        if any(sym in s for sym in (":", "-", "•")) and len(s.strip()) > 8
-    ]
-    return points[:10] or [s.strip() for s in sents if s.strip()][:5]
+    return analyze(transcript).key_points
 
 
 def extract_action_items(transcript: str) -> List[str]:
     """Identify tasks, responsibilities, and follow-ups (very naive rules)."""
-    sents = re.split(r"[\n\.!?]+", transcript)
-    cues = (
-        "action", "todo", "follow up", "follow-up", "assign",
-        "deadline", "next step", "will", "task", "owner"
-    )
-    actions = [s.strip() for s in sents if any(c in s.lower() for c in cues)]
-    return actions[:10]
+    return analyze(transcript).action_items
 
 
 def summarize_transcript(transcript: str) -> str:
     """Simple summary using the beginning and end of the transcript."""
-    sents = [s.strip() for s in re.split(r"[\n\.!?]+", transcript) if s.strip()]
-    if not sents:
-        return ""
-    first = " ".join(sents[:3]).strip()
-    last = " ".join(sents[-3:]).strip()
-    return (first + "\n\n...\n\n" + last).strip()
+    return analyze(transcript).summary
 
 
 # ---------- Page entry point ----------
@@ -59,9 +170,8 @@ def render():
             return
 
         with st.spinner("Analyzing…"):
-            points = extract_key_points(transcript)
-            actions = extract_action_items(transcript)
-            summary = summarize_transcript(transcript)
+            result = analyze(transcript)
+            points, actions, summary = result.key_points, result.action_items, result.summary
 
         # Results
         c1, c2 = st.columns(2)
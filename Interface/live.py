@@ -0,0 +1,103 @@
+# Interface/live.py
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+
+class LiveTranscriptView:
+    """
+    Throttled live transcript for Streamlit.
+
+    Tokens are buffered and flushed at most every `max_interval` seconds (or
+    once `max_batch_chars` are pending). Text is laid out in fixed-size pages,
+    each in its own placeholder, so a flush only re-sends the page being
+    written instead of the whole transcript. Only the last `max_pages` pages
+    stay on screen; older ones are paged out of the view (the full text is
+    still available via `text`).
+    """
+
+    def __init__(
+        self,
+        container=None,
+        title: str = "**Live Transcript**",
+        max_interval: float = 0.5,
+        max_batch_chars: int = 2000,
+        page_chars: int = 2000,
+        max_pages: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if container is None:
+            import streamlit as st
+            container = st.container()
+        self.max_interval = max_interval
+        self.max_batch_chars = max_batch_chars
+        self.page_chars = page_chars
+        self.clock = clock
+
+        container.markdown(title)
+        self._hidden_slot = container.empty()
+        self._slots = [container.empty() for _ in range(max_pages)]
+
+        self._chunks: List[str] = []          # everything, for the final transcript
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._pages: Deque[str] = deque([""], maxlen=max_pages)
+        self._hidden_chars = 0
+        self._last_flush = clock()
+
+        self.updates = 0          # placeholder writes sent to the browser
+        self.chars_sent = 0
+
+    # ----- input -----
+    def push(self, token: str) -> None:
+        self._pending.append(token)
+        self._pending_chars += len(token)
+        if (self._pending_chars >= self.max_batch_chars
+                or self.clock() - self._last_flush >= self.max_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        self._last_flush = self.clock()
+        if not self._pending:
+            return
+        batch = "".join(self._pending)
+        self._pending.clear()
+        self._pending_chars = 0
+        self._chunks.append(batch)
+
+        first_dirty = len(self._pages) - 1
+        self._pages[-1] += batch
+        shifted = False
+        if len(self._pages[-1]) >= self.page_chars:
+            # Page full: next flush starts a new one (pages break between tokens)
+            if len(self._pages) == self._pages.maxlen:
+                self._hidden_chars += len(self._pages[0])
+                shifted = True
+            self._pages.append("")
+
+        if shifted:
+            # Oldest page left the view: every slot now shows a different page
+            self._hidden_slot.caption(f"… {self._hidden_chars:,} earlier characters (see final transcript)")
+            self.updates += 1
+            first_dirty = 0
+        # Pages before the one being written are already on screen and unchanged
+        for i in range(first_dirty, len(self._pages)):
+            self._write(i)
+
+    def close(self) -> str:
+        """Flush whatever is pending and return the full transcript."""
+        self.flush()
+        return self.text
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks) + "".join(self._pending)
+
+    # ----- rendering -----
+    def _write(self, i: int) -> None:
+        page = self._pages[i]
+        self._slots[i].markdown(page)
+        self.updates += 1
+        self.chars_sent += len(page)
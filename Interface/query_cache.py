@@ -0,0 +1,168 @@
+# Interface/query_cache.py
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from Interface import storage
+
+
+# ---------- Settings ----------
+# How long a process trusts its last read of the shared data version. Writes
+# made by this process are seen at once; writes by other processes (the job
+# worker, another server) within VERSION_TTL seconds.
+VERSION_TTL = float(os.getenv("MEETSENSE_VERSION_TTL", "1.0"))
+MAX_ENTRIES = 256
+# Approximate memory budget for all entries; a result larger than
+# MAX_ENTRY_BYTES (e.g. an unpaged full-archive frame) is returned uncached
+MAX_BYTES = int(os.getenv("MEETSENSE_QUERY_CACHE_MB", "64")) * 1024 * 1024
+MAX_ENTRY_BYTES = MAX_BYTES // 8
+SIZE_SAMPLE = 16  # items measured to estimate a list's size
+
+_lock = threading.Lock()
+_entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (version, result, size)
+_version = {"value": None, "checked": 0.0}
+_held = {"bytes": 0, "version": None}  # size of _entries, and the version they were read at
+stats = {"hits": 0, "misses": 0, "version_reads": 0, "uncacheable": 0}
+
+
+# ---------- Version ----------
+def current_version() -> int:
+    now = time.monotonic()
+    with _lock:
+        if _version["value"] is not None and now - _version["checked"] < VERSION_TTL:
+            return _version["value"]
+    value = storage.data_version()
+    with _lock:
+        _version.update(value=value, checked=now)
+        stats["version_reads"] += 1
+    return value
+
+
+@storage.on_meetings_changed
+def _on_write() -> None:
+    # our own write bumped the version: re-read it on the next lookup
+    with _lock:
+        _version["checked"] = 0.0
+
+
+def clear() -> None:
+    with _lock:
+        _entries.clear()
+        _held["bytes"] = 0
+
+
+# ---------- Size ----------
+def _item_size(item) -> int:
+    fields = getattr(item, "__dict__", None)
+    if isinstance(item, dict):
+        fields = item
+    size = sys.getsizeof(item)
+    if fields is not None:
+        size += sum(sys.getsizeof(v) for v in fields.values())
+    return size
+
+
+def approx_size(result) -> int:
+    """Rough bytes held by a query result (frames exactly, lists/dicts by sampling)."""
+    if hasattr(result, "memory_usage"):  # pandas DataFrame
+        return int(result.memory_usage(index=True, deep=True).sum())
+    if isinstance(result, dict):
+        items = list(result.values())
+    elif isinstance(result, (list, tuple)):
+        items = result
+    else:
+        return _item_size(result)
+    if not items:
+        return sys.getsizeof(result)
+    sample = items[:SIZE_SAMPLE]
+    return sys.getsizeof(result) + sum(map(_item_size, sample)) * len(items) // len(sample)
+
+
+def _store(key, version: int, result) -> None:
+    """Insert under _lock, then evict least-recently-used entries over budget."""
+    size = approx_size(result)
+    if size > MAX_ENTRY_BYTES:
+        stats["uncacheable"] += 1
+        return
+    if _held["version"] != version:
+        if _held["version"] is not None and version < _held["version"]:
+            return  # read before a write another caller has already seen
+        _entries.clear()  # every entry is stale: free them now, not at eviction
+        _held.update(bytes=0, version=version)
+    old = _entries.pop(key, None)
+    if old is not None:
+        _held["bytes"] -= old[2]
+    _entries[key] = (version, result, size)
+    _held["bytes"] += size
+    while len(_entries) > MAX_ENTRIES or _held["bytes"] > MAX_BYTES:
+        _, (_, _, evicted) = _entries.popitem(last=False)
+        _held["bytes"] -= evicted
+
+
+# ---------- Keys ----------
+def _norm(value):
+    """Filter values that mean the same query get the same form (and key)."""
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    if isinstance(value, (list, tuple)):
+        return tuple(_norm(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _norm(v)) for k, v in value.items()))
+    return value
+
+
+def cached(fn: Callable) -> Callable:
+    """
+    Read-through cache for a query function. Arguments are bound to the
+    signature and normalized (strings stripped, "" -> None), so equivalent
+    calls share an entry; entries are valid while the data version is
+    unchanged. Results are shared between callers and must be treated as
+    read-only. The cache is bounded by MAX_ENTRIES and by MAX_BYTES of
+    (approximate) result size, so callers should page large listings.
+    """
+    sig = inspect.signature(fn)
+    name = f"{fn.__module__}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        params = {}
+        for k, v in bound.arguments.items():
+            if sig.parameters[k].kind is inspect.Parameter.VAR_KEYWORD:
+                params.update((kk, _norm(vv)) for kk, vv in v.items())
+            else:
+                params[k] = _norm(v)
+        key = (name, tuple(sorted(params.items())))
+        version = current_version()
+        with _lock:
+            hit = _entries.get(key)
+            if hit is not None and hit[0] == version:
+                _entries.move_to_end(key)
+                stats["hits"] += 1
+                return hit[1]
+            stats["misses"] += 1
+
+        result = fn(**params)
+        with _lock:
+            _store(key, version, result)
+        return result
+
+    wrapper.uncached = fn
+    return wrapper
+
+
+# ---------- Cached queries ----------
+list_meetings = cached(storage.list_meetings)
+search_meetings = cached(storage.search_meetings)
+get_meeting_row = cached(storage.get_meeting_row)  # metadata only: texts stay out of the cache
+list_meeting_rows = cached(storage.list_meeting_rows)
+meetings_frame = cached(storage.meetings_frame)
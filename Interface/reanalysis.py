@@ -0,0 +1,228 @@
+# Interface/reanalysis.py
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import sys
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import DateTime, Integer, LargeBinary, String, select, type_coerce
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, mapped_column, Session
+
+from Interface.db import register_schema
+from Interface.storage import Base, Meeting, MeetingText, engine, update_meetings, write_engine
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Analyzer name -> version. Bump a version when its output changes; the
+# knowledge one follows knowledge.EXTRACTOR_VERSION.
+ABSTRACTIVE_VERSION = 1
+CHUNK_SIZE = 200  # meetings per task and per write transaction
+
+
+def analyzer_version(analyzer: str) -> int:
+    if analyzer == "knowledge":
+        from Interface.knowledge import EXTRACTOR_VERSION
+        return EXTRACTOR_VERSION
+    if analyzer == "abstractive":
+        return ABSTRACTIVE_VERSION
+    raise ValueError(f"unknown analyzer {analyzer!r} (expected 'knowledge' or 'abstractive')")
+
+
+# ---------- Models ----------
+class MeetingAnalysis(Base):
+    """What a meeting's summary/key points/action items were last computed from."""
+    __tablename__ = "meeting_analysis"
+
+    meeting_id: Mapped[int] = mapped_column(primary_key=True)
+    analyzer: Mapped[str] = mapped_column(String(40))
+    version: Mapped[int] = mapped_column(Integer)
+    transcript_hash: Mapped[str] = mapped_column(String(64))
+    analyzed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+
+class ReanalysisRun(Base):
+    """Progress of a batch run; an unfinished run is resumed after its last written meeting."""
+    __tablename__ = "reanalysis_runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    analyzer: Mapped[str] = mapped_column(String(40))
+    version: Mapped[int] = mapped_column(Integer)
+    last_id: Mapped[int] = mapped_column(Integer, default=0)
+    analyzed: Mapped[int] = mapped_column(Integer, default=0)
+    skipped: Mapped[int] = mapped_column(Integer, default=0)
+    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+
+register_schema(
+    engine, "reanalysis", 1,
+    lambda con: Base.metadata.create_all(con, tables=[MeetingAnalysis.__table__, ReanalysisRun.__table__]),
+)
+
+
+# ---------- Worker side ----------
+_worker: Dict[str, object] = {}
+
+
+def _init_worker(analyzer: str) -> None:
+    """Load the analyzer once per process (the abstractive one loads a model)."""
+    _worker["analyzer"] = analyzer
+    if analyzer == "abstractive":
+        sys.path.append(PROJECT_ROOT)
+        from Transcription.process_transcript import make_summarizer
+        _worker["summarizer"] = make_summarizer()
+
+
+def _analyze(text: str) -> dict:
+    from Interface.knowledge import analyze
+
+    result = analyze(text)
+    fields = {
+        "summary": result.summary,
+        "key_points": "\n".join(result.key_points),
+        "action_items": "\n".join(result.action_items),
+    }
+    if _worker.get("analyzer") == "abstractive":
+        from Transcription.process_transcript import extract_bullets_from_summary, summarize_text
+
+        summary = summarize_text(_worker["summarizer"], text)
+        fields.update(summary=summary, key_points=extract_bullets_from_summary(summary))
+    return fields
+
+
+def _work(chunk: List[tuple], version: int) -> Tuple[List[tuple], int]:
+    """
+    chunk rows are (meeting_id, compressed transcript, stored analyzer,
+    stored version, stored hash). Returns ([(meeting_id, hash, fields)], skipped).
+    """
+    analyzer = _worker["analyzer"]
+    out, skipped = [], 0
+    for meeting_id, blob, done_by, done_version, done_hash in chunk:
+        text = zlib.decompress(blob).decode("utf-8") if blob else ""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        if not text.strip() or (done_by == analyzer and done_version == version and done_hash == digest):
+            skipped += 1
+            continue
+        out.append((meeting_id, digest, _analyze(text)))
+    return out, skipped
+
+
+# ---------- Driver ----------
+def _chunks(after: int, chunk_size: int):
+    """Meeting rows in id order, `chunk_size` at a time; transcripts stay compressed."""
+    blob = type_coerce(MeetingText.transcript_text, LargeBinary)
+    while True:
+        with Session(engine) as s:
+            rows = s.execute(
+                select(Meeting.id, blob, MeetingAnalysis.analyzer, MeetingAnalysis.version,
+                       MeetingAnalysis.transcript_hash)
+                .outerjoin(MeetingText, MeetingText.meeting_id == Meeting.id)
+                .outerjoin(MeetingAnalysis, MeetingAnalysis.meeting_id == Meeting.id)
+                .where(Meeting.id > after)
+                .order_by(Meeting.id)
+                .limit(chunk_size)
+            ).all()
+        if not rows:
+            return
+        after = rows[-1][0]
+        yield [tuple(r) for r in rows]
+
+
+def _start_run(s: Session, analyzer: str, version: int, restart: bool) -> ReanalysisRun:
+    run = None if restart else s.execute(
+        select(ReanalysisRun)
+        .where(ReanalysisRun.analyzer == analyzer, ReanalysisRun.version == version,
+               ReanalysisRun.finished_at.is_(None))
+        .order_by(ReanalysisRun.id.desc())
+        .limit(1)
+    ).scalar()
+    if run is None:
+        run = ReanalysisRun(analyzer=analyzer, version=version, last_id=0, analyzed=0, skipped=0)
+        s.add(run)
+        s.commit()
+    return run
+
+
+def reanalyze(
+    analyzer: str = "knowledge",
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    restart: bool = False,
+    on_batch: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Re-run `analyzer` over the archive in a process pool and write summary,
+    key points and action items back, one transaction per chunk. Meetings
+    whose transcript hash and analyzer version match their last analysis are
+    skipped. Each transaction also advances the run's cursor, so an
+    interrupted run continues where it stopped (unless `restart`).
+
+    Returns {"run", "resumed_from", "read", "analyzed", "skipped", "seconds", "meetings_per_sec"}.
+    """
+    version = analyzer_version(analyzer)
+    with Session(write_engine) as s:
+        run = _start_run(s, analyzer, version, restart)
+        run_id, start_after = run.id, run.last_id
+        done = {"analyzed": run.analyzed, "skipped": run.skipped}
+
+    stats = {"run": run_id, "resumed_from": start_after, "read": 0, "analyzed": 0, "skipped": 0}
+    t0 = time.perf_counter()
+
+    def write(chunk: List[tuple], results: List[tuple], skipped: int) -> None:
+        last_id = chunk[-1][0]
+        done["analyzed"] += len(results)
+        done["skipped"] += skipped
+
+        def record(s: Session) -> None:
+            if results:
+                stmt = sqlite_insert(MeetingAnalysis)
+                s.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=["meeting_id"],
+                        set_={k: getattr(stmt.excluded, k)
+                              for k in ("analyzer", "version", "transcript_hash", "analyzed_at")},
+                    ),
+                    [dict(meeting_id=i, analyzer=analyzer, version=version, transcript_hash=h,
+                          analyzed_at=datetime.now()) for i, h, _ in results],
+                )
+            row = s.get(ReanalysisRun, run_id)
+            row.last_id, row.analyzed, row.skipped = last_id, done["analyzed"], done["skipped"]
+
+        update_meetings(((i, fields) for i, _, fields in results), before_commit=record)
+        stats["read"] += len(chunk)
+        stats["analyzed"] += len(results)
+        stats["skipped"] += skipped
+        if on_batch:
+            elapsed = time.perf_counter() - t0
+            on_batch(dict(stats, last_id=last_id, meetings_per_sec=stats["read"] / elapsed if elapsed else 0.0))
+
+    workers = workers or os.cpu_count() or 1
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=_init_worker, initargs=(analyzer,)) as pool:
+        # a few chunks in flight per worker; results are written in id order
+        in_flight: deque = deque()
+        for chunk in _chunks(start_after, chunk_size):
+            in_flight.append((chunk, pool.submit(_work, chunk, version)))
+            if len(in_flight) >= 2 * workers:
+                chunk, fut = in_flight.popleft()
+                write(chunk, *fut.result())
+        while in_flight:
+            chunk, fut = in_flight.popleft()
+            write(chunk, *fut.result())
+
+    with Session(write_engine) as s:
+        s.get(ReanalysisRun, run_id).finished_at = datetime.now()
+        s.commit()
+
+    stats["seconds"] = time.perf_counter() - t0
+    stats["meetings_per_sec"] = stats["read"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
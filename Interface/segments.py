@@ -0,0 +1,177 @@
+# Interface/segments.py
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Float, Index, LargeBinary, Text, delete, func, select, tuple_
+from sqlalchemy.orm import Mapped, mapped_column, Session
+
+from Interface.db import register_schema
+from Interface.storage import Base, engine, write_engine
+
+
+# Words are grouped into segments at pauses or after this many words
+MAX_GAP = 1.0
+MAX_WORDS = 40
+
+Word = Tuple[float, float, str]
+
+
+# ---------- Model ----------
+class MeetingSegment(Base):
+    """
+    A run of timestamped words. Word times are packed into `word_times` as
+    float32 pairs (start, end), aligned with the space-separated words of `text`.
+    """
+    __tablename__ = "meeting_segments"
+    __table_args__ = (Index("ix_meeting_segments_meeting_start", "meeting_id", "start"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    meeting_id: Mapped[int] = mapped_column()
+    seq: Mapped[int] = mapped_column()
+    start: Mapped[float] = mapped_column(Float)
+    end: Mapped[float] = mapped_column(Float)
+    speech: Mapped[float] = mapped_column(Float)  # sum of word durations
+    text: Mapped[str] = mapped_column(Text)
+    word_times: Mapped[bytes] = mapped_column(LargeBinary)
+
+    def words(self) -> List[Word]:
+        times = array("f")
+        times.frombytes(self.word_times)
+        return [(times[2 * i], times[2 * i + 1], w) for i, w in enumerate(self.text.split(" "))]
+
+
+register_schema(engine, "segments", 1, lambda con: Base.metadata.create_all(con, tables=[MeetingSegment.__table__]))
+
+
+# ---------- Write ----------
+def _group(words: Sequence[Word]) -> List[List[Word]]:
+    groups: List[List[Word]] = []
+    for w in words:
+        cur = groups[-1] if groups else None
+        if cur is None or len(cur) >= MAX_WORDS or w[0] - cur[-1][1] > MAX_GAP:
+            groups.append([w])
+        else:
+            cur.append(w)
+    return groups
+
+
+def save_segments(meeting_id: int, words: Iterable[Sequence]) -> int:
+    """
+    Replace the meeting's segments with `words`: (start, end, word) tuples as
+    produced by asr.transcribe_words or OnlineASRProcessor.commited. Words
+    without timestamps are skipped. Returns the number of segments stored.
+    """
+    timed = [
+        (float(b), float(e), str(w).strip().replace(" ", "\u00a0"))  # keep text and times aligned
+        for b, e, w in words
+        if b is not None and e is not None and str(w).strip()
+    ]
+    rows = []
+    for seq, group in enumerate(_group(timed)):
+        times = array("f")
+        for b, e, _ in group:
+            times.extend((b, e))
+        rows.append(MeetingSegment(
+            meeting_id=meeting_id,
+            seq=seq,
+            start=group[0][0],
+            end=group[-1][1],
+            speech=sum(e - b for b, e, _ in group),
+            text=" ".join(w for _, _, w in group),
+            word_times=times.tobytes(),
+        ))
+
+    with Session(write_engine) as s:
+        s.execute(delete(MeetingSegment).where(MeetingSegment.meeting_id == meeting_id))
+        s.add_all(rows)
+        s.commit()
+    return len(rows)
+
+
+# ---------- Read ----------
+def get_segments(
+    meeting_id: int,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> List[MeetingSegment]:
+    """Segments overlapping [start, end] seconds (whole meeting if both are None)."""
+    stmt = select(MeetingSegment).where(MeetingSegment.meeting_id == meeting_id)
+    if end is not None:
+        stmt = stmt.where(MeetingSegment.start <= end)
+    if start is not None:
+        stmt = stmt.where(MeetingSegment.end >= start)
+    with Session(engine) as s:
+        return list(s.execute(stmt.order_by(MeetingSegment.start)).scalars().all())
+
+
+def page_segments(
+    meeting_id: int,
+    after: Optional[Tuple[float, int]] = None,
+    limit: int = 50,
+) -> List[MeetingSegment]:
+    """
+    Next `limit` segments in time order, for incremental display. Pass
+    `after=(seg.start, seg.id)` of the last segment shown to continue.
+    """
+    stmt = select(MeetingSegment).where(MeetingSegment.meeting_id == meeting_id)
+    if after is not None:
+        stmt = stmt.where(tuple_(MeetingSegment.start, MeetingSegment.id) > tuple_(*after))
+    stmt = stmt.order_by(MeetingSegment.start, MeetingSegment.id).limit(limit)
+    with Session(engine) as s:
+        return list(s.execute(stmt).scalars().all())
+
+
+def get_words(meeting_id: int, start: float, end: float) -> List[Word]:
+    """Words whose timing overlaps [start, end] seconds."""
+    return [
+        w
+        for seg in get_segments(meeting_id, start, end)
+        for w in seg.words()
+        if w[1] >= start and w[0] <= end
+    ]
+
+
+def seek(meeting_id: int, query: str) -> Optional[float]:
+    """
+    Audio offset (seconds) of the first word of the first occurrence of `query`
+    in the meeting, e.g. to jump to a search_meetings() hit. None if not found.
+    """
+    q = query.strip()
+    if not q:
+        return None
+    stmt = (
+        select(MeetingSegment)
+        .where(MeetingSegment.meeting_id == meeting_id,
+               MeetingSegment.text.contains(q, autoescape=True))
+        .order_by(MeetingSegment.start)
+        .limit(1)
+    )
+    with Session(engine) as s:
+        seg = s.execute(stmt).scalars().first()
+    if seg is None:
+        return None
+    first = q.split()[0].lower()
+    for b, _, w in seg.words():
+        if first in w.lower():
+            return b
+    return seg.start
+
+
+def speaking_time(meeting_ids: Optional[Sequence[int]] = None) -> Dict[int, float]:
+    """Seconds of speech per meeting (sum of word durations), computed in SQL."""
+    stmt = select(MeetingSegment.meeting_id, func.sum(MeetingSegment.speech)).group_by(
+        MeetingSegment.meeting_id
+    )
+    if meeting_ids is not None:
+        stmt = stmt.where(MeetingSegment.meeting_id.in_(list(meeting_ids)))
+    with Session(engine) as s:
+        return {mid: float(total or 0.0) for mid, total in s.execute(stmt).all()}
+
+
+def format_offset(seconds: float) -> str:
+    """'H:MM:SS' / 'M:SS' label for an audio offset."""
+    m, sec = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
+    return f"{h}:{m:02d}:{sec:02d}" if h else f"{m}:{sec:02d}"
@@ -1,15 +1,25 @@
 # Interface/storage.py
 from __future__ import annotations
 
+import hashlib
 import os
 import re
 import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, List
+from typing import Callable, Iterable, Optional, List, Tuple
 
 import streamlit as st
-from sqlalchemy import create_engine, select, String, DateTime, Text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, Session
+from sqlalchemy import (
+    event, func, insert, select, text, tuple_, type_coerce, ForeignKey, Index, LargeBinary, String, DateTime, TypeDecorator,
+)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, selectinload, Session, load_only
+
+from Interface.db import get_engine, register_schema, writer
 
 
 # ---------- Setup ----------
@@ -24,6 +34,37 @@ class Base(DeclarativeBase):
     pass
 
 
+class CompressedText(TypeDecorator):
+    """Text stored as a zlib-compressed BLOB (see inflate() for the SQL side)."""
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else zlib.compress(value.encode("utf-8"), ZLIB_LEVEL)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else zlib.decompress(value).decode("utf-8")
+
+
+ZLIB_LEVEL = 6
+# Large per-meeting text, kept off-row in meeting_texts and loaded only by get_meeting()
+TEXT_COLUMNS = ("transcript_text", "summary", "key_points", "action_items")
+
+
+def _text_field(name: str) -> property:
+    def fget(self):
+        return getattr(self.body, name) if self.body is not None else None
+
+    def fset(self, value):
+        if self.body is None:
+            if value is None:
+                return
+            self.body = MeetingText()
+        setattr(self.body, name, value)
+
+    return property(fget, fset, doc=f"{name} (stored compressed in meeting_texts)")
+
+
 class Meeting(Base):
     __tablename__ = "meetings"
 
@@ -33,44 +74,315 @@ class Meeting(Base):
     occurred_at: Mapped[datetime] = mapped_column(DateTime, index=True)
     audio_path: Mapped[Optional[str]] = mapped_column(String(1024))
     transcript_path: Mapped[Optional[str]] = mapped_column(String(1024))
-    transcript_text: Mapped[Optional[str]] = mapped_column(Text)
-    summary: Mapped[Optional[str]] = mapped_column(Text)
-    key_points: Mapped[Optional[str]] = mapped_column(Text)
-    action_items: Mapped[Optional[str]] = mapped_column(Text)
     status: Mapped[Optional[str]] = mapped_column(String(50), default="UNUSED", index=True)
     department: Mapped[Optional[str]] = mapped_column(String(120), index=True)
     owner: Mapped[Optional[str]] = mapped_column(String(120), index=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), index=True)
+
+    body: Mapped[Optional["MeetingText"]] = relationship(
+        back_populates="meeting", uselist=False, cascade="all, delete-orphan"
+    )
+
+    transcript_text = _text_field("transcript_text")
+    summary = _text_field("summary")
+    key_points = _text_field("key_points")
+    action_items = _text_field("action_items")
+
+
+# lets status-filtered listings (upper(status) = ?, see _filtered) walk the
+# date order without a sort step
+Index("ix_meetings_status_upper_occurred_at", func.upper(Meeting.status), Meeting.occurred_at)
+
+
+class MeetingText(Base):
+    __tablename__ = "meeting_texts"
+
+    meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id", ondelete="CASCADE"), primary_key=True)
+    transcript_text: Mapped[Optional[str]] = mapped_column(CompressedText)
+    summary: Mapped[Optional[str]] = mapped_column(CompressedText)
+    key_points: Mapped[Optional[str]] = mapped_column(CompressedText)
+    action_items: Mapped[Optional[str]] = mapped_column(CompressedText)
+
+    meeting: Mapped[Meeting] = relationship(back_populates="body")
+
+
+class DataVersion(Base):
+    """Counter bumped by every meetings write; lets any process tell whether cached reads are stale."""
+    __tablename__ = "data_version"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(default=0)
 
 
 # ---------- DB Init ----------
-engine = create_engine(f"sqlite:///{DB_PATH}", future=True)
-Base.metadata.create_all(engine)
+# Shared, WAL-tuned engine (Interface/db.py); write sessions use write_engine.
+# Nothing connects at import: the schema is checked on first use (see SCHEMA_VERSION).
+engine = get_engine(DB_PATH)
+write_engine = writer(engine)
+
+
+def _inflate(blob):
+    return None if blob is None else zlib.decompress(blob).decode("utf-8")
+
 
+@event.listens_for(engine, "connect")
+def _register_functions(dbapi_con, _record):
+    # lets SQL (the FTS content view) read CompressedText columns
+    dbapi_con.create_function("inflate", 1, _inflate, deterministic=True)
 
-def _ensure_columns() -> None:
+
+def _ensure_columns(con) -> None:
     """
     Add new columns without migrations (dev-friendly). Idempotent.
     """
-    with sqlite3.connect(DB_PATH) as con:
-        cur = con.cursor()
-        cur.execute("PRAGMA table_info(meetings)")
-        existing = {row[1] for row in cur.fetchall()}
+    existing = {row[1] for row in con.exec_driver_sql("PRAGMA table_info(meetings)")}
+
+    wanted = [
+        ("status", "TEXT", "'UNUSED'"),
+        ("department", "TEXT", "NULL"),
+        ("owner", "TEXT", "NULL"),
+        ("content_hash", "TEXT", "NULL"),
+    ]
+    for name, typ, default in wanted:
+        if name not in existing:
+            con.exec_driver_sql(f"ALTER TABLE meetings ADD COLUMN {name} {typ} DEFAULT {default}")
+        # columns added by ALTER miss the indexes create_all would have made
+        con.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS ix_meetings_{name} ON meetings ({name})")
+    # the status filter compares upper(status), which (status, occurred_at) can't serve
+    con.exec_driver_sql("DROP INDEX IF EXISTS ix_meetings_status_occurred_at")
+    con.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_meetings_status_upper_occurred_at ON meetings (upper(status), occurred_at)"
+    )
+
+
+def _migrate_inline_texts(con, chunk: int = 500) -> None:
+    """
+    Older databases keep TEXT_COLUMNS inline in meetings: compress them into
+    meeting_texts, then drop them (or blank them on SQLite < 3.35). Idempotent.
+    """
+    existing = {row[1] for row in con.exec_driver_sql("PRAGMA table_info(meetings)")}
+    inline = [c for c in TEXT_COLUMNS if c in existing]
+    if not inline:
+        return
+    ins = insert(MeetingText).prefix_with("OR REPLACE")
+    rows = con.exec_driver_sql(f"SELECT id, {', '.join(inline)} FROM meetings")
+    while True:
+        batch = rows.fetchmany(chunk)
+        if not batch:
+            break
+        values = [dict(zip(["meeting_id", *inline], r)) for r in batch if any(r[1:])]
+        if values:
+            con.execute(ins, values)
+    for c in inline:
+        try:
+            con.exec_driver_sql(f"ALTER TABLE meetings DROP COLUMN {c}")
+        except OperationalError:
+            con.exec_driver_sql(f"UPDATE meetings SET {c} = NULL")
+    # the old FTS table held its own copy of the text; recreate it over the view
+    con.exec_driver_sql("DROP TABLE IF EXISTS meetings_fts")
+
+
+# ---------- Full-text search (FTS5) ----------
+# Columns indexed for search; rowid of the FTS row is the meeting id
+FTS_COLUMNS = ("name", "transcript_text", "summary", "key_points", "action_items")
+# bm25 column weights, same order as FTS_COLUMNS
+FTS_WEIGHTS = (5.0, 1.0, 3.0, 2.0, 2.0)
+
+
+def _ensure_fts(con) -> bool:
+    """
+    Create the meetings_fts table if missing (and fill it from existing rows).
+    It is an external-content index over the meetings_fts_source view, so the
+    text is not stored a second time; snippets decompress it on demand.
+    Returns False if this SQLite build has no FTS5.
+    """
+    exists = con.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='meetings_fts'"
+    ).first()
+    if exists:
+        return True
+    con.exec_driver_sql("DROP VIEW IF EXISTS meetings_fts_source")
+    con.exec_driver_sql(
+        "CREATE VIEW meetings_fts_source AS SELECT m.id AS id, m.name AS name, "
+        + ", ".join(f"inflate(t.{c}) AS {c}" for c in TEXT_COLUMNS)
+        + " FROM meetings m LEFT JOIN meeting_texts t ON t.meeting_id = m.id"
+    )
+    try:
+        con.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE meetings_fts USING fts5({', '.join(FTS_COLUMNS)}, "
+            "content='meetings_fts_source', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+    except OperationalError:
+        return False
+    con.exec_driver_sql(_FTS_REBUILD_SQL)
+    return True
+
+
+_FTS_REBUILD_SQL = "INSERT INTO meetings_fts(meetings_fts) VALUES ('rebuild')"
+_FTS_INSERT_SQL = (
+    f"INSERT INTO meetings_fts(rowid, {', '.join(FTS_COLUMNS)}) "
+    f"VALUES (:id, {', '.join(':' + c for c in FTS_COLUMNS)})"
+)
+_fts: dict = {}
+
+
+def fts_enabled() -> bool:
+    """Whether the search index exists (False if this SQLite build has no FTS5)."""
+    if "enabled" not in _fts:
+        with engine.connect() as con:
+            _fts["enabled"] = con.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='meetings_fts'"
+            ).first() is not None
+    return _fts["enabled"]
+
+
+def _backfill_content_hash(con, chunk: int = 500) -> None:
+    """Hash the transcripts of meetings stored before content_hash was kept up to date."""
+    after = 0
+    while True:
+        rows = con.exec_driver_sql(
+            "SELECT m.id, t.transcript_text FROM meetings m JOIN meeting_texts t ON t.meeting_id = m.id "
+            "WHERE m.id > ? AND m.content_hash IS NULL AND t.transcript_text IS NOT NULL "
+            "ORDER BY m.id LIMIT ?",
+            (after, chunk),
+        ).all()
+        if not rows:
+            return
+        after = rows[-1][0]
+        values = [(content_hash(_inflate(blob)), i) for i, blob in rows]
+        con.exec_driver_sql("UPDATE meetings SET content_hash = ? WHERE id = ?", values)
+
+
+# Bump when _init_schema changes; databases at an older version re-run it once
+SCHEMA_VERSION = 4
+
+
+def _init_schema(con) -> None:
+    Base.metadata.create_all(con, tables=[Meeting.__table__, MeetingText.__table__, DataVersion.__table__])
+    _ensure_columns(con)
+    _migrate_inline_texts(con)
+    _backfill_content_hash(con)
+    con.exec_driver_sql("INSERT OR IGNORE INTO data_version (name, version) VALUES ('meetings', 0)")
+    _fts["enabled"] = _ensure_fts(con)
+
+
+register_schema(engine, "meetings", SCHEMA_VERSION, _init_schema)
+
+
+def _index_meeting(s: Session, m: Meeting, old: Optional[dict] = None) -> None:
+    """
+    (Re)index one meeting inside the caller's transaction. External-content FTS
+    needs the previously indexed values (`old`) to remove a row's old terms.
+    """
+    if not fts_enabled():
+        return
+    if old is not None:
+        s.execute(
+            text(f"INSERT INTO meetings_fts(meetings_fts, rowid, {', '.join(FTS_COLUMNS)}) "
+                 f"VALUES ('delete', :id, {', '.join(':' + c for c in FTS_COLUMNS)})"),
+            {"id": m.id, **old},
+        )
+    s.execute(text(_FTS_INSERT_SQL), {"id": m.id, **{c: getattr(m, c) for c in FTS_COLUMNS}})
+
+
+def rebuild_search_index() -> int:
+    """Re-create the search index from the stored meetings. Returns rows indexed."""
+    if not fts_enabled():
+        raise RuntimeError("SQLite was built without FTS5; full-text search is unavailable")
+    with Session(write_engine) as s:
+        s.execute(text(_FTS_REBUILD_SQL))
+        s.execute(text("INSERT INTO meetings_fts(meetings_fts) VALUES ('optimize')"))
+        n = s.execute(text("SELECT count(*) FROM meetings")).scalar_one()
+        s.commit()
+        return n
 
-        wanted = [
-            ("status", "TEXT", "'UNUSED'"),
-            ("department", "TEXT", "NULL"),
-            ("owner", "TEXT", "NULL"),
-        ]
-        for name, typ, default in wanted:
-            if name not in existing:
-                cur.execute(f"ALTER TABLE meetings ADD COLUMN {name} {typ} DEFAULT {default}")
-        con.commit()
 
+def _fts_query(query: str) -> str:
+    """Quote each term so user input can't hit FTS syntax errors; last term matches as a prefix."""
+    terms = ['"' + t.replace('"', '""') + '"' for t in query.split()]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
 
-_ensure_columns()
+
+def search_meetings(query: str, limit: int = 20, raw: bool = False) -> List[dict]:
+    """
+    Ranked full-text search over name, transcript, summary, key points and action items.
+
+    Returns dicts with meeting_id, name, occurred_at, rank (lower is better) and a
+    snippet where matches are wrapped in ** for markdown. Pass raw=True to use
+    FTS5 query syntax directly (AND/OR/NEAR, "phrases", column filters).
+    """
+    if not fts_enabled():
+        raise RuntimeError("SQLite was built without FTS5; full-text search is unavailable")
+    match = query if raw else _fts_query(query)
+    if not match:
+        return []
+    weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+    # ordering by FTS5's own rank column lets it sort internally, so snippet()
+    # (which decompresses the text) only runs for the returned rows
+    sql = text(
+        "SELECT m.id, m.name, m.occurred_at, meetings_fts.rank, "
+        "snippet(meetings_fts, -1, '**', '**', ' … ', 16) "
+        "FROM meetings_fts CROSS JOIN meetings m ON m.id = meetings_fts.rowid "
+        "WHERE meetings_fts MATCH :q AND meetings_fts.rank MATCH :rank "
+        "ORDER BY meetings_fts.rank LIMIT :limit"
+    )
+    with Session(engine) as s:
+        rows = s.execute(sql, {"q": match, "rank": f"bm25({weights})", "limit": limit}).all()
+    return [
+        {
+            "meeting_id": r[0],
+            "name": r[1],
+            # raw SQL bypasses the ORM's DateTime conversion
+            "occurred_at": datetime.fromisoformat(r[2]) if isinstance(r[2], str) else r[2],
+            "rank": r[3],
+            "snippet": r[4],
+        }
+        for r in rows
+    ]
+
+
+# ---------- Write notifications ----------
+def _bump_version(s: Session) -> None:
+    """Call inside every transaction that writes meetings (see query_cache)."""
+    s.execute(text("UPDATE data_version SET version = version + 1 WHERE name = 'meetings'"))
+
+
+def data_version() -> int:
+    """Current meetings write version (shared by all processes using the database)."""
+    with engine.connect() as con:
+        return con.exec_driver_sql("SELECT version FROM data_version WHERE name = 'meetings'").scalar_one()
+
+
+# Callbacks run after this process committed a meetings write
+_write_listeners: List[Callable[[], None]] = []
+
+
+def on_meetings_changed(fn: Callable[[], None]) -> Callable:
+    """Register `fn()` to be called after meetings are written (usable as a decorator)."""
+    _write_listeners.append(fn)
+    return fn
+
+
+def _notify() -> None:
+    for fn in _write_listeners:
+        fn()
 
 
 # ---------- Functions ----------
+def content_hash(transcript_text: Optional[str]) -> Optional[str]:
+    """Dedup key of a meeting: sha256 of its whitespace-normalized transcript."""
+    norm = " ".join((transcript_text or "").split())
+    return hashlib.sha256(norm.encode("utf-8")).hexdigest() if norm else None
+
+
+def _local_naive(dt: datetime) -> datetime:
+    """Timestamps are stored as naive local time; convert ones with a UTC offset."""
+    return dt.astimezone().replace(tzinfo=None) if dt.tzinfo is not None else dt
+
+
 def upsert_meeting(**fields) -> Meeting:
     # Ensure a datetime object for occurred_at if a string is passed
     if "occurred_at" in fields and isinstance(fields["occurred_at"], str):
@@ -82,31 +394,274 @@ def upsert_meeting(**fields) -> Meeting:
             # Try tolerant parse: keep only digits, dashes, colons and spaces
             s2 = re.sub(r"[^\d\-\:\sT]", "", s).replace("T", " ")
             fields["occurred_at"] = datetime.fromisoformat(s2)
-
-    with Session(engine) as s:
+    if isinstance(fields.get("occurred_at"), datetime):
+        fields["occurred_at"] = _local_naive(fields["occurred_at"])
+    fields.setdefault("content_hash", content_hash(fields.get("transcript_text")))
+    # imported before the write lock is taken
+    from Interface.actions import save_action_items
+    from Interface.analytics import record_meeting
+
+    with Session(write_engine) as s:
         m = Meeting(**fields)
         s.add(m)
+        s.flush()
+        _index_meeting(s, m)
+        save_action_items(s, m)
+        record_meeting(s, m)
+        _bump_version(s)
         s.commit()
         s.refresh(m)
-        return m
+        m.body  # load the texts before the session closes
+    _notify()
+    return m
+
+
+def _update(s: Session, meeting_id: int, fields: dict, save_action_items, record_meeting) -> Meeting:
+    """Apply `fields` to one meeting and its index/derived rows inside `s`."""
+    m = s.get(Meeting, meeting_id)
+    if not m:
+        raise ValueError(f"Meeting {meeting_id} not found")
+
+    reindex = any(k in FTS_COLUMNS for k in fields)
+    old = {c: getattr(m, c) for c in FTS_COLUMNS} if reindex else None
+    for k, v in fields.items():
+        if hasattr(m, k):
+            setattr(m, k, v)
+    if "transcript_text" in fields and "content_hash" not in fields:
+        m.content_hash = content_hash(m.transcript_text)
+
+    if reindex:
+        _index_meeting(s, m, old)
+    if any(k in fields for k in ("action_items", "owner", "occurred_at")):
+        save_action_items(s, m)
+    record_meeting(s, m, changed=fields)
+    return m
 
 
 def update_meeting(meeting_id: int, **fields) -> Meeting:
     if "occurred_at" in fields and isinstance(fields["occurred_at"], str):
         fields["occurred_at"] = datetime.fromisoformat(fields["occurred_at"])
+    from Interface.actions import save_action_items
+    from Interface.analytics import record_meeting
 
-    with Session(engine) as s:
-        m = s.get(Meeting, meeting_id)
-        if not m:
-            raise ValueError(f"Meeting {meeting_id} not found")
+    with Session(write_engine) as s:
+        m = _update(s, meeting_id, fields, save_action_items, record_meeting)
+        _bump_version(s)
+        s.commit()
+        s.refresh(m)
+        m.body
+    _notify()
+    return m
 
-        for k, v in fields.items():
-            if hasattr(m, k):
-                setattr(m, k, v)
 
+def update_meetings(
+    changes: Iterable[Tuple[int, dict]],
+    before_commit: Optional[Callable[[Session], None]] = None,
+) -> int:
+    """
+    update_meeting for many meetings in one transaction: `changes` are
+    (meeting_id, fields) pairs. `before_commit(s)` may write more rows in
+    the same transaction. Returns the number of meetings updated.
+    """
+    from Interface.actions import save_action_items
+    from Interface.analytics import record_meeting
+
+    changes = list(changes)
+    with Session(write_engine) as s:
+        # one query puts every meeting and its texts in the identity map
+        ids = [meeting_id for meeting_id, _ in changes]
+        for i in range(0, len(ids), 500):
+            s.execute(
+                select(Meeting).options(selectinload(Meeting.body)).where(Meeting.id.in_(ids[i:i + 500]))
+            ).scalars().all()
+        for meeting_id, fields in changes:
+            _update(s, meeting_id, fields, save_action_items, record_meeting)
+        if before_commit:
+            before_commit(s)
+        if changes:
+            _bump_version(s)
         s.commit()
-        s.refresh(m)
-        return m
+    if changes:
+        _notify()
+    return len(changes)
+
+
+MEETING_COLUMNS = tuple(c.name for c in Meeting.__table__.columns if c.name != "id")
+# Scalar column defaults (status="UNUSED"), filled in before a bulk insert so
+# the analytics facts see the values that are actually stored
+MEETING_DEFAULTS = {
+    c.name: c.default.arg for c in Meeting.__table__.columns
+    if c.default is not None and c.default.is_scalar
+}
+
+
+def _parse_dates(pd, values):
+    """
+    occurred_at values -> object Series of naive local datetimes (None where
+    unparseable). A batch mixing UTC offsets makes pandas refuse the whole
+    column; it is then parsed value by value.
+    """
+    try:
+        parsed = list(pd.to_datetime(values, errors="coerce", format="mixed"))
+    except ValueError:  # "Mixed timezones detected"
+        parsed = [pd.to_datetime(v, errors="coerce") for v in values]
+    dates = [None if pd.isna(t) else _local_naive(t.to_pydatetime()) for t in parsed]
+    return pd.Series(dates, index=values.index, dtype=object)
+
+
+def bulk_upsert_meetings(
+    rows: Iterable[dict],
+    batch_size: int = 2000,
+    on_batch: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Insert many meetings in large transactions (one per `batch_size` rows).
+
+    Each row is a dict of Meeting fields (columns plus TEXT_COLUMNS). occurred_at strings are parsed per
+    batch with pandas (mixed formats accepted; unparseable rows are skipped).
+    Rows whose content_hash (transcript hash unless given) is already stored,
+    or repeated within the input, are skipped. The search index and the
+    analytics aggregates and the action_items table are filled in the same transaction. `on_batch(stats)` is called after every batch.
+
+    Returns {"read", "inserted", "duplicates", "invalid", "seconds", "rows_per_sec"}.
+    """
+    import pandas as pd
+    from Interface.actions import save_new_action_items
+    from Interface.analytics import record_new_meetings
+
+    stats = {"read": 0, "inserted": 0, "duplicates": 0, "invalid": 0}
+    seen: set = set()
+    t0 = time.perf_counter()
+
+    def flush(batch: List[dict]) -> None:
+        df = pd.DataFrame(batch)
+        for col in ("name", "occurred_at", "content_hash"):
+            if col not in df:
+                df[col] = None
+        dates = _parse_dates(pd, df["occurred_at"])
+        valid = dates.notna() & df["name"].notna()
+        stats["invalid"] += int((~valid).sum())
+        df = df[valid].assign(occurred_at=dates[valid])
+
+        missing = df["content_hash"].isna()
+        if "transcript_text" in df and missing.any():
+            df.loc[missing, "content_hash"] = df.loc[missing, "transcript_text"].map(
+                content_hash, na_action="ignore")
+
+        records, texts = [], []
+        hashes = [h for h in df["content_hash"] if h]
+        with Session(write_engine) as s:
+            existing = set()
+            for i in range(0, len(hashes), 500):  # stay under SQLite's variable limit
+                existing.update(s.execute(
+                    select(Meeting.content_hash).where(Meeting.content_hash.in_(hashes[i:i + 500]))
+                ).scalars())
+            for rec in df.to_dict("records"):
+                h = rec.get("content_hash")
+                if h and (h in existing or h in seen):
+                    stats["duplicates"] += 1
+                    continue
+                if h:
+                    seen.add(h)
+                rec = {k: (None if isinstance(v, float) and pd.isna(v) else v) for k, v in rec.items()}
+                record = {c: rec.get(c) for c in MEETING_COLUMNS}
+                for c, default in MEETING_DEFAULTS.items():
+                    if record[c] is None:
+                        record[c] = default
+                records.append(record)
+                texts.append({c: rec.get(c) for c in TEXT_COLUMNS})
+
+            if records:
+                ids = s.execute(
+                    insert(Meeting).returning(Meeting.id, sort_by_parameter_order=True), records
+                ).scalars().all()
+                bodies = [dict(t, meeting_id=i) for i, t in zip(ids, texts) if any(t.values())]
+                if bodies:
+                    s.execute(insert(MeetingText), bodies)
+                if fts_enabled():
+                    s.execute(
+                        text(_FTS_INSERT_SQL),
+                        [{"id": i, "name": r["name"], **t} for i, r, t in zip(ids, records, texts)],
+                    )
+                new = [dict(r, id=i, **t) for i, r, t in zip(ids, records, texts)]
+                save_new_action_items(s, new)
+                record_new_meetings(s, new)
+                _bump_version(s)
+            s.commit()
+        if records:
+            _notify()
+        stats["inserted"] += len(records)
+        if on_batch:
+            on_batch(dict(stats))
+
+    batch: List[dict] = []
+    for row in rows:
+        stats["read"] += 1
+        batch.append(row)
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+    stats["seconds"] = time.perf_counter() - t0
+    stats["rows_per_sec"] = stats["read"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+# Columns the list views need; the large text columns stay unloaded
+LISTING_COLUMNS = (
+    "id", "name", "tags", "occurred_at", "audio_path", "transcript_path",
+    "status", "department", "owner",
+)
+SORTABLE = ("occurred_at", "name", "id")
+
+
+def _filtered(
+    stmt,
+    name_query: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    tag_query: Optional[str] = None,
+    department: Optional[str] = None,
+    status: Optional[str] = None,
+    owner: Optional[str] = None,
+    *,
+    order_by: str = "occurred_at",
+    descending: bool = True,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[object, int]] = None,
+):
+    """Apply the list_meetings filters, keyset and order to a select over meetings."""
+    if order_by not in SORTABLE:
+        raise ValueError(f"order_by must be one of {SORTABLE}")
+    col = getattr(Meeting, order_by)
+
+    if name_query:
+        stmt = stmt.where(Meeting.name.contains(name_query, autoescape=True))
+    if tag_query:
+        stmt = stmt.where(Meeting.tags.contains(tag_query, autoescape=True))
+    if department:
+        stmt = stmt.where(Meeting.department.contains(department, autoescape=True))
+    if owner:
+        stmt = stmt.where(Meeting.owner.contains(owner, autoescape=True))
+    if status:
+        stmt = stmt.where(func.upper(Meeting.status) == status.upper())
+    if date_from:
+        stmt = stmt.where(Meeting.occurred_at >= date_from)
+    if date_to:
+        stmt = stmt.where(Meeting.occurred_at <= date_to)
+
+    if after is not None:
+        key = tuple_(col, Meeting.id)
+        stmt = stmt.where(key < tuple_(*after) if descending else key > tuple_(*after))
+    if descending:
+        stmt = stmt.order_by(col.desc(), Meeting.id.desc())
+    else:
+        stmt = stmt.order_by(col.asc(), Meeting.id.asc())
+    if limit:
+        stmt = stmt.limit(limit)
+    return stmt
 
 
 def list_meetings(
@@ -117,35 +672,252 @@ def list_meetings(
     department: Optional[str] = None,
     status: Optional[str] = None,
     owner: Optional[str] = None,
+    *,
+    order_by: str = "occurred_at",
+    descending: bool = True,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[object, int]] = None,
+    listing_only: bool = False,
 ) -> List[Meeting]:
+    """
+    Filter, sort and page meetings in SQL.
+
+    Text filters are case-insensitive substring matches (SQLite LIKE); status is
+    an exact, case-insensitive match (indexed on upper(status)). Pagination is keyset-based:
+    pass `after=page_cursor(last_row)` to get the rows following `last_row` in
+    the same order. With `listing_only=True` only LISTING_COLUMNS are loaded;
+    the transcript/summary texts must then be fetched with get_meeting().
+    For read-only listings prefer list_meeting_rows() / meetings_frame().
+    """
+    stmt = _filtered(
+        select(Meeting), name_query, date_from, date_to, tag_query, department, status, owner,
+        order_by=order_by, descending=descending, limit=limit, after=after,
+    )
+    if listing_only:
+        stmt = stmt.options(load_only(*(getattr(Meeting, c) for c in LISTING_COLUMNS)))
+    else:
+        stmt = stmt.options(selectinload(Meeting.body))
+
     with Session(engine) as s:
-        meetings = s.execute(select(Meeting)).scalars().all()
-
-    def match(m: Meeting) -> bool:
-        return all(
-            [
-                (name_query.lower() in m.name.lower()) if name_query else True,
-                (tag_query.lower() in (m.tags or "").lower()) if tag_query else True,
-                (department.lower() in (m.department or "").lower()) if department else True,
-                (status.lower() == (m.status or "").lower()) if status else True,
-                (owner.lower() in (m.owner or "").lower()) if owner else True,
-                (m.occurred_at >= date_from) if date_from else True,
-                (m.occurred_at <= date_to) if date_to else True,
-            ]
-        )
+        return list(s.execute(stmt).scalars().all())
+
+
+class MeetingRow:
+    """Listing row: LISTING_COLUMNS as plain slots, no ORM state (treat as read-only)."""
+    __slots__ = LISTING_COLUMNS
+
+    def __init__(self, id, name, tags, occurred_at, audio_path, transcript_path, status, department, owner):
+        self.id = id
+        self.name = name
+        self.tags = tags
+        self.occurred_at = occurred_at
+        self.audio_path = audio_path
+        self.transcript_path = transcript_path
+        self.status = status
+        self.department = department
+        self.owner = owner
 
-    return [m for m in meetings if match(m)]
+    def __repr__(self) -> str:
+        return f"MeetingRow(id={self.id!r}, name={self.name!r}, occurred_at={self.occurred_at!r})"
+
+    def as_dict(self) -> dict:
+        return {c: getattr(self, c) for c in LISTING_COLUMNS}
+
+
+def _listing_columns(columns: Iterable[str]):
+    # occurred_at comes back as the stored ISO string; callers convert it in bulk
+    return [
+        type_coerce(Meeting.occurred_at, String).label("occurred_at") if c == "occurred_at"
+        else getattr(Meeting, c)
+        for c in columns
+    ]
+
+
+def list_meeting_rows(**filters) -> List[MeetingRow]:
+    """
+    Same filters/keyset as list_meetings(), returning MeetingRow objects built
+    straight from the cursor (LISTING_COLUMNS only). page_cursor() accepts them.
+    """
+    return _meeting_rows(_filtered(select(*_listing_columns(LISTING_COLUMNS)), **filters))
+
+
+def get_meeting_row(meeting_id: int) -> Optional[MeetingRow]:
+    """One meeting's LISTING_COLUMNS (no texts); get_meeting() loads everything."""
+    rows = _meeting_rows(select(*_listing_columns(LISTING_COLUMNS)).where(Meeting.id == meeting_id))
+    return rows[0] if rows else None
+
+
+def _meeting_rows(stmt) -> List[MeetingRow]:
+    with engine.connect() as con:
+        rows = con.execute(stmt).all()
+    parse = datetime.fromisoformat
+    return [
+        MeetingRow(i, name, tags, parse(at) if at else None, audio, transcript, status, dept, owner)
+        for i, name, tags, at, audio, transcript, status, dept, owner in rows
+    ]
+
+
+def meetings_frame(columns: Iterable[str] = LISTING_COLUMNS, **filters):
+    """
+    Listing as a pandas DataFrame built directly from the cursor: one column
+    per requested listing column, occurred_at parsed in one vectorized step.
+    Takes the list_meetings() filters.
+    """
+    import pandas as pd
+
+    columns = tuple(columns)
+    unknown = set(columns) - set(LISTING_COLUMNS)
+    if unknown:
+        raise ValueError(f"not listing columns: {sorted(unknown)}")
+    stmt = _filtered(select(*_listing_columns(columns)), **filters)
+    with engine.connect() as con:
+        df = pd.DataFrame(con.execute(stmt).all(), columns=list(columns))
+    if "occurred_at" in df:
+        df["occurred_at"] = pd.to_datetime(df["occurred_at"], format="ISO8601")
+    return df
+
+
+def page_cursor(m: Meeting, order_by: str = "occurred_at") -> Tuple[object, int]:
+    """Keyset cursor for the row after `m` (see list_meetings(after=...))."""
+    return (getattr(m, order_by), m.id)
 
 
 def get_meeting(meeting_id: int) -> Optional[Meeting]:
     with Session(engine) as s:
-        return s.get(Meeting, meeting_id)
+        return s.get(Meeting, meeting_id, options=[selectinload(Meeting.body)])
+
+
+TEXT_CHUNK = 16 * 1024  # bytes of UTF-8 per read_text() call
+READ_STEP = 64 * 1024  # compressed bytes fetched from the blob at a time
+MAX_TEXT_CURSORS = 32
+
+
+class _TextCursor:
+    """Where read_text() stopped in one compressed text, so the next chunk continues from there."""
+
+    def __init__(self, version: int):
+        self.version = version
+        self.inflater = zlib.decompressobj()
+        self.fed = 0  # compressed bytes read so far
+        self.pos = 0  # uncompressed offset of data[0]
+        self.data = b""  # inflated bytes not handed out yet
+        self.eof = False
+
+
+_text_cursors: "OrderedDict[Tuple[int, str], _TextCursor]" = OrderedDict()
+_text_cursors_lock = threading.Lock()
+
+
+def _read_compressed(con, meeting_id: int, field: str, start: int, n: int) -> Optional[bytes]:
+    """Bytes [start, start + n) of a compressed text; None if the meeting has none."""
+    raw = con.connection.driver_connection
+    if hasattr(raw, "blobopen"):  # Python 3.11+: reads only the pages it needs
+        try:
+            with raw.blobopen("meeting_texts", field, meeting_id, readonly=True) as blob:
+                blob.seek(start)
+                return blob.read(n)
+        except sqlite3.OperationalError:  # no row, or a NULL value
+            return None
+    col = type_coerce(MeetingText.__table__.c[field], LargeBinary)
+    return con.execute(
+        select(type_coerce(func.substr(col, start + 1, n), LargeBinary)).where(MeetingText.meeting_id == meeting_id)
+    ).scalar()
+
+
+def _inflate_to(con, cursor: _TextCursor, meeting_id: int, field: str, end: int) -> bool:
+    """Inflate until `end` bytes are available (or the text ends); False if there is no text."""
+    while cursor.pos + len(cursor.data) < end and not cursor.eof:
+        piece = _read_compressed(con, meeting_id, field, cursor.fed, READ_STEP)
+        if piece is None and cursor.fed == 0:
+            return False
+        if not piece:
+            cursor.eof = True
+            break
+        cursor.fed += len(piece)
+        cursor.data += cursor.inflater.decompress(piece)
+    return True
+
+
+def read_text(
+    meeting_id: int,
+    field: str = "transcript_text",
+    offset: int = 0,
+    size: int = TEXT_CHUNK,
+) -> Tuple[str, Optional[int]]:
+    """
+    One chunk of a meeting text without materializing the rest. `offset` is
+    a byte offset as returned by the previous call. Returns (text,
+    next_offset); next_offset is None at the end. Chunks end on a character
+    boundary, preferably at whitespace.
+
+    The blob is read and inflated incrementally: a cursor per (meeting,
+    field) remembers how far the previous call got, so paging forward
+    through a text reads and inflates each part once. Going back, or a
+    write to the meetings in between, starts from the beginning again.
+    """
+    if field not in TEXT_COLUMNS:
+        raise ValueError(f"field must be one of {TEXT_COLUMNS}")
+    key = (meeting_id, field)
+    with engine.connect() as con:
+        version = con.exec_driver_sql("SELECT version FROM data_version WHERE name = 'meetings'").scalar_one()
+        with _text_cursors_lock:
+            cursor = _text_cursors.pop(key, None)
+        if cursor is None or cursor.version != version or offset < cursor.pos:
+            cursor = _TextCursor(version)
+        try:
+            found = _inflate_to(con, cursor, meeting_id, field, offset + size + 4)
+        except zlib.error:  # rewritten between two statements: start over
+            cursor = _TextCursor(version)
+            found = _inflate_to(con, cursor, meeting_id, field, offset + size + 4)
+    if not found:
+        return "", None
+    # forget what is before this chunk; the next call starts at or after it
+    cursor.data, cursor.pos = cursor.data[offset - cursor.pos:], offset
+    with _text_cursors_lock:
+        _text_cursors[key] = cursor
+        while len(_text_cursors) > MAX_TEXT_CURSORS:
+            _text_cursors.popitem(last=False)
+
+    data = cursor.data
+    end = size
+    if end >= len(data):
+        return data.decode("utf-8"), None
+    while end > 0 and data[end] & 0xC0 == 0x80:  # inside a multi-byte character
+        end -= 1
+    if end == 0:  # size smaller than that character: take the whole character
+        end = size
+        while data[end] & 0xC0 == 0x80:
+            end += 1
+    space = data.rfind(b" ", max(0, end - 200), end)
+    if space > 0:
+        end = space + 1
+    return data[:end].decode("utf-8"), offset + end
 
 
 # ---------- Streamlit Page ----------
+PAGE_SIZE = 50
+
+
 def render():
     st.header("📦 Storage / Meetings")
 
+    # reruns (every keystroke in a filter box) are served from the query cache
+    from Interface import query_cache
+
+    # --- Full-text search ---
+    if fts_enabled():
+        q = st.text_input("🔎 Search what was said (transcripts, summaries, actions)")
+        if q.strip():
+            hits = query_cache.search_meetings(q)
+            if not hits:
+                st.info("No matches.")
+            from Interface.segments import format_offset, seek
+
+            for h in hits:
+                offset = seek(h["meeting_id"], q)
+                at = f" · ⏱ {format_offset(offset)}" if offset is not None else ""
+                st.markdown(f"**#{h['meeting_id']} {h['name']}** · {h['occurred_at']:%Y-%m-%d}{at}  \n{h['snippet']}")
+
     # --- Filters ---
     with st.expander("Filters", expanded=True):
         c1, c2, c3 = st.columns(3)
@@ -164,7 +936,7 @@ def render():
         def to_dt(d):
             return datetime.combine(d, datetime.min.time()) if d else None
 
-        results = list_meetings(
+        filters = dict(
             name_query=name_query or None,
             tag_query=tag_query or None,
             owner=owner or None,
@@ -174,27 +946,38 @@ def render():
             date_to=to_dt(date_to),
         )
 
+    # --- Keyset pagination (cursor stack per filter set) ---
+    sig = repr(sorted(filters.items()))
+    if st.session_state.get("storage_filters") != sig:
+        st.session_state["storage_filters"] = sig
+        st.session_state["storage_cursors"] = [None]
+    cursors = st.session_state["storage_cursors"]
+
+    # one extra row tells us whether a next page exists
+    rows = query_cache.meetings_frame(**filters, limit=PAGE_SIZE + 1, after=cursors[-1])
+    results, has_next = rows.iloc[:PAGE_SIZE], len(rows) > PAGE_SIZE
+
     # --- Table ---
-    if results:
-        import pandas as pd
-
-        df = pd.DataFrame(
-            [
-                {
-                    "ID": m.id,
-                    "Name": m.name,
-                    "Tags": m.tags,
-                    "Occurred At": m.occurred_at,
-                    "Owner": m.owner,
-                    "Department": m.department,
-                    "Status": m.status,
-                    "Audio": m.audio_path,
-                    "Transcript": m.transcript_path,
-                }
-                for m in results
-            ]
-        ).sort_values("Occurred At", ascending=False)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+    if len(results):
+        st.dataframe(
+            results.rename(columns={
+                "id": "ID", "name": "Name", "tags": "Tags", "occurred_at": "Occurred At",
+                "owner": "Owner", "department": "Department", "status": "Status",
+                "audio_path": "Audio", "transcript_path": "Transcript",
+            })[["ID", "Name", "Tags", "Occurred At", "Owner", "Department", "Status", "Audio", "Transcript"]],
+            use_container_width=True,
+            hide_index=True,
+        )
+
+        p1, p2, p3 = st.columns([1, 1, 4])
+        if p1.button("⬅️ Previous", disabled=len(cursors) == 1):
+            cursors.pop()
+            st.rerun()
+        if p2.button("Next ➡️", disabled=not has_next):
+            last = results.iloc[-1]
+            cursors.append((last["occurred_at"].to_pydatetime(), int(last["id"])))
+            st.rerun()
+        p3.caption(f"Page {len(cursors)} · {PAGE_SIZE} per page, newest first")
     else:
         st.info("No meetings found. Add one below.")
 
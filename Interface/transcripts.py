@@ -0,0 +1,118 @@
+# Interface/transcripts.py
+from __future__ import annotations
+
+from typing import List
+
+import streamlit as st
+
+from Interface.query_cache import get_meeting_row, list_meeting_rows
+from Interface.segments import format_offset, page_segments, speaking_time
+from Interface.storage import page_cursor, read_text
+
+
+# ---------- Settings ----------
+PAGE_SIZE = 20          # meetings per list page (metadata only)
+SEGMENT_PAGE = 40       # segments shown per step
+TEXT_FIELDS = {
+    "Transcript": "transcript_text",
+    "Summary": "summary",
+    "Key points": "key_points",
+    "Action items": "action_items",
+}
+
+
+def _stack(key: str) -> List:
+    """Per-widget cursor stack in session state; [None] is the first page."""
+    return st.session_state.setdefault(key, [None])
+
+
+def _pager(key: str, stack: List, next_cursor, label: str) -> None:
+    p1, p2, p3 = st.columns([1, 1, 4])
+    if p1.button("⬅️", key=f"{key}_prev", disabled=len(stack) == 1):
+        stack.pop()
+        st.rerun()
+    if p2.button("➡️", key=f"{key}_next", disabled=next_cursor is None):
+        stack.append(next_cursor)
+        st.rerun()
+    p3.caption(label)
+
+
+def _render_text(meeting_id: int, field: str) -> None:
+    key = f"tr_text_{meeting_id}_{field}"
+    stack = _stack(key)
+    chunk, next_offset = read_text(meeting_id, field, offset=stack[-1] or 0)
+    if not chunk and len(stack) == 1:
+        st.info("Nothing stored yet.")
+        return
+    st.text_area(field, chunk, height=260, key=f"{key}_{len(stack)}", label_visibility="collapsed")
+    _pager(key, stack, next_offset, f"Part {len(stack)}" + ("" if next_offset else " (end)"))
+
+
+def _render_segments(meeting_id: int) -> None:
+    key = f"tr_seg_{meeting_id}"
+    stack = _stack(key)
+    # one extra row tells us whether there is more
+    segs = page_segments(meeting_id, after=stack[-1], limit=SEGMENT_PAGE + 1)
+    if not segs and len(stack) == 1:
+        st.info("No timestamped segments for this meeting.")
+        return
+    shown, more = segs[:SEGMENT_PAGE], len(segs) > SEGMENT_PAGE
+    if len(stack) == 1:
+        st.metric("Speaking time", format_offset(speaking_time([meeting_id]).get(meeting_id, 0.0)))
+    for seg in shown:
+        st.markdown(f"`{format_offset(seg.start)}–{format_offset(seg.end)}` {seg.text}")
+    next_cursor = (shown[-1].start, shown[-1].id) if more else None
+    _pager(key, stack, next_cursor, f"From {format_offset(shown[0].start)}")
+
+
+def _render_detail(meeting_id: int) -> None:
+    view = st.radio("Show", ["Transcript", "Segments", "Summary", "Key points", "Action items"],
+                    horizontal=True, key=f"tr_view_{meeting_id}")
+    if view == "Segments":
+        _render_segments(meeting_id)
+    else:
+        _render_text(meeting_id, TEXT_FIELDS[view])
+
+
+# ---------- Streamlit Page ----------
+def render():
+    st.header("📄 Transcripts")
+
+    c1, c2, c3 = st.columns([3, 2, 1])
+    name_query = c1.text_input("Name contains", key="tr_name")
+    status = c2.selectbox("Status", ["", "UNUSED", "DRAFT", "READY", "ARCHIVED"], key="tr_status")
+    jump = c3.number_input("Meeting ID", min_value=0, step=1, format="%d", key="tr_jump")
+
+    if jump:
+        m = get_meeting_row(int(jump))
+        if not m:
+            st.error("❌ Meeting not found.")
+        else:
+            st.subheader(f"#{m.id} {m.name}")
+            _render_detail(m.id)
+        return
+
+    filters = dict(name_query=name_query or None, status=status or None)
+    sig = repr(sorted(filters.items()))
+    if st.session_state.get("tr_filters") != sig:
+        st.session_state["tr_filters"] = sig
+        st.session_state["tr_cursors"] = [None]
+    cursors = st.session_state["tr_cursors"]
+
+    rows = list_meeting_rows(**filters, limit=PAGE_SIZE + 1, after=cursors[-1])
+    results, has_next = rows[:PAGE_SIZE], len(rows) > PAGE_SIZE
+    if not results:
+        st.info("No meetings found.")
+        return
+
+    for m in results:
+        c_info, c_open = st.columns([6, 1])
+        c_info.markdown(f"**#{m.id} {m.name}** · {m.occurred_at:%Y-%m-%d %H:%M} · "
+                        f"{m.department or '-'} · {m.status or 'UNUSED'}")
+        # text and segments are fetched only for opened rows
+        if c_open.toggle("Open", key=f"tr_open_{m.id}"):
+            with st.container(border=True):
+                _render_detail(m.id)
+
+    _pager("tr_list", cursors, page_cursor(results[-1]) if has_next else None,
+           f"Page {len(cursors)} · {PAGE_SIZE} per page, newest first")
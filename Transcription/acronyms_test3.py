@@ -1,74 +1,8 @@
-import re
 from pathlib import Path
 import whisper
 from core.acronyms import expander  # ✅ Uses your singleton AcronymExpander
+from core.letter_names import normalize_known_acronyms  # collapsed tokens + letter-name patterns
 
-# --- One-token forms Whisper might collapse (e.g. "سبي" = "SP")
-COLLAPSED_TOKEN_MAP = {
-    "سبي": "SP",
-    "ريم": "RM",
-}
-
-# --- Multi-token Arabic spoken letter patterns (very conservative)
-PATTERNS = [
-    (("دي", "دي"), "DD"),
-    (("اس", "بي"), "SP"), (("إس", "بي"), "SP"),
-    (("سي", "ار", "ام"), "CRM"), (("سي", "آر", "ام"), "CRM"),
-    (("ار", "ام"), "RM"), (("آر", "ام"), "RM"),
-    (("ام", "تي"), "MT"), (("ايم", "تي"), "MT"),
-    (("كيو", "اي"), "QA"), (("كْيو", "اي"), "QA"),
-]
-
-def _strip_punct(tok: str):
-    left = right = ""
-    m = re.match(r"^[\W_]+", tok)
-    if m:
-        left = m.group(0)
-        tok = tok[len(left):]
-    m = re.search(r"[\W_]+$", tok)
-    if m:
-        right = m.group(0)
-        tok = tok[:-len(right)]
-    return tok, left, right
-
-def normalize_known_acronyms(text: str) -> str:
-    if not text:
-        return text
-
-    words = text.split()
-    out = []
-    i = 0
-    n = len(words)
-
-    while i < n:
-        raw = words[i]
-        core, left_p, right_p = _strip_punct(raw)
-
-        # 1) Collapsed tokens
-        if core in COLLAPSED_TOKEN_MAP:
-            out.append(left_p + COLLAPSED_TOKEN_MAP[core] + right_p)
-            i += 1
-            continue
-
-        # 2) Multi-token matches
-        matched = False
-        for pat, acro in PATTERNS:
-            mlen = len(pat)
-            if i + mlen <= n:
-                window = [_strip_punct(w)[0] for w in words[i:i + mlen]]
-                if tuple(window) == pat:
-                    out.append(acro)
-                    i += mlen
-                    matched = True
-                    break
-        if matched:
-            continue
-
-        # 3) Leave as-is
-        out.append(words[i])
-        i += 1
-
-    return " ".join(out)
 
 def transcribe_audio(audio_path: str) -> str:
     model = whisper.load_model("large-v2")
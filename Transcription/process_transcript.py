@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import argparse
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 import spacy
 
 try:
@@ -21,6 +22,7 @@ except Exception:
 from langdetect import detect
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
 import spacy
+from core.matcher import UNICODE_WORD, AcronymMatcher
 from tools.acronym_seed import ACRONYMS
 
 TRANSLATION_MODEL = "facebook/nllb-200-distilled-600M"
@@ -33,16 +35,39 @@ ACRONYM_DICT = {item["short"].upper(): item["long"] for item in ACRONYMS}
 
 import re
 
+# Compiled tries by dict identity: id -> (dict, size when compiled, matcher).
+# The dict is kept referenced so its id can't be reused; a dict that grows or
+# shrinks is recompiled (edit a copy rather than changing entries in place).
+_MATCHERS: "OrderedDict[int, Tuple[dict, int, AcronymMatcher]]" = OrderedDict()
+MAX_MATCHERS = 8
+
+
+def _compiled(acronyms: dict) -> AcronymMatcher:
+    hit = _MATCHERS.get(id(acronyms))
+    if hit is not None and hit[0] is acronyms and hit[1] == len(acronyms):
+        _MATCHERS.move_to_end(id(acronyms))
+        return hit[2]
+    matcher = AcronymMatcher(acronyms, UNICODE_WORD, ignore_case=True)
+    _MATCHERS[id(acronyms)] = (acronyms, len(acronyms), matcher)
+    while len(_MATCHERS) > MAX_MATCHERS:
+        _MATCHERS.popitem(last=False)
+    return matcher
+
+
+_compiled(ACRONYM_DICT)  # the default registry is compiled once, at import
+
+
 def expand_acronyms(text: str, acronyms: dict) -> str:
-    # Match acronyms that might be next to Arabic or punctuation without spaces
-    for short, long in acronyms.items():
-        # Add Arabic-aware boundaries using positive lookbehind and lookahead
-        pattern = re.compile(rf"(?<!\w)({re.escape(short)})(?!\w)", re.IGNORECASE)
-        matches = pattern.findall(text)
-        for match in matches:
-            print(f"[DEBUG] Expanding {match} → {long}")
-        text = pattern.sub(long, text)
-    return text
+    # Match acronyms that might be next to Arabic or punctuation without spaces.
+    # One case-insensitive trie pass for all acronyms (longest match wins).
+    matcher = _compiled(acronyms)
+
+    def repl(short: str, match: str) -> str:
+        long = acronyms[short]
+        print(f"[DEBUG] Expanding {match} → {long}")
+        return long
+
+    return matcher.sub(repl, text)
 
 
 # === I/O ===
@@ -7,8 +7,10 @@ import datetime
 
 # Add path to whisper_streaming folder
 sys.path.append(os.path.join(os.path.dirname(__file__), "whisper_streaming"))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from whisper_streaming.whisper_online import OnlineASRProcessor, FasterWhisperASR
+from core.acronyms import expander
 
 # Init Whisper model (auto language detection, medium model)
 asr = FasterWhisperASR(lan="auto", model_size_or_path="medium")
@@ -16,6 +18,8 @@ asr.use_vad()  # Enable Voice Activity Detection (recommended)
 
 # Create streaming ASR processor
 streaming = OnlineASRProcessor(asr)
+# Acronyms are expanded as segments are committed (first mention per meeting)
+acronyms = expander.session(sep=asr.sep)
 
 # Audio stream settings
 samplerate = 16000
@@ -28,6 +32,14 @@ def callback(indata, frames, time, status):
         print(f"⚠️ {status}")
     audio_queue.put(indata.copy())
 
+def write_segments(segments, transcript_file):
+    for _beg, _end, text in segments:
+        timestamp = datetime.datetime.now().strftime("[%H:%M:%S]")
+        output_line = f"{timestamp} {text.strip()}"
+        print(f"📝 {output_line}")
+        transcript_file.write(output_line + "\n")
+        transcript_file.flush()
+
 # Start streaming
 with open("meeting_transcript.txt", "a", encoding="utf-8") as transcript_file:
     with sd.InputStream(samplerate=samplerate, channels=1, dtype="float32", callback=callback, blocksize=blocksize):
@@ -41,18 +53,9 @@ with open("meeting_transcript.txt", "a", encoding="utf-8") as transcript_file:
 
                 # Feed into streaming processor
                 streaming.insert_audio_chunk(audio_int16)
-                text = streaming.process_iter()
-
-                if text:
-                    timestamp = datetime.datetime.now().strftime("[%H:%M:%S]")
-                    output_line = f"{timestamp} {text}"
-                    print(f"📝 {output_line}")
-                    transcript_file.write(output_line + "\n")
-                    transcript_file.flush()
+                write_segments(acronyms.push_segment(streaming.process_iter()), transcript_file)
 
         except KeyboardInterrupt:
             print("\n🛑 Transcription stopped by user.")
-            final_text = streaming.finish()
-            if final_text:
-                transcript_file.write(final_text + "\n")
-                print(f"📝 Final: {final_text}")
+            acronyms.push_segment(streaming.finish())
+            write_segments(acronyms.finish_segments(), transcript_file)
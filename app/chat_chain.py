@@ -1,4 +1,6 @@
 # app/chat_chain.py
+from typing import List
+
 from langchain_community.chat_models import ChatOllama
 from langchain.prompts import ChatPromptTemplate
 from langchain.schema.runnable import RunnableLambda
@@ -25,5 +27,10 @@ chain = RunnableLambda(_preprocess) | prompt | llm
 def answer(text: str) -> str:
     return chain.invoke({"query": text}).content
 
+def answer_many(texts: List[str]) -> List[str]:
+    # expand the whole batch in one call, then let the LLM batch the prompts
+    queries = [{"query": r.text} for r in expander.expand_many(texts)]
+    return [m.content for m in (prompt | llm).batch(queries)]
+
 if __name__ == "__main__":
     print(answer("When will SP release? وهل ATF مطلوب؟"))
@@ -2,11 +2,8 @@ import streamlit as st
 
 # ---- Imports from your current structure ----
 from Interface.auth import login_user
-# Create these modules' render() functions as shown below
-from Interface.knowledge import render as render_knowledge
-from Interface.storage import render as render_storage
-from Interface.asr import render as render_new_meeting
-# You can add more pages later (Calendar, Transcripts, Analytics) the same way
+# Page modules (and the meetings database behind them) are imported inside
+# their route below, so startup and each rerun only load the page being shown
 
 # ---- App config ----
 st.set_page_config(page_title="MeetSense", layout="wide")
@@ -30,6 +27,7 @@ PAGES = {
     "🧠 Knowledge": "knowledge",
     "📄 Transcripts": "transcripts",
     "📊 Analytics": "analytics",
+    "✅ Action Items": "actions",
     "🎙️ New Meeting": "new_meeting",
 }
 
@@ -45,19 +43,25 @@ if page == "home":
     st.write("Welcome to MeetSense.")
 
 elif page == "calendar":
-    st.header("Calendar")
-    st.info("TODO: implement Calendar page.")
+    from Interface.calendar_data import render as render_calendar
+    render_calendar()    # from Interface/calendar_data.py
 
 elif page == "knowledge":
+    from Interface.knowledge import render as render_knowledge
     render_knowledge()   # from Interface/knowledge.py
 
 elif page == "transcripts":
-    st.header("Transcripts")
-    st.info("TODO: implement Transcripts page.")
+    from Interface.transcripts import render as render_transcripts
+    render_transcripts() # from Interface/transcripts.py
 
 elif page == "analytics":
-    st.header("Analytics")
-    st.info("TODO: implement Analytics page.")
+    from Interface.analytics import render as render_analytics
+    render_analytics()   # from Interface/analytics.py
+
+elif page == "actions":
+    from Interface.actions import render as render_actions
+    render_actions()     # from Interface/actions.py
 
 elif page == "new_meeting":
+    from Interface.asr import render as render_new_meeting
     render_new_meeting()  # from Interface/asr.py
@@ -1,53 +1,395 @@
 # core/acronyms.py
-import json, re
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from core.matcher import WORD_CHARS, AcronymMatcher
+
+Segment = Tuple[Optional[float], Optional[float], str]  # (start, end, text) as OnlineASRProcessor commits them
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+REGISTRY_PATH = Path(os.getenv("MEETSENSE_ACRONYMS", PROJECT_ROOT / "data" / "acronyms.json"))
+# Compiled matchers, one file per registry source path, content (sha256) and CACHE_FORMAT
+CACHE_DIR = Path(os.getenv("MEETSENSE_ACRONYM_CACHE", PROJECT_ROOT / "data" / "cache" / "acronyms"))
+CACHE_FORMAT = 2  # bump when AcronymMatcher's pickled state changes
+# How often (seconds) a running process checks the registry file for edits
+RELOAD_INTERVAL = float(os.getenv("MEETSENSE_ACRONYM_RELOAD", "2.0"))
+# expand_many() batches smaller than this (total characters) stay in-process
+POOL_MIN_CHARS = int(os.getenv("MEETSENSE_ACRONYM_POOL_MIN_CHARS", "8000000"))
+BATCH_SIZE = 256  # documents per pool task
+
+log = logging.getLogger(__name__)
+
+
+def _source_key(path: Path) -> str:
+    return hashlib.sha256(str(Path(path).resolve()).encode("utf-8")).hexdigest()[:16]
+
+
+def _cache_file(source: Path, digest: str) -> Path:
+    return CACHE_DIR / f"{_source_key(source)}-{digest}-v{CACHE_FORMAT}.pickle"
+
+
+def compile_registry(path: Path = REGISTRY_PATH,
+                     cache_for: Optional[Path] = None) -> Tuple[Dict[str, str], AcronymMatcher, str]:
+    """
+    (registry, matcher, sha256) for a registry file. The matcher comes from
+    the cache when one was built for this exact content; otherwise it is
+    built and cached (written to a temp file, then renamed into place), and
+    the caches of earlier versions of the same registry are removed.
+    `cache_for` files the cache under another path, for a registry that is
+    compiled before being renamed into place.
+    """
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    source = cache_for or path
+    cache = _cache_file(source, digest)
+    try:
+        with cache.open("rb") as f:
+            reg, matcher = pickle.load(f)
+        return reg, matcher, digest
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+        pass
+
+    reg = json.loads(raw.decode("utf-8"))
+    matcher = AcronymMatcher(reg, WORD_CHARS)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump((reg, matcher), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+        for old in CACHE_DIR.glob(f"{_source_key(source)}-*.pickle"):  # earlier versions of this registry
+            if old != cache:
+                old.unlink(missing_ok=True)
+    except OSError as e:  # read-only checkout: work uncached
+        log.warning("acronym matcher cache not writable (%s); %s is recompiled on every load", e, path)
+    return reg, matcher, digest
 
-_ARABIC_BLOCK = "\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF"
-_WORD_CHARS = rf"0-9A-Za-z_{_ARABIC_BLOCK}"
 
 def _load_registry() -> Dict[str, str]:
-    project_root = Path(__file__).resolve().parents[1]
-    path = project_root / "data" / "acronyms.json"
-    if path.exists():
-        return json.loads(path.read_text(encoding="utf-8"))
-    # fallback to seed if JSON missing
+    if REGISTRY_PATH.exists():
+        return json.loads(REGISTRY_PATH.read_text(encoding="utf-8"))
     from tools.acronym_seed import ACRONYMS
     return {x["short"]: x["long"] for x in ACRONYMS}
 
+
 class AcronymExpander:
-    def __init__(self, reg: Dict[str, str]):
-        self.reg = dict(reg)
-        # sort by length desc to avoid partial overlaps
-        keys = sorted(self.reg.keys(), key=len, reverse=True)
-        if not keys:
-            # match nothing
-            self._rx = re.compile(r"^\b\B$")
-        else:
-            # unicode-aware boundaries (simple): not letter/number/underscore/Arabic around
-            left  = rf"(?<![{_WORD_CHARS}])"
-            right = rf"(?![{_WORD_CHARS}])"
-            joined = "|".join(map(re.escape, keys))
-            self._rx = re.compile(left + rf"({joined})" + right)
+    """
+    Expands registry acronyms in text. With a `source` file, edits to it are
+    picked up while running: every RELOAD_INTERVAL seconds expand() compares
+    the file's mtime, and a changed registry is compiled (or loaded from the
+    cache) in a background thread, then swapped in with one assignment.
+    Calls already running finish with the matcher they started with.
+    """
+
+    def __init__(self, reg: Dict[str, str], matcher: Optional[AcronymMatcher] = None,
+                 source: Optional[Path] = None, digest: Optional[str] = None):
+        # unicode-aware boundaries (simple): not letter/number/underscore/Arabic around
+        self._state = (dict(reg), matcher or AcronymMatcher(reg, WORD_CHARS))
+        self.digest = digest
+        self.source = source
+        self._stamp = self._file_stamp()
+        self._checked = time.monotonic()
+        self._reloading = threading.Lock()
+
+    @property
+    def reg(self) -> Dict[str, str]:
+        return self._state[0]
+
+    def _file_stamp(self):
+        try:
+            st = os.stat(self.source) if self.source else None
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size) if st else None
+
+    def maybe_reload(self) -> None:
+        """Start a background reload if the registry file changed (cheap when it did not)."""
+        if self.source is None or time.monotonic() - self._checked < RELOAD_INTERVAL:
+            return
+        self._checked = time.monotonic()
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp or not self._reloading.acquire(blocking=False):
+            return
+        threading.Thread(target=self._reload, args=(stamp,), daemon=True, name="acronym-reload").start()
+
+    def reload(self) -> bool:
+        """Reload the registry now; returns True if its content changed."""
+        with self._reloading:
+            return self._swap_from_source(self._file_stamp())
+
+    def _reload(self, stamp) -> None:
+        try:
+            self._swap_from_source(stamp)
+        finally:
+            self._reloading.release()
+
+    def _swap_from_source(self, stamp) -> bool:
+        try:
+            reg, matcher, digest = compile_registry(self.source)
+        except (OSError, ValueError):
+            return False  # half-written or invalid file: keep serving the current one
+        self._stamp = stamp
+        if digest == self.digest:
+            return False
+        self._state = (reg, matcher)  # atomic swap
+        self.digest = digest
+        return True
 
     def expand(self, text: str) -> str:
         """First mention: 'Long (SHORT)'; subsequent mentions: 'Long'."""
-        if not text or not self.reg:
+        self.maybe_reload()
+        reg, matcher = self._state
+        if not text or not reg:
             return text
+        return matcher.sub(_first_mention(reg, set()), text)
+
+    def session(self, sep: str = " ") -> "ExpansionSession":
+        """A streaming expander for one meeting (uses the registry current at the start)."""
+        self.maybe_reload()
+        return ExpansionSession(*self._state, sep=sep)
+
+    def expand_with_stats(self, text: str) -> "Expansion":
+        """expand() plus how often each acronym matched."""
+        self.maybe_reload()
+        return _expand_counted(*self._state, text)
+
+    def iter_expand(self, texts: Iterable[str], workers: int = 1,
+                    batch_size: int = BATCH_SIZE) -> Iterator["Expansion"]:
+        """
+        Expand documents one by one (each has its own first mentions), in
+        input order. `texts` is read lazily. With workers > 1 the documents
+        go to a process pool in batches, a few per worker in flight. The
+        workers use the registry this expander has now: the compiled matcher
+        is pickled once here and loaded by each worker, never recompiled.
+        """
+        self.maybe_reload()
+        reg, matcher = self._state
+        if workers <= 1:
+            for text in texts:
+                yield _expand_counted(reg, matcher, text)
+            return
+
+        shared = pickle.dumps((reg, matcher), protocol=pickle.HIGHEST_PROTOCOL)
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                 initializer=_init_worker, initargs=(self.digest, shared)) as pool:
+            in_flight: deque = deque()
+            for batch in _batches(texts, batch_size):
+                in_flight.append(pool.submit(_expand_batch, batch))
+                if len(in_flight) >= 2 * workers:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+
+    def expand_many(self, texts: Sequence[str], workers: Optional[int] = None) -> List["Expansion"]:
+        """
+        iter_expand() over a whole batch. By default a process pool (one
+        worker per CPU) is used only when the batch is large enough to pay
+        for starting it (POOL_MIN_CHARS).
+        """
+        if workers is None:
+            big = sum(len(t) for t in texts if t) >= POOL_MIN_CHARS
+            workers = (os.cpu_count() or 1) if big else 1
+        return list(self.iter_expand(texts, workers=workers))
+
+
+@dataclass
+class Expansion:
+    text: str
+    matches: int = 0  # acronym occurrences expanded
+    counts: Dict[str, int] = field(default_factory=dict)  # registry key -> occurrences
+
+
+def _expand_counted(reg: Dict[str, str], matcher: AcronymMatcher, text: str) -> Expansion:
+    if not text or not reg:
+        return Expansion(text)
+    counts: Dict[str, int] = {}
+    first = _first_mention(reg, set())
+
+    def repl(short: str, matched: str) -> str:
+        counts[short] = counts.get(short, 0) + 1
+        return first(short, matched)
+
+    out = matcher.sub(repl, text)
+    return Expansion(out, sum(counts.values()), counts)
+
+
+def _batches(texts: Iterable[str], size: int) -> Iterator[List[str]]:
+    batch: List[str] = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ---------- Pool worker side ----------
+_worker: Dict[str, object] = {}
+
+
+def _init_worker(digest: Optional[str], shared: bytes) -> None:
+    """
+    The parent's (registry, matcher), pickled: unless the worker already
+    built the module singleton for the same registry (its main module
+    imported it), in which case that is used as is. Nothing is compiled here.
+    """
+    if digest is not None and _expander is not None and _expander.digest == digest:
+        _worker["state"] = _expander._state
+    else:
+        _worker["state"] = pickle.loads(shared)
+
+
+def _expand_batch(texts: List[str]) -> List[Expansion]:
+    reg, matcher = _worker["state"]
+    return [_expand_counted(reg, matcher, text) for text in texts]
+
+
+def _first_mention(reg: Dict[str, str], seen: Set[str]) -> Callable[[str, str], str]:
+    def repl(short: str, _matched: str) -> str:
+        long = reg.get(short, short)
+        if short in seen:
+            return long
+        seen.add(short)
+        # avoid double-expanding if already "long (short)" present
+        return f"{long} ({short})"
+    return repl
+
+
+class ExpansionSession:
+    """
+    expand() for text that arrives in pieces: transcribe_stream tokens via
+    push(), OnlineASRProcessor's committed segments via push_segment() (pass
+    the ASR backend's `sep`: "" for faster-whisper, whose words carry their
+    own leading space).
+    First mentions are tracked for the whole session. A match ends at most
+    `matcher.max_len` characters after its start and its right boundary is
+    the next character, so text followed by more than that is final: it is
+    expanded and emitted, and only the last few characters are held. An acronym split
+    across pieces is found once the rest arrives; segments joined by such a
+    match are emitted as one (first start, last end). Emitted pieces joined
+    together equal expand() on the joined input.
+    """
+
+    def __init__(self, reg: Dict[str, str], matcher: AcronymMatcher, sep: str = " "):
+        self._matcher = matcher
+        self.sep = sep
+        self.seen: Set[str] = set()
+        self._repl = _first_mention(reg, self.seen)
+        self._hold = matcher.max_len if reg else 0
+        self._ctx = ""  # last emitted character (left boundary of the next match)
+        self._buf = ""  # text not emitted yet
+        # pending pieces: (start, end, offset of the text in _buf, offset of its end)
+        self._pieces: List[Tuple[Optional[float], Optional[float], int, int]] = []
+        self._needs_space = False
+
+    def push(self, text: str) -> str:
+        """Add raw text; returns the expanded text that became final (may be empty)."""
+        if not text:
+            return ""
+        self._add(None, None, text, "")
+        return "".join(piece[2] for piece in self._emit(final=False))
+
+    def push_segment(self, segment: Segment) -> List[Segment]:
+        """Add a committed segment, `sep`-separated from the previous one; returns the finished segments."""
+        beg, end, text = segment
+        if not text:
+            return []
+        sep = self.sep if self._needs_space and not text[0].isspace() else ""
+        self._add(beg, end, text, sep)
+        return self._emit(final=False)
+
+    def finish(self) -> str:
+        """Expand and return whatever is still held."""
+        return "".join(piece[2] for piece in self._emit(final=True))
+
+    def finish_segments(self) -> List[Segment]:
+        """finish() for push_segment() callers: the remaining segments."""
+        return self._emit(final=True)
+
+    def _add(self, beg, end, text: str, sep: str) -> None:
+        start = len(self._buf) + len(sep)
+        self._buf += sep + text
+        self._pieces.append((beg, end, start, len(self._buf)))
+        self._needs_space = not text[-1].isspace()
+
+    def _emit(self, final: bool) -> List[Segment]:
+        if not self._pieces or (not final and len(self._buf) <= self._hold):
+            return []  # nothing can be final yet
+        text, base = self._ctx + self._buf, len(self._ctx)
+        # matches starting before `limit` cannot change whatever comes next
+        limit = len(text) if final else len(text) - self._hold
+        matches = []
+        for match in self._matcher.finditer(text, base):
+            if match[0] >= limit:
+                break
+            matches.append(match)
+
+        # emit whole pieces, up to the last piece end that no match crosses
+        ends = [base + p[3] for p in self._pieces]
+        k = len(ends)
+        while k and (ends[k - 1] > limit or any(i < ends[k - 1] < j for i, j, _ in matches)):
+            k -= 1
+        if not k:
+            return []
+        cut = ends[k - 1]
+
+        out, m = [], 0
+        first = 0  # first piece of the group being built
+        for n in range(k):
+            if any(i < ends[n] < j for i, j, _ in matches[m:]):
+                continue  # a match joins this piece to the next one
+            lo, hi = base + self._pieces[first][2], ends[n]
+            parts, last = [], lo
+            while m < len(matches) and matches[m][1] <= hi:
+                i, j, key = matches[m]
+                parts.append(text[last:i])
+                parts.append(self._repl(key, text[i:j]))
+                last = j
+                m += 1
+            parts.append(text[last:hi])
+            out.append((self._pieces[first][0], self._pieces[n][1], "".join(parts)))
+            first = n + 1
+
+        self._ctx = text[cut - 1]
+        self._buf = text[cut:]
+        shift = cut - base
+        self._pieces = [(b, e, s - shift, t - shift) for b, e, s, t in self._pieces[k:]]
+        return out
+
+
+def _default_expander() -> AcronymExpander:
+    if REGISTRY_PATH.exists():
+        reg, matcher, digest = compile_registry(REGISTRY_PATH)
+        return AcronymExpander(reg, matcher, source=REGISTRY_PATH, digest=digest)
+    # fallback to seed if JSON missing (the file is still watched)
+    return AcronymExpander(_load_registry(), source=REGISTRY_PATH)
 
-        seen = set()
 
-        def repl(m: re.Match) -> str:
-            short = m.group(1)
-            long = self.reg.get(short, short)
-            if short in seen:
-                return long
-            seen.add(short)
-            # avoid double-expanding if already "long (short)" present
-            return f"{long} ({short})"
+# singleton (import and use everywhere): `from core.acronyms import expander`.
+# Built on first access, so pool workers that only import this module for
+# _expand_batch never compile the default registry.
+_expander: Optional[AcronymExpander] = None
+_expander_lock = threading.Lock()
 
-        return self._rx.sub(repl, text)
 
-# singleton (import and use everywhere)
-_registry = _load_registry()
-expander = AcronymExpander(_registry)
+def __getattr__(name: str):
+    global _expander
+    if name != "expander":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _expander_lock:
+        if _expander is None:
+            _expander = _default_expander()
+    return _expander
@@ -0,0 +1,227 @@
+# core/letter_names.py
+"""
+Arabic spellings of Latin letter names -> acronyms, as Whisper writes them
+for mixed Tunisian Arabic speech ('دي دي سبي' -> 'DD SP', 'ايم تي' -> 'MT').
+
+The text is split into words once and each distinct word's punctuation is
+stripped once (cached). Collapsed tokens are a dict lookup, multi-token
+patterns are found by walking a token trie from the current word, and runs
+of letter names are collected as they are read, so one pass over the words
+does it whatever the number of patterns. LetterNameStream does the same on
+text that arrives in pieces.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Single-token collapsed forms Whisper often produces
+# e.g. "سبي" ~= "إس بي" (SP), "ريم" ~= "آر إم" (RM)
+COLLAPSED_TOKEN_MAP = {
+    "سبي": "SP",
+    "ريم": "RM",
+}
+
+# Multi-token patterns → acronym
+# (Keep it small & precise to avoid false positives in Tunisian Arabic)
+PATTERNS = [
+    (("دي", "دي"), "DD"),
+    (("اس", "بي"), "SP"), (("إس", "بي"), "SP"),
+    (("سي", "ار", "ام"), "CRM"), (("سي", "آر", "ام"), "CRM"),
+    (("ار", "ام"), "RM"), (("آر", "ام"), "RM"),
+    (("ام", "تي"), "MT"), (("ايم", "تي"), "MT"),
+    (("كيو", "اي"), "QA"), (("كْيو", "اي"), "QA"),  # QA (Quality Assurance)
+]
+
+# Arabic spellings of Latin letter names (very conservative list)
+LETTER_NAME_MAP = {
+    "اي": "A", "آي": "I", "إي": "E",
+    "بي": "B",
+    "سي": "C",
+    "دي": "D",
+    "اف": "F", "إف": "F",
+    "جي": "G",
+    "اتش": "H", "إتش": "H",
+    "كي": "K",
+    "ام": "M", "ايم": "M",
+    "ان": "N", "إن": "N", "اين": "N",
+    "او": "O", "أو": "O",
+    "كيو": "Q",
+    "ار": "R", "آر": "R",
+    "اس": "S", "إس": "S", "س": "S",   # sometimes Whisper drops the alif
+    "تي": "T",
+    "يو": "U",
+    "في": "V",
+    "اكس": "X", "إكس": "X",
+    "واي": "Y",
+    "زد": "Z", "زين": "Z", "زي": "Z",
+}
+
+
+_LEFT_PUNCT = re.compile(r"^[\W_]+")
+_RIGHT_PUNCT = re.compile(r"[\W_]+$")
+_TERMINAL = None  # trie key of (pattern order, acronym) where a pattern ends
+
+
+@lru_cache(maxsize=65536)
+def _strip_punct(tok: str) -> Tuple[str, str, str]:
+    """Return (core, left_punct, right_punct)."""
+    left = right = ""
+    m = _LEFT_PUNCT.match(tok)
+    if m:
+        left = m.group(0)
+        tok = tok[len(left):]
+    m = _RIGHT_PUNCT.search(tok)
+    if m:
+        right = m.group(0)
+        tok = tok[:-len(right)]
+    return tok, left, right
+
+
+class LetterNameNormalizer:
+    """
+    Rules, tried at each word in this order:
+      1. a collapsed token ('سبي') is replaced, keeping its punctuation;
+      2. the first of `patterns` (in list order) matching the next words is
+         replaced by its acronym;
+      3. with `letter_names`, a run of two or more letter names becomes the
+         acronym they spell;
+      4. otherwise the word is kept.
+    Output words are joined with single spaces.
+    """
+
+    def __init__(self, collapsed: Dict[str, str], patterns: Iterable[Tuple[Tuple[str, ...], str]],
+                 letter_names: Optional[Dict[str, str]] = None):
+        self.collapsed = dict(collapsed)
+        self.letter_names = dict(letter_names or {})
+        self.trie: dict = {}
+        for order, (pat, acro) in enumerate(patterns):
+            node = self.trie
+            for tok in pat:
+                node = node.setdefault(tok, {})
+            node.setdefault(_TERMINAL, (order, acro))  # an earlier duplicate wins
+
+    def _step(self, words: List[str], i: int, final: bool) -> Optional[Tuple[int, str]]:
+        """
+        (next index, output word) for the words starting at i, or None when
+        the answer depends on words that have not arrived yet (only if not final).
+        """
+        n = len(words)
+        core, left, right = _strip_punct(words[i])
+
+        # 1) collapsed one-token (e.g., "سبي", "ريم")
+        acro = self.collapsed.get(core)
+        if acro is not None:
+            return i + 1, left + acro + right
+
+        # 2) multi-token patterns: every pattern along the trie path, earliest listed wins
+        best = None
+        node, j = self.trie.get(core), i + 1
+        while node is not None:
+            hit = node.get(_TERMINAL)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = (hit[0], hit[1], j)
+            if j == n:
+                if not final and len(node) > (hit is not None):
+                    return None  # a pattern could still continue into the next words
+                break
+            node = node.get(_strip_punct(words[j])[0])
+            j += 1
+        if best is not None:
+            return best[2], best[1]
+
+        # 3) generic run of Arabic letter names -> acronym (length >= 2)
+        letters = []
+        j = i
+        while j < n:
+            letter = self.letter_names.get(_strip_punct(words[j])[0])
+            if letter is None:
+                break
+            letters.append(letter)
+            j += 1
+        if j == n and letters and not final:
+            return None  # the run may go on
+        if len(letters) >= 2:
+            return j, "".join(letters)
+
+        # 4) default: keep as-is
+        return i + 1, words[i]
+
+    def _run(self, words: List[str], final: bool) -> Tuple[List[str], int]:
+        """Output words and how many input words they cover."""
+        out, i = [], 0
+        while i < len(words):
+            step = self._step(words, i, final)
+            if step is None:
+                break
+            i, word = step
+            out.append(word)
+        return out, i
+
+    def normalize(self, text: str) -> str:
+        if not text:
+            return text
+        return " ".join(self._run(text.split(), final=True)[0])
+
+    def stream(self) -> "LetterNameStream":
+        return LetterNameStream(self)
+
+
+class LetterNameStream:
+    """
+    normalize() for text that arrives in pieces. A word is decided once the
+    words it depends on have arrived: at most the rest of a pattern, or the
+    end of a letter-name run. The pieces returned by push() and finish(),
+    concatenated, equal normalize() on the whole text.
+    """
+
+    def __init__(self, normalizer: LetterNameNormalizer):
+        self._norm = normalizer
+        self._words: List[str] = []  # complete words not decided yet
+        self._partial = ""  # a word still being written
+        self._started = False
+
+    def push(self, text: str) -> str:
+        if not text:
+            return ""
+        text = self._partial + text
+        words = text.split()
+        self._partial = words.pop() if words and not text[-1].isspace() else ""
+        self._words.extend(words)
+        return self._emit(final=False)
+
+    def finish(self) -> str:
+        if self._partial:
+            self._words.append(self._partial)
+            self._partial = ""
+        return self._emit(final=True)
+
+    def _emit(self, final: bool) -> str:
+        out, used = self._norm._run(self._words, final)
+        del self._words[:used]
+        if not out:
+            return ""
+        sep = " " if self._started else ""
+        self._started = True
+        return sep + " ".join(out)
+
+
+# The two flavours used by the Whisper scripts
+_with_letter_names = LetterNameNormalizer(COLLAPSED_TOKEN_MAP, PATTERNS, LETTER_NAME_MAP)
+_known_only = LetterNameNormalizer(COLLAPSED_TOKEN_MAP, PATTERNS)
+
+
+def normalize_ar_letter_names_to_acronyms(text: str) -> str:
+    """
+    Convert sequences like:
+      'دي دي سبي' -> 'DD SP'
+      'ايم تي'   -> 'MT'
+      'كيو اي'   -> 'QA'
+      'سي ريم'   -> 'CRM' (via 'سي' + 'ريم'->'RM')
+    and also map any run of Arabic letter names (length>=2) to an acronym.
+    """
+    return _with_letter_names.normalize(text)
+
+
+def normalize_known_acronyms(text: str) -> str:
+    """Collapsed tokens and multi-token patterns only (no generic letter-name runs)."""
+    return _known_only.normalize(text)
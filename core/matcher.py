@@ -0,0 +1,107 @@
+# core/matcher.py
+import re
+from typing import Callable, Dict, Iterable, Iterator, Tuple
+
+_ARABIC_BLOCK = "\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF"
+# characters that may not touch an acronym on either side (regex class body)
+WORD_CHARS = rf"0-9A-Za-z_{_ARABIC_BLOCK}"
+UNICODE_WORD = r"\w"
+
+
+def _fold(text: str) -> str:
+    """Lowercase without changing the length (so offsets stay valid)."""
+    low = text.lower()
+    if len(low) == len(text):
+        return low
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class AcronymMatcher:
+    """
+    Multi-pattern matcher for whole-word acronyms. The trie is kept as a flat
+    table: every prefix of every key maps to "" (inner node) or to the
+    registry key ending there. It is walked from word starts only, so
+    matching costs about one lookup per character of the candidate words,
+    whatever the number of keys, and the table pickles/loads as one dict.
+
+    Same rules as the old alternation regex: a match may not have a
+    `word_chars` character right before or after it, and at each start the
+    longest key that satisfies the right boundary wins; matches do not
+    overlap.
+    """
+
+    def __init__(self, keys: Iterable[str] = (), word_chars: str = WORD_CHARS, ignore_case: bool = False):
+        self.word_chars = word_chars
+        self.ignore_case = ignore_case
+        self.table: Dict[str, str] = {}
+        self.size = 0
+        self.max_len = 0  # longest key: how far past its start a match can reach
+        self._starts = None
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: str) -> None:
+        if not key:
+            return
+        folded = _fold(key) if self.ignore_case else key
+        for j in range(1, len(folded)):
+            self.table.setdefault(folded[:j], "")
+        if not self.table.get(folded):  # first key wins for case-insensitive duplicates
+            self.table[folded] = key
+            self.size += 1
+            self.max_len = max(self.max_len, len(folded))
+        self._starts = None
+
+    def _compile(self) -> None:
+        # candidate starts: a possible first character not preceded by a word character
+        first = "".join(re.escape(p) for p in self.table if len(p) == 1)
+        flags = re.IGNORECASE if self.ignore_case else 0
+        self._starts = re.compile(rf"(?<![{self.word_chars}])[{first}]", flags)
+        self._word = re.compile(rf"[{self.word_chars}]")
+
+    # ----- serialization (see the cache in core/acronyms.py) -----
+    def __getstate__(self) -> dict:
+        return {"word_chars": self.word_chars, "ignore_case": self.ignore_case,
+                "table": self.table, "size": self.size, "max_len": self.max_len}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._starts = None
+
+    # ----- matching -----
+    def finditer(self, text: str, pos: int = 0) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, registry key) for each match, left to right."""
+        if not self.table:
+            return
+        if self._starts is None:
+            self._compile()
+        table, word, n = self.table, self._word.match, len(text)
+        folded = _fold(text) if self.ignore_case else text
+        resume = pos
+        for cand in self._starts.finditer(text, pos):
+            i = cand.start()
+            if i < resume:
+                continue
+            j, best = i + 1, None
+            while j <= n:
+                key = table.get(folded[i:j])
+                if key is None:
+                    break
+                if key and (j == n or not word(text, j)):
+                    best = (j, key)
+                j += 1
+            if best is not None:
+                resume = best[0]
+                yield i, best[0], best[1]
+
+    def sub(self, repl: Callable[[str, str], str], text: str) -> str:
+        """Replace every match with repl(registry key, matched text)."""
+        out, last = [], 0
+        for i, j, key in self.finditer(text):
+            out.append(text[last:i])
+            out.append(repl(key, text[i:j]))
+            last = j
+        if not out:
+            return text
+        out.append(text[last:])
+        return "".join(out)
@@ -0,0 +1,152 @@
+# scripts/bench_acronyms.py
+"""
+Acronym expansion with 10, 1k and 100k registry entries: the old matchers
+(one alternation regex in AcronymExpander; one regex per acronym in
+process_transcript.expand_acronyms) vs. the trie in core/matcher.py.
+
+    python scripts/bench_acronyms.py [--sizes 10,1000,100000] [--words 30000]
+
+The registry and transcript are synthetic (Latin and Arabic acronyms mixed
+into meeting speech). Both paths must give identical output, and so must an
+ExpansionSession fed the transcript in small chunks (as a live ASR would). Old paths that
+would take minutes are timed on a slice and extrapolated ("~").
+"""
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from core.acronyms import AcronymExpander  # noqa: E402
+from core.matcher import UNICODE_WORD, WORD_CHARS, AcronymMatcher  # noqa: E402
+
+ARABIC = "ابتثجحخدذرزسشصضطظعغفقكلمنهوي"
+WORDS = ("we", "the", "budget", "release", "customer", "team", "plan", "review", "data",
+         "report", "next", "week", "agreed", "numbers", "فريق", "مشروع", "اجتماع")
+BUDGET_S = 20.0  # per old path; longer runs are extrapolated from a slice
+
+
+def _registry(n: int, rnd: random.Random) -> dict:
+    reg = {}
+    while len(reg) < n:
+        alphabet = ARABIC if rnd.random() < 0.1 else string.ascii_uppercase
+        short = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(2, 6)))
+        # long forms contain digits so they never match another acronym
+        reg.setdefault(short, f"term{len(reg)}x expanded")
+    return reg
+
+
+def _transcript(reg: dict, words: int, rnd: random.Random) -> str:
+    keys = list(reg)
+    out = []
+    for _ in range(words):
+        w = rnd.choice(keys) if rnd.random() < 0.05 else rnd.choice(WORDS)
+        out.append(w + rnd.choice((" ", " ", " ", ", ", ". ", "،")))
+    return "".join(out)
+
+
+# ----- the matchers as they were -----
+def _old_expander(reg):
+    keys = sorted(reg, key=len, reverse=True)
+    rx = re.compile(rf"(?<![{WORD_CHARS}])(" + "|".join(map(re.escape, keys)) + rf")(?![{WORD_CHARS}])")
+
+    def expand(text):
+        seen = set()
+
+        def repl(m):
+            short = m.group(1)
+            if short in seen:
+                return reg[short]
+            seen.add(short)
+            return f"{reg[short]} ({short})"
+        return rx.sub(repl, text)
+    return expand
+
+
+def _old_per_acronym(text, reg):
+    for short, long in reg.items():
+        text = re.compile(rf"(?<!\w)({re.escape(short)})(?!\w)", re.IGNORECASE).sub(long, text)
+    return text
+
+
+def _new_per_acronym(text, reg):
+    return AcronymMatcher(reg, UNICODE_WORD, ignore_case=True).sub(lambda short, _m: reg[short], text)
+
+
+def _streamed(expander, text, rnd):
+    session, out, i = expander.session(), [], 0
+    while i < len(text):
+        j = i + rnd.randint(1, 12)  # chunks cut anywhere, including inside acronyms
+        out.append(session.push(text[i:j]))
+        i = j
+    out.append(session.finish())
+    return "".join(out)
+
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return time.perf_counter() - t0, out
+
+
+def _fmt(seconds, estimated=False):
+    return ("~" if estimated else "") + (f"{seconds * 1000:,.1f} ms" if seconds < 10 else f"{seconds:,.1f} s")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark acronym matchers")
+    ap.add_argument("--sizes", default="10,1000,100000")
+    ap.add_argument("--words", type=int, default=30_000, help="transcript length (~3 h of speech)")
+    args = ap.parse_args()
+
+    ok = True
+    print(f"{'acronyms':>9} {'path':<28}{'build':>12}{'expand':>14}")
+    for n in (int(x) for x in args.sizes.split(",")):
+        rnd = random.Random(n)
+        reg = _registry(n, rnd)
+        text = _transcript(reg, args.words, rnd)
+
+        # AcronymExpander: alternation regex vs trie
+        t_build_old, old = _timed(_old_expander, reg)
+        probe = text[:2000]
+        t_probe, _ = _timed(old, probe)
+        estimated = t_probe * len(text) / len(probe) > BUDGET_S
+        if estimated:
+            t_old, out_old = t_probe * len(text) / len(probe), old(probe)
+        else:
+            t_old, out_old = _timed(old, text)
+        t_build, new = _timed(AcronymExpander, reg)
+        t_new, out_new = _timed(new.expand, text)
+        ok &= out_old == (new.expand(probe) if estimated else out_new)
+        print(f"{n:>9,} {'alternation regex':<28}{_fmt(t_build_old):>12}{_fmt(t_old, estimated):>14}")
+        print(f"{'':>9} {'trie (AcronymExpander)':<28}{_fmt(t_build):>12}{_fmt(t_new):>14}")
+        t_stream, out_stream = _timed(_streamed, new, text, rnd)
+        ok &= out_stream == out_new
+        print(f"{'':>9} {'streamed (ExpansionSession)':<28}{'':>12}{_fmt(t_stream):>14}")
+
+        # process_transcript.expand_acronyms: regex per acronym vs trie
+        items = list(reg.items())
+        sample = dict(items[:200])
+        t_sample, _ = _timed(_old_per_acronym, text, sample)
+        estimated = t_sample * n / len(sample) > BUDGET_S
+        if estimated:
+            t_old = t_sample * n / len(sample)
+        else:
+            t_old, out_old = _timed(_old_per_acronym, text, reg)
+        t_new, out_new = _timed(_new_per_acronym, text, reg)
+        ok &= _old_per_acronym(text, sample) == _new_per_acronym(text, sample) and (
+            estimated or out_old == out_new)
+        print(f"{'':>9} {'regex per acronym':<28}{'':>12}{_fmt(t_old, estimated):>14}")
+        print(f"{'':>9} {'trie (expand_acronyms)':<28}{'':>12}{_fmt(t_new):>14}")
+
+    print("outputs identical" if ok else "MISMATCH between old and new output")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# scripts/bench_calendar.py
+"""
+Month switching on the Calendar page with a large archive (default 50k meetings).
+
+    python scripts/bench_calendar.py [--rows 50000] [--db /tmp/meetsense_bench_calendar.db]
+
+Compares loading a month through list_meetings(date_from, date_to) with the
+calendar_data month query (cold) and its cache (warm). Uses its own database.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+
+def _rows(n):
+    rnd = random.Random(0)
+    start = datetime(2021, 1, 1, 8)
+    for i in range(n):
+        yield dict(
+            name=f"Meeting {i}",
+            occurred_at=start + timedelta(minutes=53 * i),
+            status=rnd.choice(["READY", "DRAFT", "UNUSED"]),
+            department=rnd.choice(["Sales", "R&D", "Support", "Finance"]),
+            transcript_text=f"meeting {i} " + "words " * 400,
+        )
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark calendar month queries")
+    ap.add_argument("--rows", type=int, default=50_000)
+    ap.add_argument("--db", default="/tmp/meetsense_bench_calendar.db")
+    args = ap.parse_args()
+
+    fresh = not os.path.exists(args.db)
+    os.environ["MEETSENSE_DB"] = args.db
+    from Interface.storage import bulk_upsert_meetings, list_meetings, update_meeting
+    from Interface import calendar_data, query_cache
+
+    if fresh:
+        stats = bulk_upsert_meetings(_rows(args.rows))
+        print(f"populated {stats['inserted']:,} rows in {stats['seconds']:.1f}s")
+
+    months = [(2022, m) for m in range(1, 13)]
+    t0 = time.perf_counter()
+    for y, m in months:
+        start = datetime(y, m, 1)
+        list_meetings(date_from=start, date_to=start + timedelta(days=31))
+    old = (time.perf_counter() - t0) / len(months)
+
+    query_cache.clear()
+    t0 = time.perf_counter()
+    for y, m in months:
+        calendar_data.month_days(y, m)
+    cold = (time.perf_counter() - t0) / len(months)
+
+    t0 = time.perf_counter()
+    for y, m in months:
+        calendar_data.month_days(y, m)
+    warm = (time.perf_counter() - t0) / len(months)
+
+    days = calendar_data.month_days(2022, 6)
+    print(f"\n{sum(d.count for d in days.values())} meetings in June 2022 over {len(days)} days")
+    print(f"list_meetings (full rows)  {old * 1000:8.1f} ms / month")
+    print(f"month_days, cold           {cold * 1000:8.1f} ms / month")
+    print(f"month_days, cached         {warm * 1000:8.3f} ms / month")
+
+    mid = days[min(days)].meetings[0]["id"]
+    update_meeting(mid, name="renamed")
+    t0 = time.perf_counter()
+    days = calendar_data.month_days(2022, 6)
+    print(f"after a write, reload      {(time.perf_counter() - t0) * 1000:8.1f} ms "
+          f"(first: {days[min(days)].meetings[0]['name']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# scripts/bench_db_concurrency.py
+"""
+Simultaneous readers and writers against meetings.db-shaped databases:
+default SQLAlchemy/SQLite settings vs. the tuned engine of Interface/db.py.
+
+    python scripts/bench_db_concurrency.py [--readers 8] [--writers 2] [--seconds 10]
+
+Every reader and writer is its own process (spawned like the job workers),
+so they contend on SQLite's file locks the way Streamlit sessions and job
+workers do. Readers page through listings (like the Storage page); writers
+do read-then-update of transcripts (like a job worker finishing). Uses temp
+files.
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+# shared with the spawned workers through the environment
+if "MEETSENSE_BENCH_DIR" not in os.environ:
+    os.environ["MEETSENSE_BENCH_DIR"] = tempfile.mkdtemp(prefix="meetsense_bench_")
+TMP = os.environ["MEETSENSE_BENCH_DIR"]
+os.environ.setdefault("MEETSENSE_DB", os.path.join(TMP, "import.db"))
+
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import Session, load_only  # noqa: E402
+
+from Interface.db import make_engine, writer  # noqa: E402
+from Interface.storage import Base, Meeting, MeetingText  # noqa: E402
+
+ROWS = 5000
+
+
+def _setup(engine):
+    Base.metadata.create_all(engine, tables=[Meeting.__table__, MeetingText.__table__])
+    start = datetime(2022, 1, 1)
+    with engine.begin() as con:
+        con.execute(insert(Meeting), [
+            dict(id=i + 1, name=f"m{i}", occurred_at=start + timedelta(hours=i), status="READY")
+            for i in range(ROWS)
+        ])
+        con.execute(insert(MeetingText), [
+            dict(meeting_id=i + 1, transcript_text="word " * 1000) for i in range(ROWS)
+        ])
+
+
+def _read(engine, rnd):
+    with Session(engine) as s:
+        s.execute(
+            select(Meeting)
+            .options(load_only(Meeting.id, Meeting.name, Meeting.occurred_at))
+            .where(Meeting.id > rnd.randrange(ROWS))
+            .order_by(Meeting.id).limit(50)
+        ).scalars().all()
+
+
+def _write(engine, rnd):
+    with Session(engine) as s:
+        m = s.get(Meeting, rnd.randrange(1, ROWS + 1))
+        m.transcript_text = "updated " * rnd.randrange(500, 1500)
+        s.commit()
+
+
+def _worker(role, path, tuned, immediate, seconds, barrier, results):
+    """One reader or writer process; reports (role, ok count, errors, latencies)."""
+    engine = make_engine(path, tuned=tuned)
+    if role == "write" and immediate:
+        engine = writer(engine)
+    op = _write if role == "write" else _read
+    rnd = random.Random()
+    lat, errors = [], 0
+    _read(engine, rnd)  # open the connection before the clock starts
+    barrier.wait()
+    stop = time.monotonic() + seconds
+    while time.monotonic() < stop:
+        t0 = time.perf_counter()
+        try:
+            op(engine, rnd)
+            lat.append(time.perf_counter() - t0)
+        except OperationalError:
+            errors += 1
+    results.put((role, len(lat), errors, lat))
+
+
+def _run(path, tuned, immediate, readers, writers, seconds):
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(readers + writers)
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=_worker, args=(role, path, tuned, immediate, seconds, barrier, results))
+        for role in ["read"] * readers + ["write"] * writers
+    ]
+    for p in procs:
+        p.start()
+    stats = {"reads": 0, "writes": 0, "errors": 0, "read_lat": [], "write_lat": []}
+    for _ in procs:
+        role, n, errors, lat = results.get()
+        stats[role + "s"] += n
+        stats["errors"] += errors
+        stats[role + "_lat"].extend(lat)
+    for p in procs:
+        p.join()
+    return stats
+
+
+def _p95(xs):
+    return sorted(xs)[int(len(xs) * 0.95)] * 1000 if xs else float("nan")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="SQLite concurrency benchmark")
+    ap.add_argument("--readers", type=int, default=8)
+    ap.add_argument("--writers", type=int, default=2)
+    ap.add_argument("--seconds", type=float, default=10)
+    args = ap.parse_args()
+
+    print(f"{args.readers} reader + {args.writers} writer processes, {args.seconds:.0f}s each\n")
+    print(f"{'engine':<18}{'reads/s':>10}{'writes/s':>10}{'errors':>8}{'read p95 ms':>13}{'write p95 ms':>14}")
+    # "tuned, deferred" isolates BEGIN IMMEDIATE: the same WAL engine, but
+    # writers upgrade a read transaction and get SQLITE_BUSY when they lose
+    for label, tuned, immediate in (
+        ("default", False, False), ("tuned, deferred", True, False), ("tuned", True, True),
+    ):
+        path = os.path.join(TMP, f"{label.replace(', ', '_')}.db")
+        engine = make_engine(path, tuned=tuned)
+        _setup(engine)
+        engine.dispose()
+        st = _run(path, tuned, immediate, args.readers, args.writers, args.seconds)
+        print(f"{label:<18}{st['reads'] / args.seconds:>10.0f}{st['writes'] / args.seconds:>10.0f}"
+              f"{st['errors']:>8}{_p95(st['read_lat']):>13.1f}{_p95(st['write_lat']):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# scripts/bench_expand_many.py
+"""
+Batch acronym expansion: expander.expand() in a loop vs.
+AcronymExpander.expand_many() in-process and on a process pool.
+
+    python scripts/bench_expand_many.py [--acronyms 100000] [--docs 2000] [--words 3000] [--workers 4]
+
+Registry and documents are synthetic (see bench_acronyms.py). The registry
+is written to a temp file and compiled once, as the app does, so pool
+workers load the cached matcher instead of compiling it. Every path must
+give the same texts; the per-document match counts are checked against a
+plain count of the matches.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from core.acronyms import AcronymExpander, compile_registry  # noqa: E402
+from scripts.bench_acronyms import _registry, _transcript  # noqa: E402
+
+
+def _timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return time.perf_counter() - t0, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark batch acronym expansion")
+    ap.add_argument("--acronyms", type=int, default=100_000)
+    ap.add_argument("--docs", type=int, default=2_000)
+    ap.add_argument("--words", type=int, default=3_000, help="words per document")
+    ap.add_argument("--workers", type=int, default=max(2, os.cpu_count() or 1), help="pool size (>= 2)")
+    args = ap.parse_args()
+
+    rnd = random.Random(0)
+    reg = _registry(args.acronyms, rnd)
+    docs = [_transcript(reg, rnd.randint(args.words // 2, args.words * 3 // 2), rnd) for _ in range(args.docs)]
+    chars = sum(map(len, docs))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "acronyms.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(reg, f, ensure_ascii=False)
+        reg, matcher, digest = compile_registry(Path(path))
+        expander = AcronymExpander(reg, matcher, digest=digest)
+
+        t_loop, expected = _timed(lambda: [expander.expand(d) for d in docs])
+        t_many, one = _timed(expander.expand_many, docs, workers=1)
+        t_pool, pooled = _timed(expander.expand_many, docs, workers=max(2, args.workers))
+
+    ok = [r.text for r in one] == expected == [r.text for r in pooled]
+    ok &= all(r.matches == sum(1 for _ in matcher.finditer(d)) == sum(r.counts.values())
+              for r, d in zip(pooled, docs))
+    ok &= [r.counts for r in one] == [r.counts for r in pooled]
+
+    mb = chars / 1e6
+    print(f"{args.docs:,} documents, {mb:,.1f} M chars, {len(reg):,} acronyms, "
+          f"{sum(r.matches for r in pooled):,} matches")
+    for name, t in (("expand() loop", t_loop), ("expand_many (1 process)", t_many),
+                    (f"expand_many ({max(2, args.workers)} workers)", t_pool)):
+        print(f"  {name:<28}{t:>8.2f} s {mb / t:>8.1f} M chars/s")
+    print("outputs identical" if ok else "MISMATCH between paths")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# scripts/bench_knowledge.py
+"""
+Knowledge extraction on a long transcript: the three separate extractors
+(each splitting the whole text again) vs. the single-pass analyze() vs.
+KnowledgeStream fed one "word " token at a time, as during transcription.
+
+    python scripts/bench_knowledge.py [--hours 3] [--wpm 150]
+
+The transcript is synthetic meeting speech with cues sprinkled in. Both
+paths must return identical results; reports the best of five runs.
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from Interface.knowledge import KnowledgeStream, analyze  # noqa: E402
+
+WORDS = ("we", "the", "budget", "release", "customer", "team", "plan", "review", "data",
+         "model", "report", "next", "week", "agreed", "about", "numbers", "should", "maybe")
+CUES = ("Alice will send the report", "Action: update the roadmap", "follow-up with legal",
+        "deadline is Friday", "Key risk: vendor delay", "next step - migrate the DB", "TODO fix CI")
+
+
+def _transcript(hours: float, wpm: int) -> str:
+    rnd = random.Random(0)
+    target = int(hours * 60 * wpm)
+    out, n = [], 0
+    while n < target:
+        k = rnd.randint(6, 20)
+        words = [rnd.choice(WORDS) for _ in range(k)]
+        if rnd.random() < 0.08:
+            words.insert(rnd.randrange(k), rnd.choice(CUES))
+        out.append(" ".join(words) + rnd.choice((". ", "? ", "! ", ".\n")))
+        n += k
+    return "".join(out)
+
+
+# The extractors as they were before analyze(): three splits, lowercase + cue loop
+def _legacy(transcript: str):
+    sents = re.split(r"[\n\.!?]+", transcript)
+    points = [s.strip() for s in sents if any(sym in s for sym in (":", "-", "•")) and len(s.strip()) > 8]
+    points = points[:10] or [s.strip() for s in sents if s.strip()][:5]
+
+    sents = re.split(r"[\n\.!?]+", transcript)
+    cues = ("action", "todo", "follow up", "follow-up", "assign",
+            "deadline", "next step", "will", "task", "owner")
+    actions = [s.strip() for s in sents if any(c in s.lower() for c in cues)][:10]
+
+    sents = [s.strip() for s in re.split(r"[\n\.!?]+", transcript) if s.strip()]
+    summary = ""
+    if sents:
+        summary = (" ".join(sents[:3]).strip() + "\n\n...\n\n" + " ".join(sents[-3:]).strip()).strip()
+    return points, actions, summary
+
+
+def _new(transcript: str):
+    r = analyze(transcript)
+    return r.key_points, r.action_items, r.summary
+
+
+def _streamed(tokens):
+    k = KnowledgeStream()
+    for tok in tokens:
+        k.push(tok)
+    r = k.finish()
+    return r.key_points, r.action_items, r.summary
+
+
+def _best(fn, runs=5):
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark knowledge extraction")
+    ap.add_argument("--hours", type=float, default=3.0)
+    ap.add_argument("--wpm", type=int, default=150, help="speaking rate, words per minute")
+    args = ap.parse_args()
+
+    text = _transcript(args.hours, args.wpm)
+    print(f"transcript: {args.hours:g} h, {len(text.split()):,} words, {len(text) / 1024:,.0f} KiB")
+
+    t_old, _ = _best(lambda: _legacy(text))
+    t_new, _ = _best(lambda: analyze(text))
+    print(f"{'three extractors':<20}{t_old * 1000:>9.1f} ms")
+    print(f"{'analyze()':<20}{t_new * 1000:>9.1f} ms   ({t_old / t_new:.1f}x)")
+    tokens = [w + " " for w in text.split(" ")]
+    t_stream, streamed = _best(lambda: _streamed(tokens))
+    print(f"{'KnowledgeStream':<20}{t_stream * 1000:>9.1f} ms   ({len(tokens):,} pushes, no final pass)")
+
+    samples = (text, "", "no cues here", "a-b. Owner: x\nWILL do it! tail", "Follow-up soon", "...!?")
+    bad = [t[:40] for t in samples if _legacy(t) != _new(t)]
+    if streamed != _new(text + " "):
+        bad.append("streamed tokens")
+    if bad:
+        print("MISMATCH on:", bad)
+        sys.exit(1)
+    print("results identical")
+
+
+if __name__ == "__main__":
+    main()
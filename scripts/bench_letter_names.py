@@ -0,0 +1,184 @@
+# scripts/bench_letter_names.py
+"""
+Arabic letter-name normalization: the per-word loop over every pattern that
+the Whisper scripts used to carry vs. the token trie in core/letter_names.py.
+
+    python scripts/bench_letter_names.py [--words 2000,30000,300000] [--patterns 11,500]
+
+Transcripts are synthetic Tunisian-Arabic-like speech with letter names,
+collapsed tokens and punctuation mixed in; extra patterns are random letter
+name sequences. Old and new output must be identical, for both flavours
+(with and without letter-name runs), and so must LetterNameStream fed the
+text in small chunks. Old runs that would take minutes are timed on a slice
+and extrapolated ("~").
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from core.letter_names import (  # noqa: E402
+    COLLAPSED_TOKEN_MAP, LETTER_NAME_MAP, PATTERNS, LetterNameNormalizer,
+)
+
+WORDS = ("باش", "نعملو", "الاجتماع", "على", "الميزانية", "réunion", "client", "projet",
+         "و", "في", "كي", "team", "sprint", "اليوم", "غدوة", "مع")
+PUNCT = ("", "", "", ",", ".", "،", "؟", "(", ")")
+BUDGET_S = 20.0  # for the old path; longer runs are extrapolated from a slice
+
+
+# ----- the normalizer as it was (Transcription/test_whisper.py) -----
+def _old_strip_punct(tok):
+    left = ""
+    right = ""
+    m = re.match(r"^[\W_]+", tok)
+    if m:
+        left = m.group(0)
+        tok = tok[len(left):]
+    m = re.search(r"[\W_]+$", tok)
+    if m:
+        right = m.group(0)
+        tok = tok[:-len(right)]
+    return tok, left, right
+
+
+def _old_normalize(text, patterns, letter_names):
+    if not text:
+        return text
+    words = text.split()
+    out = []
+    i = 0
+    n = len(words)
+    while i < n:
+        raw = words[i]
+        core, left_p, right_p = _old_strip_punct(raw)
+        if core in COLLAPSED_TOKEN_MAP:
+            out.append(left_p + COLLAPSED_TOKEN_MAP[core] + right_p)
+            i += 1
+            continue
+        matched = False
+        for pat, acro in patterns:
+            mlen = len(pat)
+            if i + mlen <= n:
+                window = [_old_strip_punct(w)[0] for w in words[i:i + mlen]]
+                if tuple(window) == pat:
+                    out.append(acro)
+                    i += mlen
+                    matched = True
+                    break
+        if matched:
+            continue
+        j = i
+        letters = []
+        while j < n:
+            w_core = _old_strip_punct(words[j])[0]
+            if w_core in letter_names:
+                letters.append(letter_names[w_core])
+                j += 1
+            else:
+                break
+        if len(letters) >= 2:
+            out.append("".join(letters))
+            i = j
+            continue
+        out.append(words[i])
+        i += 1
+    return " ".join(out)
+
+
+def _patterns(n, rnd):
+    pats = list(PATTERNS)
+    names = list(LETTER_NAME_MAP)
+    while len(pats) < n:
+        pat = tuple(rnd.choice(names) for _ in range(rnd.randint(2, 4)))
+        pats.append((pat, "".join(LETTER_NAME_MAP[t] for t in pat)))
+    return pats
+
+
+def _transcript(words, patterns, rnd):
+    names, collapsed = list(LETTER_NAME_MAP), list(COLLAPSED_TOKEN_MAP)
+    out = []
+    while len(out) < words:
+        r = rnd.random()
+        if r < 0.05:
+            toks = list(rnd.choice(patterns)[0])
+        elif r < 0.10:
+            toks = [rnd.choice(names) for _ in range(rnd.randint(1, 4))]
+        elif r < 0.12:
+            toks = [rnd.choice(collapsed)]
+        else:
+            toks = [rnd.choice(WORDS)]
+        out.extend(rnd.choice(PUNCT[4:]) * (rnd.random() < 0.05) + t + rnd.choice(PUNCT) for t in toks)
+    return " ".join(out)
+
+
+def _streamed(normalizer, text, rnd):
+    stream, out, i = normalizer.stream(), [], 0
+    while i < len(text):
+        j = i + rnd.randint(1, 30)  # chunks cut anywhere, including inside words
+        out.append(stream.push(text[i:j]))
+        i = j
+    out.append(stream.finish())
+    return "".join(out)
+
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return time.perf_counter() - t0, out
+
+
+def _fmt(seconds, estimated=False):
+    return ("~" if estimated else "") + (f"{seconds * 1000:,.1f} ms" if seconds < 10 else f"{seconds:,.1f} s")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark the Arabic letter-name normalizer")
+    ap.add_argument("--words", default="2000,30000,300000", help="transcript lengths (30k words ~ 3 h)")
+    ap.add_argument("--patterns", default=f"{len(PATTERNS)},500")
+    args = ap.parse_args()
+
+    ok = True
+    print(f"{'patterns':>9} {'words':>9} {'flavour':<14}{'old':>12}{'trie':>12}{'streamed':>12}")
+    for p in (int(x) for x in args.patterns.split(",")):
+        for w in (int(x) for x in args.words.split(",")):
+            rnd = random.Random(p * 1_000_003 + w)
+            patterns = _patterns(p, rnd)
+            text = _transcript(w, patterns, rnd)
+            for flavour, letter_names in (("letter runs", LETTER_NAME_MAP), ("patterns only", {})):
+                new = LetterNameNormalizer(COLLAPSED_TOKEN_MAP, patterns, letter_names)
+                t_new, out_new = _timed(new.normalize, text)
+                t_stream, out_stream = _timed(_streamed, new, text, rnd)
+                probe = " ".join(text.split()[:2000])
+                t_probe, out_old = _timed(_old_normalize, probe, patterns, letter_names)
+                estimated = t_probe * len(text) / len(probe) > BUDGET_S
+                if estimated:
+                    t_old = t_probe * len(text) / len(probe)
+                    ok &= out_old == new.normalize(probe)
+                else:
+                    t_old, out_old = _timed(_old_normalize, text, patterns, letter_names)
+                    ok &= out_old == out_new
+                ok &= out_stream == out_new
+                print(f"{p:>9,} {w:>9,} {flavour:<14}{_fmt(t_old, estimated):>12}"
+                      f"{_fmt(t_new):>12}{_fmt(t_stream):>12}")
+
+    # edge cases: punctuation-only words, duplicates, empty and blank input
+    cases = ["", "   ", "دي دي سبي", "ايم تي", "كيو اي", "سي ريم", "(اس بي)، و سي ار ام.",
+             "... اس", "اس", "سي آر", "اي بي سي دي", "كْيو اي!", "زد, زين. في"]
+    for letter_names in (LETTER_NAME_MAP, {}):
+        new = LetterNameNormalizer(COLLAPSED_TOKEN_MAP, PATTERNS, letter_names)
+        for case in cases:
+            ok &= _old_normalize(case, PATTERNS, letter_names) == new.normalize(case) == _streamed(
+                new, case, random.Random(0))
+
+    print("outputs identical" if ok else "MISMATCH between old and new output")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# scripts/bench_list_meetings.py
+"""
+Benchmark list_meetings on a synthetic archive (default 100k meetings).
+
+    python scripts/bench_list_meetings.py [--rows 100000] [--db /tmp/meetsense_bench.db]
+
+Compares the old path (load every row, filter in Python) with SQL-side
+filtering + keyset pagination + listing-only columns. Uses its own database;
+data/meetings.db is never touched.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+
+def _populate(engine, Meeting, rows: int) -> None:
+    from sqlalchemy import insert
+    from Interface.storage import MeetingText, TEXT_COLUMNS
+
+    rnd = random.Random(0)
+    depts = ["Sales", "R&D", "Support", "Finance", "HR", "Ops"]
+    owners = [f"user{i}" for i in range(200)]
+    statuses = ["UNUSED", "DRAFT", "READY", "ARCHIVED"]
+    words = "meeting client release deadline report action follow up next week budget".split()
+    start = datetime(2020, 1, 1)
+    batch = []
+    with engine.begin() as con:
+        for i in range(rows):
+            text = " ".join(rnd.choice(words) for _ in range(800))  # ~5 KB transcript
+            batch.append(dict(
+                name=f"Meeting {i} {rnd.choice(words)}",
+                tags=",".join(rnd.sample(words, 2)),
+                occurred_at=start + timedelta(minutes=37 * i),
+                transcript_text=text,
+                summary=text[:600],
+                key_points=text[:300],
+                action_items=text[:300],
+                status=rnd.choice(statuses),
+                department=rnd.choice(depts),
+                owner=rnd.choice(owners),
+            ))
+            if len(batch) == 5000:
+                _insert(con, Meeting, MeetingText, TEXT_COLUMNS, batch)
+                batch = []
+        if batch:
+            _insert(con, Meeting, MeetingText, TEXT_COLUMNS, batch)
+
+
+def _insert(con, Meeting, MeetingText, text_columns, batch) -> None:
+    from sqlalchemy import insert
+
+    rows = [{k: v for k, v in r.items() if k not in text_columns} for r in batch]
+    ids = con.execute(insert(Meeting).returning(Meeting.id), rows).scalars().all()
+    con.execute(insert(MeetingText), [
+        {"meeting_id": i, **{c: r[c] for c in text_columns}} for i, r in zip(ids, batch)
+    ])
+
+
+def _old_list_meetings(engine, Meeting, **f):
+    """The pre-SQL implementation, kept here as the baseline."""
+    from sqlalchemy import select
+    from sqlalchemy.orm import Session, selectinload
+
+    with Session(engine) as s:
+        meetings = s.execute(select(Meeting).options(selectinload(Meeting.body))).scalars().all()
+
+    def match(m):
+        return all([
+            (f["name_query"].lower() in m.name.lower()) if f.get("name_query") else True,
+            (f["department"].lower() in (m.department or "").lower()) if f.get("department") else True,
+            (f["status"].lower() == (m.status or "").lower()) if f.get("status") else True,
+            (m.occurred_at >= f["date_from"]) if f.get("date_from") else True,
+            (m.occurred_at <= f["date_to"]) if f.get("date_to") else True,
+        ])
+
+    return sorted((m for m in meetings if match(m)), key=lambda m: m.occurred_at, reverse=True)
+
+
+def _time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark list_meetings")
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--db", default="/tmp/meetsense_bench_list.db")
+    args = ap.parse_args()
+
+    fresh = not os.path.exists(args.db)
+    os.environ["MEETSENSE_DB"] = args.db
+    from Interface.storage import engine, Meeting, list_meetings, page_cursor
+
+    if fresh:
+        t0 = time.perf_counter()
+        _populate(engine, Meeting, args.rows)
+        print(f"populated {args.rows:,} rows in {time.perf_counter() - t0:.1f}s")
+
+    cases = {
+        "no filter": {},
+        "status": {"status": "READY"},
+        "dept + status": {"department": "Sales", "status": "DRAFT"},
+        "one month": {"date_from": datetime(2022, 3, 1), "date_to": datetime(2022, 4, 1)},
+        "name contains": {"name_query": "budget"},
+    }
+    print(f"\n{'case':<16}{'old (s)':>10}{'new page (ms)':>15}{'page 20 (ms)':>14}")
+    for label, f in cases.items():
+        old_t, _ = _time(lambda: _old_list_meetings(engine, Meeting, **f), repeat=1)
+        new_t, page = _time(lambda: list_meetings(**f, limit=50, listing_only=True))
+
+        # walk to page 20 with keyset cursors, then time that page alone
+        cursor = None
+        for _ in range(19):
+            rows = list_meetings(**f, limit=50, after=cursor, listing_only=True)
+            if not rows:
+                break
+            cursor = page_cursor(rows[-1])
+        deep_t, _ = _time(lambda: list_meetings(**f, limit=50, after=cursor, listing_only=True))
+        print(f"{label:<16}{old_t:>10.2f}{new_t * 1000:>15.1f}{deep_t * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# scripts/bench_listing_rows.py
+"""
+Listing 50k meetings into a DataFrame: detached ORM objects (the old page
+code) vs. MeetingRow slots objects vs. a DataFrame built from the cursor.
+
+    python scripts/bench_listing_rows.py [--rows 50000] [--db /tmp/meetsense_bench_rows.db]
+
+Reports the best of three runs and the peak Python memory of one run.
+Uses its own database; data/meetings.db is never touched.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+
+def _rows(n):
+    rnd = random.Random(0)
+    start = datetime(2020, 1, 1, 9)
+    for i in range(n):
+        yield dict(
+            name=f"Meeting {i}",
+            tags="weekly,sync",
+            occurred_at=start + timedelta(minutes=41 * i),
+            status=rnd.choice(["READY", "DRAFT", "UNUSED"]),
+            department=rnd.choice(["Sales", "R&D", "Support", "Finance"]),
+            owner=f"user{rnd.randrange(100)}",
+            audio_path=f"data/uploads/{i:08x}.wav",
+            transcript_text=f"meeting {i} notes",
+        )
+
+
+def _measure(fn):
+    best = float("inf")
+    for _ in range(3):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    out = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark listing read paths")
+    ap.add_argument("--rows", type=int, default=50_000)
+    ap.add_argument("--db", default="/tmp/meetsense_bench_rows.db")
+    args = ap.parse_args()
+
+    fresh = not os.path.exists(args.db)
+    os.environ["MEETSENSE_DB"] = args.db
+    import pandas as pd
+    from Interface.storage import bulk_upsert_meetings, list_meeting_rows, list_meetings, meetings_frame
+
+    if fresh:
+        stats = bulk_upsert_meetings(_rows(args.rows))
+        print(f"populated {stats['inserted']:,} rows in {stats['seconds']:.1f}s")
+
+    def orm_frame():
+        return pd.DataFrame([
+            {"ID": m.id, "Name": m.name, "Tags": m.tags, "Occurred At": m.occurred_at,
+             "Owner": m.owner, "Department": m.department, "Status": m.status,
+             "Audio": m.audio_path, "Transcript": m.transcript_path}
+            for m in list_meetings(listing_only=True)
+        ])
+
+    cases = {
+        "ORM objects": lambda: list_meetings(listing_only=True),
+        "ORM -> DataFrame": orm_frame,
+        "MeetingRow slots": list_meeting_rows,
+        "cursor -> DataFrame": meetings_frame,
+    }
+    print(f"\n{'path':<22}{'rows':>8}{'best ms':>10}{'peak MB':>10}")
+    for label, fn in cases.items():
+        t, peak, out = _measure(fn)
+        print(f"{label:<22}{len(out):>8}{t * 1000:>10.0f}{peak / 2**20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# scripts/bench_live_transcript.py
+"""
+Compare the old per-token live transcript rendering with LiveTranscriptView
+on a simulated 1-hour meeting (~150 words/minute).
+
+    python scripts/bench_live_transcript.py [--minutes 60] [--wpm 150]
+
+Token arrival times are simulated, so the run takes CPU time only.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from Interface.live import LiveTranscriptView  # noqa: E402
+
+
+class _Slot:
+    """Stands in for st.empty(): counts what would be sent to the browser."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def markdown(self, text):
+        self.stats["updates"] += 1
+        self.stats["chars"] += len(text)
+
+    caption = markdown
+
+
+class _Container(_Slot):
+    def empty(self):
+        return _Slot(self.stats)
+
+
+def _tokens(minutes: int, wpm: int):
+    rnd = random.Random(0)
+    vocab = ["meeting", "deadline", "SP", "release", "client", "report", "we", "will",
+             "follow", "up", "next", "week", "the", "action", "item", "is", "assigned"]
+    n = minutes * wpm
+    step = 60.0 / wpm
+    return [(i * step, rnd.choice(vocab) + " ") for i in range(n)]
+
+
+def bench_naive(tokens):
+    stats = {"updates": 0, "chars": 0}
+    out = _Slot(stats)
+    t0 = time.process_time()
+    running_text = ""
+    for _, tok in tokens:
+        running_text += tok
+        out.markdown(f"**Live Transcript**\n\n{running_text}")
+    return stats, time.process_time() - t0
+
+
+def bench_live(tokens, burst: bool):
+    stats = {"updates": 0, "chars": 0}
+    now = [0.0]
+    view = LiveTranscriptView(_Container(stats), clock=lambda: now[0])
+    t0 = time.process_time()
+    for ts, tok in tokens:
+        # burst=True: an offline backend delivering every token at once
+        now[0] = 0.0 if burst else ts
+        view.push(tok)
+    view.close()
+    return stats, time.process_time() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--minutes", type=int, default=60)
+    ap.add_argument("--wpm", type=int, default=150)
+    args = ap.parse_args()
+
+    tokens = _tokens(args.minutes, args.wpm)
+    duration = args.minutes * 60.0
+    print(f"{len(tokens):,} tokens over {args.minutes} min\n")
+    print(f"{'renderer':<28}{'updates':>10}{'upd/s':>8}{'MB sent':>10}{'CPU s':>8}")
+    for label, (stats, cpu) in (
+        ("per-token (old)", bench_naive(tokens)),
+        ("LiveTranscriptView (live)", bench_live(tokens, burst=False)),
+        ("LiveTranscriptView (burst)", bench_live(tokens, burst=True)),
+    ):
+        print(f"{label:<28}{stats['updates']:>10,}{stats['updates'] / duration:>8.2f}"
+              f"{stats['chars'] / 1e6:>10.2f}{cpu:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# scripts/bench_text_storage.py
+"""
+Database size and listing latency with transcripts stored inline in meetings
+(the old layout) vs. compressed in meeting_texts (Interface/storage.py).
+
+    python scripts/bench_text_storage.py [--rows 2000] [--kb 50]
+
+Builds an old-layout database in a temp dir, copies it, lets Interface.storage
+migrate the copy on import, VACUUMs both and compares. data/meetings.db is
+never touched.
+"""
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+OLD_SCHEMA = """
+CREATE TABLE meetings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(255), tags VARCHAR(255), occurred_at DATETIME,
+    audio_path VARCHAR(1024), transcript_path VARCHAR(1024),
+    transcript_text TEXT, summary TEXT, key_points TEXT, action_items TEXT,
+    status VARCHAR(50), department VARCHAR(120), owner VARCHAR(120), content_hash VARCHAR(64)
+);
+CREATE INDEX ix_meetings_occurred_at ON meetings (occurred_at);
+CREATE VIRTUAL TABLE meetings_fts USING fts5(
+    name, transcript_text, summary, key_points, action_items,
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+# Listing queries as list_meetings() issues them (listing columns only)
+LISTINGS = {
+    "newest page": "SELECT id, name, tags, occurred_at, status, department, owner FROM meetings "
+                   "ORDER BY occurred_at DESC LIMIT 50",
+    "dept contains": "SELECT id, name, tags, occurred_at, status, department, owner FROM meetings "
+                     "WHERE department LIKE '%ale%' ORDER BY occurred_at DESC LIMIT 50",
+    "owner contains": "SELECT id, name, tags, occurred_at, status, department, owner FROM meetings "
+                      "WHERE owner LIKE '%user1%' ORDER BY occurred_at DESC LIMIT 50 OFFSET 500",
+    "count by status": "SELECT status, count(*) FROM meetings GROUP BY status",
+}
+
+
+def _vocabulary(rnd, n=20000):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rnd.choice(letters) for _ in range(rnd.randint(2, 10))) for _ in range(n)]
+
+
+def _build_old(path, rows, kb):
+    rnd = random.Random(0)
+    vocab = _vocabulary(rnd)
+    # Zipf-like word frequencies, as in real speech
+    weights = [1.0 / (i + 1) for i in range(len(vocab))]
+    con = sqlite3.connect(path)
+    con.executescript(OLD_SCHEMA)
+    start = datetime(2021, 1, 1)
+    for i in range(rows):
+        words = []
+        size = 0
+        while size < kb * 1024:
+            chunk = rnd.choices(vocab, weights, k=200)
+            words.extend(chunk)
+            size += sum(len(w) + 1 for w in chunk)
+        transcript = " ".join(words)
+        row = (
+            f"Meeting {i}", "weekly,sync", (start + timedelta(hours=7 * i)).isoformat(" "),
+            transcript, transcript[:800], transcript[:400], transcript[:400], "READY",
+            rnd.choice(["Sales", "R&D", "Support", "Finance"]), f"user{rnd.randrange(200)}",
+        )
+        cur = con.execute(
+            "INSERT INTO meetings (name, tags, occurred_at, transcript_text, summary, key_points, "
+            "action_items, status, department, owner) VALUES (?,?,?,?,?,?,?,?,?,?)", row,
+        )
+        con.execute(
+            "INSERT INTO meetings_fts(rowid, name, transcript_text, summary, key_points, action_items) "
+            "VALUES (?,?,?,?,?,?)", (cur.lastrowid, row[0], *row[3:7]),
+        )
+    con.commit()
+    con.close()
+
+
+def _vacuum(path):
+    con = sqlite3.connect(path)
+    con.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    con.execute("PRAGMA journal_mode=DELETE")
+    con.execute("VACUUM")
+    con.close()
+
+
+def _sizes(path):
+    con = sqlite3.connect(path)
+    try:
+        by_table = dict(con.execute(
+            "SELECT name, sum(pgsize) FROM dbstat GROUP BY name"
+        ).fetchall())
+    except sqlite3.OperationalError:  # no dbstat in this build
+        by_table = {}
+    con.close()
+    return os.path.getsize(path), by_table
+
+
+def _time_listings(path, repeat=5):
+    out = {}
+    for label, sql in LISTINGS.items():
+        best = float("inf")
+        for _ in range(repeat):
+            con = sqlite3.connect(path)  # fresh connection: no warm page cache
+            t0 = time.perf_counter()
+            con.execute(sql).fetchall()
+            best = min(best, time.perf_counter() - t0)
+            con.close()
+        out[label] = best * 1000
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Inline vs compressed transcript storage")
+    ap.add_argument("--rows", type=int, default=2000)
+    ap.add_argument("--kb", type=int, default=50, help="transcript size per meeting")
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="meetsense_text_")
+    old, new = os.path.join(tmp, "old.db"), os.path.join(tmp, "new.db")
+    t0 = time.perf_counter()
+    _build_old(old, args.rows, args.kb)
+    _vacuum(old)
+    print(f"built {args.rows:,} meetings x {args.kb} KB in {time.perf_counter() - t0:.1f}s")
+
+    shutil.copy(old, new)
+    os.environ["MEETSENSE_DB"] = new
+    os.environ.setdefault("MEETSENSE_USERS_DB", os.path.join(tmp, "users.db"))
+    t0 = time.perf_counter()
+    from Interface import storage
+    print(f"migrated on import in {time.perf_counter() - t0:.1f}s")
+    storage.engine.dispose()
+    _vacuum(new)
+
+    (old_size, old_tables), (new_size, new_tables) = _sizes(old), _sizes(new)
+    print(f"\n{'':<22}{'inline':>12}{'compressed':>12}")
+    print(f"{'file MB':<22}{old_size / 2**20:>12.1f}{new_size / 2**20:>12.1f}")
+    for table in ("meetings", "meeting_texts", "meetings_fts_data"):
+        if table in old_tables or table in new_tables:
+            print(f"{table + ' MB':<22}{old_tables.get(table, 0) / 2**20:>12.1f}"
+                  f"{new_tables.get(table, 0) / 2**20:>12.1f}")
+
+    old_t, new_t = _time_listings(old), _time_listings(new)
+    for label in LISTINGS:
+        print(f"{label + ' ms':<22}{old_t[label]:>12.1f}{new_t[label]:>12.1f}")
+
+    mid = args.rows // 2
+    t0 = time.perf_counter()
+    m = storage.get_meeting(mid)
+    print(f"\nget_meeting (decompress {len(m.transcript_text) // 1024} KB): "
+          f"{(time.perf_counter() - t0) * 1000:.1f} ms")
+    t0 = time.perf_counter()
+    hits = storage.search_meetings(m.transcript_text.split()[5])
+    print(f"search_meetings ({len(hits)} hits with snippets): {(time.perf_counter() - t0) * 1000:.1f} ms")
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,23 @@
 # scripts/build_acronym_registry.py
+"""
+Write data/acronyms.json from tools/acronym_seed.py and precompile its
+matcher into the cache. Running processes pick the new registry up within
+core.acronyms.RELOAD_INTERVAL seconds, without a restart.
+"""
 import json
+import os
+import sys
 from pathlib import Path
-from tools.acronym_seed import ACRONYMS
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from core.acronyms import REGISTRY_PATH, compile_registry  # noqa: E402
+from tools.acronym_seed import ACRONYMS  # noqa: E402
 
 def main():
-    project_root = Path(__file__).resolve().parents[1]
-    data_dir = project_root / "data"
-    data_dir.mkdir(exist_ok=True)
+    out = Path(REGISTRY_PATH)
+    out.parent.mkdir(parents=True, exist_ok=True)
 
     # validate & normalize to dict short->long
     reg = {}
@@ -17,9 +28,13 @@ def main():
             continue
         reg[short] = long
 
-    out = data_dir / "acronyms.json"
-    out.write_text(json.dumps(reg, ensure_ascii=False, indent=2), encoding="utf-8")
-    print(f"✅ Wrote {out} with {len(reg)} acronyms")
+    # compile first, then rename into place: watchers never see a half-written
+    # file, and their reload finds the matcher already cached
+    tmp = out.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(reg, ensure_ascii=False, indent=2), encoding="utf-8")
+    _, matcher, digest = compile_registry(tmp, cache_for=out)
+    os.replace(tmp, out)
+    print(f"✅ Wrote {out} with {len(reg)} acronyms (matcher cached as {digest[:12]}, {matcher.size} keys)")
 
 if __name__ == "__main__":
     main()
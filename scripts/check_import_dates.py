@@ -0,0 +1,68 @@
+# scripts/check_import_dates.py
+"""
+Import check for occurred_at parsing: exits non-zero if a CSV whose rows mix
+UTC offsets ("+01:00", "Z") and naive times does not import as expected.
+
+    python scripts/check_import_dates.py
+
+Runs against temp databases. Rows with an offset must be stored as naive
+local time, naive rows unchanged, and unparseable rows counted as invalid
+instead of aborting the import.
+"""
+import csv
+import io
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+_tmp = tempfile.mkdtemp(prefix="meetsense_dates_")
+os.environ["MEETSENSE_DB"] = os.path.join(_tmp, "meetings.db")
+os.environ["MEETSENSE_USERS_DB"] = os.path.join(_tmp, "users.db")
+
+from Interface.storage import bulk_upsert_meetings, list_meetings  # noqa: E402
+
+CSV = """name,occurred_at,transcript_text
+paris,2024-01-01T10:00:00+01:00,first
+utc,2024-01-01T09:00:00Z,second
+naive,2024-01-02 08:00,third
+garbage,not a date,fourth
+empty,,fifth
+"""
+
+
+def _local(iso: str) -> datetime:
+    return datetime.fromisoformat(iso).astimezone().replace(tzinfo=None)
+
+
+def main():
+    rows = list(csv.DictReader(io.StringIO(CSV)))
+    stats = bulk_upsert_meetings(rows)
+    stored = {m.name: m.occurred_at for m in list_meetings()}
+    expected = {
+        "paris": _local("2024-01-01T10:00:00+01:00"),
+        "utc": _local("2024-01-01T09:00:00+00:00"),
+        "naive": datetime(2024, 1, 2, 8, 0),
+    }
+
+    failures = []
+    if stats["invalid"] != 2:
+        failures.append(f"invalid: {stats['invalid']} (expected 2)")
+    if stats["inserted"] != 3:
+        failures.append(f"inserted: {stats['inserted']} (expected 3)")
+    for name, when in expected.items():
+        print(f"{name:<8}{str(stored.get(name)):<22}expected {when}")
+        if stored.get(name) != when:
+            failures.append(f"{name}: stored {stored.get(name)}, expected {when}")
+
+    for f in failures:
+        print("FAIL", f)
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# scripts/check_startup_budget.py
+"""
+Startup budget check for app_int.py: exits non-zero if a cold start is over
+budget or if pages/DB layers are loaded before their route is opened.
+
+    python scripts/check_startup_budget.py [--budget-ms 1500]
+
+Runs in a fresh interpreter against temp databases. Streamlit's own import
+is measured separately and not counted against the budget.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+# Modules that only specific routes need
+LAZY = ("Interface.storage", "Interface.asr", "Interface.jobs", "Interface.knowledge",
+        "Interface.analytics", "Interface.calendar_data", "Interface.transcripts",
+        "Interface.actions")
+
+
+def _child(budget_ms: float) -> int:
+    t0 = time.perf_counter()
+    import streamlit  # noqa: F401
+    from streamlit.testing.v1 import AppTest
+    st_ms = (time.perf_counter() - t0) * 1000
+
+    app = os.path.join(PROJECT_ROOT, "app_int.py")
+    failures = []
+
+    def run(label, **state):
+        at = AppTest.from_file(app, default_timeout=60)
+        for k, v in state.items():
+            at.session_state[k] = v
+        t = time.perf_counter()
+        at.run()
+        ms = (time.perf_counter() - t) * 1000
+        loaded = [m for m in LAZY if m in sys.modules]
+        print(f"{label:<22}{ms:>8.0f} ms   lazy modules loaded: {', '.join(loaded) or 'none'}")
+        if at.exception:
+            failures.append(f"{label}: {at.exception[0].message}")
+        if ms > budget_ms:
+            failures.append(f"{label}: {ms:.0f} ms > budget {budget_ms:.0f} ms")
+        if loaded:
+            failures.append(f"{label}: loaded {loaded}")
+
+    print(f"{'import streamlit':<22}{st_ms:>8.0f} ms   (not counted)")
+    run("cold start (login)")
+    run("home page", user={"user_id": 1, "username": "budget", "is_admin": False})
+
+    t = time.perf_counter()
+    import Interface.storage as storage
+    import_ms = (time.perf_counter() - t) * 1000
+    t = time.perf_counter()
+    storage.list_meeting_rows(limit=1)
+    first_ms = (time.perf_counter() - t) * 1000
+    print(f"{'import storage':<22}{import_ms:>8.0f} ms")
+    print(f"{'first query (schema)':<22}{first_ms:>8.0f} ms")
+
+    for f in failures:
+        print("FAIL", f)
+    print("OK" if not failures else f"{len(failures)} failure(s)")
+    return 1 if failures else 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description="app_int.py startup budget")
+    ap.add_argument("--budget-ms", type=float, default=1500)
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        sys.exit(_child(args.budget_ms))
+
+    # fresh interpreter so nothing is imported or cached beforehand
+    tmp = tempfile.mkdtemp(prefix="meetsense_startup_")
+    env = dict(
+        os.environ,
+        MEETSENSE_DB=os.path.join(tmp, "meetings.db"),
+        MEETSENSE_USERS_DB=os.path.join(tmp, "users.db"),
+        PYTHONPATH=PROJECT_ROOT,
+    )
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", "--budget-ms", str(args.budget_ms)]
+    sys.exit(subprocess.call(cmd, env=env, cwd=PROJECT_ROOT))
+
+
+if __name__ == "__main__":
+    main()
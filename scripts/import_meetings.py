@@ -0,0 +1,100 @@
+# scripts/import_meetings.py
+"""
+Bulk-import historical meetings into data/meetings.db (or $MEETSENSE_DB).
+
+    python scripts/import_meetings.py <dir | manifest.jsonl> [--batch-size 2000]
+
+Directory: every *.txt / *.md becomes a meeting (name = file stem, transcript =
+file contents, occurred_at = file mtime); an audio file with the same stem is
+attached as audio_path, and audio without a transcript is imported on its own.
+A <stem>.json sidecar may override any Meeting field.
+
+Manifest: one JSON object per line with Meeting fields (name, occurred_at,
+tags, owner, department, status, transcript_text, audio_path, ...).
+"transcript_file" is read into transcript_text, relative to the manifest.
+
+Meetings whose content hash is already stored are skipped.
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from Interface.asr_cache import file_sha256  # noqa: E402
+from Interface.storage import DB_PATH, bulk_upsert_meetings  # noqa: E402
+
+TRANSCRIPT_EXT = {".txt", ".md"}
+AUDIO_EXT = {".wav", ".mp3", ".m4a", ".mp4", ".webm", ".ogg"}
+
+
+def iter_directory(root: Path):
+    groups = {}
+    for p in sorted(root.rglob("*")):
+        if p.is_file():
+            groups.setdefault(p.with_suffix(""), {})[p.suffix.lower()] = p
+
+    for stem, files in groups.items():
+        transcript = next((files[e] for e in TRANSCRIPT_EXT if e in files), None)
+        audio = next((files[e] for e in AUDIO_EXT if e in files), None)
+        if transcript is None and audio is None:
+            continue
+        src = transcript or audio
+        row = {
+            "name": stem.name,
+            "occurred_at": datetime.fromtimestamp(src.stat().st_mtime).isoformat(timespec="minutes"),
+            "status": "UNUSED",
+        }
+        if transcript is not None:
+            row["transcript_path"] = str(transcript)
+            row["transcript_text"] = transcript.read_text(encoding="utf-8", errors="replace")
+        if audio is not None:
+            row["audio_path"] = str(audio)
+            if transcript is None:
+                row["content_hash"] = file_sha256(str(audio))
+        if ".json" in files:
+            row.update(json.loads(files[".json"].read_text(encoding="utf-8")))
+        yield row
+
+
+def iter_manifest(path: Path):
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            row = json.loads(line)
+            tf = row.pop("transcript_file", None)
+            if tf:
+                tp = (path.parent / tf) if not os.path.isabs(tf) else Path(tf)
+                row.setdefault("transcript_path", str(tp))
+                row["transcript_text"] = tp.read_text(encoding="utf-8", errors="replace")
+            yield row
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bulk-import meetings")
+    ap.add_argument("source", help="directory of transcripts/audio, or a .jsonl manifest")
+    ap.add_argument("--batch-size", type=int, default=2000)
+    args = ap.parse_args()
+
+    src = Path(args.source)
+    rows = iter_directory(src) if src.is_dir() else iter_manifest(src)
+
+    def progress(st):
+        print(f"  … {st['read']:,} read, {st['inserted']:,} inserted, {st['duplicates']:,} duplicates")
+
+    stats = bulk_upsert_meetings(rows, batch_size=args.batch_size, on_batch=progress)
+    print(
+        f"✅ {stats['inserted']:,} meetings imported into {DB_PATH} "
+        f"({stats['duplicates']:,} duplicates, {stats['invalid']:,} invalid) "
+        f"in {stats['seconds']:.1f}s — {stats['rows_per_sec']:,.0f} rows/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
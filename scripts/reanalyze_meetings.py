@@ -0,0 +1,52 @@
+# scripts/reanalyze_meetings.py
+"""
+Re-run knowledge extraction over every meeting in data/meetings.db (or
+$MEETSENSE_DB) after the extractors change.
+
+    python scripts/reanalyze_meetings.py [--analyzer knowledge|abstractive]
+                                         [--workers N] [--chunk-size 200] [--restart]
+
+Meetings whose transcript and analyzer version are unchanged since their last
+analysis are skipped. Results are written one chunk per transaction; if the
+run is interrupted, running the command again continues after the last
+written chunk (--restart starts from the first meeting).
+
+"knowledge" uses Interface/knowledge.py (bump EXTRACTOR_VERSION there to
+force a re-run); "abstractive" also summarizes with the model from
+Transcription/process_transcript.py (needs transformers).
+"""
+import argparse
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from Interface.reanalysis import CHUNK_SIZE, reanalyze  # noqa: E402
+from Interface.storage import DB_PATH  # noqa: E402
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Batch re-analysis of stored meetings")
+    ap.add_argument("--analyzer", choices=["knowledge", "abstractive"], default="knowledge")
+    ap.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    ap.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    ap.add_argument("--restart", action="store_true", help="ignore an unfinished run and start over")
+    args = ap.parse_args()
+
+    def progress(st):
+        print(f"  … {st['read']:,} read, {st['analyzed']:,} analyzed, {st['skipped']:,} unchanged "
+              f"(up to #{st['last_id']}, {st['meetings_per_sec']:,.0f} meetings/s)")
+
+    stats = reanalyze(args.analyzer, workers=args.workers, chunk_size=args.chunk_size,
+                      restart=args.restart, on_batch=progress)
+    resumed = f", resumed after #{stats['resumed_from']}" if stats["resumed_from"] else ""
+    print(
+        f"✅ {stats['analyzed']:,} meetings re-analyzed in {DB_PATH} "
+        f"({stats['skipped']:,} unchanged{resumed}) "
+        f"in {stats['seconds']:.1f}s — {stats['meetings_per_sec']:,.0f} meetings/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+# scripts/rebuild_search_index.py
+"""Rebuild the FTS5 search index of data/meetings.db (or $MEETSENSE_DB) from the meetings table."""
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from Interface.storage import DB_PATH, rebuild_search_index  # noqa: E402
+
+
+def main():
+    t0 = time.perf_counter()
+    n = rebuild_search_index()
+    print(f"✅ Indexed {n} meetings in {DB_PATH} ({time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()